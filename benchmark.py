@@ -0,0 +1,218 @@
+import os
+import sys
+import json
+import time
+import statistics
+import tkinter as tk
+from tkinter import ttk
+from app_paths import user_cache_dir
+
+
+def summarize(values):
+    """Return (mean, stddev, min) of a list of numbers, or None if empty"""
+    if not values:
+        return None
+    stdev = statistics.stdev(values) if len(values) > 1 else 0.0
+    return [statistics.mean(values), stdev, min(values)]
+
+
+def peak_rss_bytes(rusage):
+    """ru_maxrss is in kilobytes on Linux but in bytes on macOS"""
+    return rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+
+
+class BenchmarkSession:
+    """Collects the measurements of one benchmark: warm-up runs, then timed runs
+
+    add_run() takes a finished ProcessRunner. Wall time comes from the
+    runner; CPU time (user + system) and peak RSS come from the child's
+    own rusage, so they are only available where os.wait4 exists.
+    """
+
+    def __init__(self, filepath, runs, warmup):
+        self.filepath = filepath
+        self.runs = runs
+        self.warmup = warmup
+        self.completed = 0  # Including warm-up runs
+        self.wall = []
+        self.cpu = []
+        self.rss = []
+        self.missing = 0  # Timed runs whose rusage could not be collected
+        self.failed = None  # Exit code of a failed run
+
+    @property
+    def total(self):
+        return self.runs + self.warmup
+
+    @property
+    def done(self):
+        return self.failed is not None or self.completed >= self.total
+
+    def add_run(self, runner):
+        self.completed += 1
+        if runner.returncode != 0:
+            self.failed = runner.returncode
+            return
+        if self.completed <= self.warmup:
+            return
+        self.wall.append(runner.elapsed)
+        if runner.rusage is not None:
+            self.cpu.append(runner.rusage.ru_utime + runner.rusage.ru_stime)
+            self.rss.append(peak_rss_bytes(runner.rusage))
+        elif hasattr(os, "wait4"):
+            self.missing += 1
+
+    def result(self):
+        """Summary in the layout stored by BenchmarkHistory"""
+        return {
+            "t": int(time.time()),
+            "n": len(self.wall),
+            "warmup": self.warmup,
+            "wall": summarize(self.wall),
+            "cpu": summarize(self.cpu),
+            "rss": max(self.rss) if self.rss else None,
+            "missing": self.missing,
+        }
+
+
+class BenchmarkHistory:
+    """Benchmark results per script, stored in the user cache directory
+
+    Layout: {absolute script path: [result, ...]}, oldest first, where a
+    result is {"t": timestamp, "n": timed runs, "warmup": warm-up runs,
+    "wall": [mean, stddev, min], "cpu": [mean, stddev, min] or null,
+    "rss": peak RSS in bytes or null, "missing": timed runs without CPU
+    and RSS figures}.
+    """
+
+    MAX_RESULTS = 50
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(user_cache_dir(), "benchmarks.json")
+        self.results = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.results = data
+        except (OSError, ValueError):
+            pass
+
+    def add(self, filepath, result):
+        entries = self.results.setdefault(os.path.abspath(filepath), [])
+        entries.append(result)
+        del entries[:-self.MAX_RESULTS]
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.results, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not save benchmark history: {e}")
+
+    def get(self, filepath):
+        return self.results.get(os.path.abspath(filepath), [])
+
+
+def format_seconds(value):
+    if value is None:
+        return "-"
+    return f"{value * 1000:.1f} ms" if value < 1 else f"{value:.3f} s"
+
+
+def format_rss(value):
+    return "-" if value is None else f"{value / (1024 * 1024):.1f} MiB"
+
+
+class BenchmarkDialog(tk.Toplevel):
+    """Asks for the number of timed and warm-up runs"""
+
+    def __init__(self, parent, filename, callback, runs=10, warmup=2):
+        super().__init__(parent)
+        self.callback = callback
+        self.title("Benchmark")
+        self.transient(parent)
+        self.resizable(False, False)
+
+        ttk.Label(self, text=f"Benchmark {filename}").grid(row=0, column=0, columnspan=2,
+                                                          sticky=tk.W, padx=10, pady=(10, 5))
+        self.runs_var = tk.IntVar(value=runs)
+        self.warmup_var = tk.IntVar(value=warmup)
+        ttk.Label(self, text="Timed runs:").grid(row=1, column=0, sticky=tk.W, padx=10)
+        ttk.Spinbox(self, from_=1, to=1000, textvariable=self.runs_var, width=8).grid(row=1, column=1, padx=10, pady=2)
+        ttk.Label(self, text="Warm-up runs:").grid(row=2, column=0, sticky=tk.W, padx=10)
+        ttk.Spinbox(self, from_=0, to=100, textvariable=self.warmup_var, width=8).grid(row=2, column=1, padx=10, pady=2)
+
+        buttons = ttk.Frame(self)
+        buttons.grid(row=3, column=0, columnspan=2, sticky=tk.E, padx=10, pady=10)
+        ttk.Button(buttons, text="Run", command=self.on_ok).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Cancel", command=self.destroy).pack(side=tk.LEFT)
+
+        self.bind("<Return>", lambda e: self.on_ok())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.grab_set()
+
+    def on_ok(self):
+        try:
+            runs = max(int(self.runs_var.get()), 1)
+            warmup = max(int(self.warmup_var.get()), 0)
+        except (tk.TclError, ValueError):
+            return
+        self.destroy()
+        self.callback(runs, warmup)
+
+
+class BenchmarkHistoryView(ttk.Frame):
+    """Table of a script's benchmark results, newest first
+
+    The change column compares each result's mean wall time with the
+    result before it.
+    """
+
+    def __init__(self, parent, filepath, results):
+        super().__init__(parent)
+        ttk.Label(self, text=f"Benchmark history of {filepath}", anchor=tk.W).pack(fill=tk.X, padx=5, pady=2)
+
+        columns = ("runs", "mean", "stddev", "min", "change", "cpu", "rss")
+        headings = ("runs", "wall mean", "stddev", "min", "vs previous", "CPU mean", "peak RSS")
+        frame = ttk.Frame(self)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(frame, columns=columns)
+        self.tree.heading("#0", text="date")
+        self.tree.column("#0", width=150, stretch=False)
+        for name, heading in zip(columns, headings):
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=90, anchor=tk.E)
+        scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.tag_configure("slower", foreground="#C00000")
+        self.tree.tag_configure("faster", foreground="#008000")
+        self.populate(results)
+
+    def populate(self, results):
+        previous = None
+        rows = []
+        for result in results:
+            mean = result["wall"][0] if result.get("wall") else None
+            change, tag = "", ()
+            if mean is not None and previous:
+                percent = (mean - previous) / previous * 100
+                change = f"{percent:+.1f}%"
+                # Ignore changes inside normal run-to-run noise
+                if abs(percent) >= 2:
+                    tag = ("slower",) if percent > 0 else ("faster",)
+            wall = result.get("wall") or [None, None, None]
+            cpu = result.get("cpu") or [None]
+            rows.append((time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(result["t"])), (
+                f"{result['n']} (+{result['warmup']})",
+                format_seconds(wall[0]), format_seconds(wall[1]), format_seconds(wall[2]),
+                change, format_seconds(cpu[0]), format_rss(result.get("rss"))
+            ), tag))
+            if mean is not None:
+                previous = mean
+
+        for date, values, tag in reversed(rows):
+            self.tree.insert("", tk.END, text=date, values=values, tags=tag)
@@ -0,0 +1,196 @@
+import sys
+import json
+import codeop
+import signal
+import tkinter as tk
+from tkinter import ttk
+from output_panel import OutputPanel
+from run_jobs import RunJob
+
+# Child side of the console: python -c CONSOLE_SCRIPT
+# Each line on stdin is one JSON-encoded block of source. Statements run in
+# a namespace that lives as long as the process; a final expression is
+# echoed like in the standard interactive interpreter.
+CONSOLE_SCRIPT = r"""
+import sys, ast, json, traceback
+
+namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+sys.argv = [""]
+
+def run(source):
+    tree = ast.parse(source, "<console>", "exec")
+    last = tree.body[-1:] if tree.body and isinstance(tree.body[-1], ast.Expr) else []
+    body = tree.body[:len(tree.body) - len(last)]
+    if body:
+        exec(compile(ast.Module(body, []), "<console>", "exec"), namespace)
+    if last:
+        exec(compile(ast.Interactive(last), "<console>", "single"), namespace)
+
+while True:
+    try:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        run(json.loads(line))
+    except SystemExit:
+        raise
+    except BaseException:
+        # Leave this script's own frames out of the traceback
+        etype, value, tb = sys.exc_info()
+        while tb is not None and tb.tb_frame.f_code.co_filename == "<string>":
+            tb = tb.tb_next
+        traceback.print_exception(etype, value, tb)
+"""
+
+# Interrupting running code needs a signal the child turns into KeyboardInterrupt
+INTERRUPT_SUPPORTED = sys.platform != "win32"
+
+
+def console_command(interpreter):
+    return [interpreter, "-c", CONSOLE_SCRIPT]
+
+
+def is_complete(source):
+    """Return True if source can run as it is, False if it needs more lines
+
+    Invalid code counts as complete, so the console reports the error.
+    """
+    try:
+        return codeop.compile_command(source, "<console>", "exec") is not None
+    except (SyntaxError, ValueError, OverflowError):
+        return True
+
+
+class ConsolePanel(ttk.Frame):
+    """Interactive Python console backed by one long-lived interpreter
+
+    The transcript is an OutputPanel fed by an interactive RunJob, so
+    output streams in from reader threads exactly like a normal run, and
+    the interpreter keeps its state between inputs until it is restarted.
+
+    Enter runs the input once it is a complete statement (Shift+Enter
+    always adds a line); Up and Down at the first or last line walk the
+    input history.
+    """
+
+    MAX_HISTORY = 500
+
+    def __init__(self, parent, command, cwd=None, max_lines=OutputPanel.DEFAULT_MAX_LINES,
+                 link_callback=None):
+        super().__init__(parent)
+        self.history = []
+        self.history_index = 0
+
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill=tk.X)
+        ttk.Button(toolbar, text="Restart", command=self.restart).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(toolbar, text="Interrupt", command=self.interrupt,
+                   state=tk.NORMAL if INTERRUPT_SUPPORTED else tk.DISABLED).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(toolbar, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=2, pady=2)
+
+        self.output = OutputPanel(self, height=6, wrap=tk.WORD, background="#FFFFFF", foreground="#000000",
+                                  max_lines=max_lines, link_callback=link_callback)
+        self.output.pack(fill=tk.BOTH, expand=True)
+        self.output.tag_configure("input", foreground="#0000C0")
+
+        entry_frame = ttk.Frame(self)
+        entry_frame.pack(fill=tk.X)
+        self.prompt = ttk.Label(entry_frame, text=">>>", font=("Consolas", 10))
+        self.prompt.pack(side=tk.LEFT, anchor=tk.N, padx=(2, 4))
+        self.input = tk.Text(entry_frame, height=2, wrap=tk.NONE, undo=True, font=("Consolas", 10))
+        self.input.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.input.bind("<Return>", self.on_return)
+        self.input.bind("<Shift-Return>", self.on_shift_return)
+        self.input.bind("<Up>", lambda e: self.browse_history(-1))
+        self.input.bind("<Down>", lambda e: self.browse_history(1))
+        self.input.bind("<KeyRelease>", self.update_prompt, add=True)
+
+        self.job = RunJob(self.output, "Python console", command, cwd=cwd, interactive=True)
+
+    def start(self):
+        self.job.start()
+
+    def restart(self, command=None):
+        """Start a fresh interpreter, dropping all state"""
+        if command is not None:
+            self.job.command = command
+        self.job.restart()
+
+    def interrupt(self):
+        """Raise KeyboardInterrupt in the code the console is running"""
+        if INTERRUPT_SUPPORTED and self.job.running:
+            try:
+                self.job.runner.send_signal(signal.SIGINT)
+            except OSError:
+                pass
+
+    def clear(self):
+        self.output.clear()
+
+    def close(self):
+        self.job.close()
+
+    def send(self, source):
+        """Run source in the console, echoing it like typed input"""
+        source = source.rstrip()
+        if not source.strip():
+            return
+        if not self.job.running:
+            # Keep the transcript: it shows why the interpreter died
+            self.job.start(clear=False)
+        lines = source.split("\n")
+        echo = ">>> " + lines[0] + "\n" + "".join(f"... {line}\n" for line in lines[1:])
+        self.output.write(echo, "input")
+        self.output.see(tk.END)
+        self.job.send(json.dumps(source) + "\n")
+
+        if not self.history or self.history[-1] != source:
+            self.history.append(source)
+            del self.history[:-self.MAX_HISTORY]
+        self.history_index = len(self.history)
+
+    def on_return(self, event):
+        source = self.input.get("1.0", "end-1c")
+        if not self.ready(source):
+            return self.on_shift_return(event)
+        self.input.delete("1.0", tk.END)
+        self.update_prompt()
+        self.send(source)
+        return "break"
+
+    def ready(self, source):
+        """Single lines run when complete; blocks run after a blank line"""
+        if not source.strip():
+            return False
+        if "\n" not in source:
+            return is_complete(source)
+        return source.split("\n")[-1].strip() == "" and is_complete(source)
+
+    def on_shift_return(self, event):
+        """Add a line, keeping the indentation and indenting after a colon"""
+        line = self.input.get("insert linestart", "insert")
+        indent = line[:len(line) - len(line.lstrip())]
+        if line.rstrip().endswith(":"):
+            indent += "    "
+        self.input.insert(tk.INSERT, "\n" + indent)
+        self.input.see(tk.INSERT)
+        self.update_prompt()
+        return "break"
+
+    def browse_history(self, step):
+        """Recall earlier inputs when the cursor is on the first or last line"""
+        line = self.input.index(tk.INSERT).split(".")[0]
+        edge = "1" if step < 0 else self.input.index("end-1c").split(".")[0]
+        if line != edge or not self.history:
+            return None
+        self.history_index = max(0, min(len(self.history), self.history_index + step))
+        text = self.history[self.history_index] if self.history_index < len(self.history) else ""
+        self.input.delete("1.0", tk.END)
+        self.input.insert("1.0", text)
+        self.update_prompt()
+        return "break"
+
+    def update_prompt(self, event=None):
+        lines = int(self.input.index("end-1c").split(".")[0])
+        self.prompt.config(text=">>>" if lines == 1 else "...")
+        self.input.config(height=min(max(lines, 2), 10))
@@ -0,0 +1,282 @@
+import os
+import mmap
+import tkinter as tk
+from tkinter import ttk, font
+
+# How open_specific_file should show a file
+TEXT = "text"
+BINARY = "binary"
+LARGE_TEXT = "large"
+
+# Text files bigger than this open in the read-only streaming viewer
+LARGE_TEXT_BYTES = 2 * 1024 * 1024
+SNIFF_BYTES = 8192
+
+BINARY_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".tif", ".tiff", ".webp",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".tar", ".whl", ".egg",
+    ".pdf", ".exe", ".dll", ".so", ".dylib", ".pyd", ".pyc", ".pyo", ".o", ".a",
+    ".class", ".jar", ".db", ".sqlite", ".mp3", ".mp4", ".wav", ".avi", ".mov",
+    ".ttf", ".otf", ".woff", ".woff2", ".bin", ".dat",
+}
+
+# Printable ASCII shown as-is in the hex viewer, everything else as "."
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+
+def sniff_file(filepath):
+    """Decide how to open a file without reading all of it
+
+    Looks at the extension, the size and the first few kilobytes: a NUL
+    byte or a high share of control characters means binary.
+    """
+    if os.path.splitext(filepath)[1].lower() in BINARY_EXTENSIONS:
+        return BINARY
+
+    size = os.path.getsize(filepath)
+    with open(filepath, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+
+    if b"\0" in head:
+        return BINARY
+    if head:
+        control = sum(1 for b in head if b < 32 and b not in (9, 10, 12, 13, 27))
+        if control / len(head) > 0.1:
+            return BINARY
+    if size > LARGE_TEXT_BYTES:
+        return LARGE_TEXT
+    return TEXT
+
+
+class PagedFileViewer(ttk.Frame):
+    """Read-only, memory-mapped view that only renders the visible page
+
+    Tk never holds more than a screenful of the file, so memory use stays
+    flat however big the file is. By default a row is BYTES_PER_ROW bytes
+    shown as ASCII; subclasses change how rows are formatted or where they
+    start.
+
+    Touching a mapped page past the end of a file that was truncated on
+    disk raises SIGBUS, so the file is kept open and its size checked with
+    os.fstat before each render or scroll (see check_size).
+    """
+
+    read_only = True
+    BYTES_PER_ROW = 16
+
+    def __init__(self, parent, filepath):
+        super().__init__(parent)
+        self.parent = parent
+        self.filepath = filepath
+        self.modified = False
+        self.offset = 0
+        self.end_offset = 0
+        self.file = None
+        self.mm = None
+        self.size = 0
+
+        viewer_font = font.Font(family="Consolas", size=10)
+        self.line_height = max(viewer_font.metrics("linespace"), 1)
+
+        self.text = tk.Text(self, wrap=tk.NONE, background="#FFFFFF", foreground="#000000",
+                            font=viewer_font, cursor="arrow", state=tk.DISABLED)
+        self.v_scroll = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scrollbar)
+        h_scroll = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.text.xview)
+        self.text.configure(xscrollcommand=h_scroll.set)
+
+        self.info_label = ttk.Label(self, text="", anchor=tk.W)
+
+        self.info_label.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=2)
+        self.text.grid(row=1, column=0, sticky="nsew")
+        self.v_scroll.grid(row=1, column=1, sticky="ns")
+        h_scroll.grid(row=2, column=0, sticky="ew")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.text.bind("<Configure>", lambda e: self.render())
+        self.text.bind("<MouseWheel>", self.on_mousewheel)
+        self.text.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.text.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.text.bind("<Prior>", lambda e: self.scroll_rows(-self.visible_rows()))
+        self.text.bind("<Next>", lambda e: self.scroll_rows(self.visible_rows()))
+        self.text.bind("<Up>", lambda e: self.scroll_rows(-1))
+        self.text.bind("<Down>", lambda e: self.scroll_rows(1))
+        # Disabled Text still allows selecting and copying, but only takes
+        # focus on click on Windows
+        self.text.bind("<Button-1>", lambda e: self.text.focus_set(), add="+")
+        self.text.bind("<Control-a>", self.select_all)
+        self.bind("<Destroy>", self.on_destroy)
+
+        self.reload()
+
+    def reload(self):
+        """(Re)open and map the file, e.g. after it changed on disk"""
+        self.close()
+        self.file = open(self.filepath, "rb")
+        self.map_file()
+        self.info_label.config(text=self.describe())
+        self.render()
+
+    def map_file(self):
+        """Map the open file at its current size"""
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        self.size = os.fstat(self.file.fileno()).st_size
+        if self.size:
+            try:
+                self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                pass  # Emptied since the fstat
+            self.size = len(self.mm) if self.mm is not None else 0
+        self.offset = self.clamp_offset(self.offset)
+
+    def check_size(self):
+        """Remap if the file was truncated or extended in place since it was mapped"""
+        if self.file is not None and os.fstat(self.file.fileno()).st_size != self.size:
+            self.map_file()
+            self.info_label.config(text=self.describe())
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def on_destroy(self, event):
+        if event.widget is self:
+            self.close()
+
+    def describe(self):
+        return f"{self.filepath} ({self.size:,} bytes, read-only)"
+
+    def visible_rows(self):
+        height = self.text.winfo_height()
+        return max(height // self.line_height, 1) if height > 1 else 40
+
+    def on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def on_scrollbar(self, *args):
+        self.check_size()
+        if args[0] == "moveto":
+            self.offset = self.clamp_offset(self.offset_for_fraction(float(args[1])))
+            self.render()
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_rows()
+            self.scroll_rows(amount)
+
+    def scroll_rows(self, rows):
+        self.check_size()
+        self.offset = self.clamp_offset(self.move_rows(self.offset, rows))
+        self.render()
+        return "break"
+
+    def select_all(self, event=None):
+        """Select the rendered page, which is all the widget holds"""
+        self.text.tag_add(tk.SEL, "1.0", tk.END)
+        return "break"
+
+    def render(self):
+        self.check_size()
+        rows = self.page_text(self.visible_rows()) if self.mm is not None else ""
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", rows)
+        self.text.config(state=tk.DISABLED)
+        if self.size:
+            first = self.offset / self.size
+            last = min(self.end_offset / self.size, 1.0)
+            self.v_scroll.set(first, last)
+        else:
+            self.v_scroll.set(0, 1)
+
+    # Row layout; subclasses override these
+    def clamp_offset(self, offset):
+        last_row = max((self.size - 1) // self.BYTES_PER_ROW, 0) * self.BYTES_PER_ROW
+        return max(0, min(offset - offset % self.BYTES_PER_ROW, last_row))
+
+    def offset_for_fraction(self, fraction):
+        return int(fraction * self.size)
+
+    def move_rows(self, offset, rows):
+        return offset + rows * self.BYTES_PER_ROW
+
+    def format_row(self, offset, chunk):
+        return chunk.translate(_ASCII_TABLE).decode("ascii")
+
+    def page_text(self, rows):
+        lines = []
+        offset = self.offset
+        end = min(offset + rows * self.BYTES_PER_ROW, self.size)
+        while offset < end:
+            lines.append(self.format_row(offset, self.mm[offset:offset + self.BYTES_PER_ROW]))
+            offset += self.BYTES_PER_ROW
+        self.end_offset = end
+        return "\n".join(lines)
+
+
+class HexViewer(PagedFileViewer):
+    """Hex dump of a binary file, 16 bytes per row"""
+
+    def describe(self):
+        return f"{self.filepath} ({self.size:,} bytes, binary - hex view)"
+
+    def format_row(self, offset, chunk):
+        hex_part = chunk.hex(" ").upper().ljust(self.BYTES_PER_ROW * 3 - 1)
+        return f"{offset:08X}  {hex_part}  {chunk.translate(_ASCII_TABLE).decode('ascii')}"
+
+
+class StreamingTextViewer(PagedFileViewer):
+    """Read-only pager for text files too large for the editor
+
+    Positions are byte offsets aligned to line starts, so jumping anywhere
+    in the file is a single rfind() on the memory map.
+    """
+
+    MAX_LINE_BYTES = 4096
+
+    def describe(self):
+        return f"{self.filepath} ({self.size:,} bytes, too large to edit - read-only view)"
+
+    def clamp_offset(self, offset):
+        # Never past the start of the last line
+        offset = max(0, min(offset, self.size - 1))
+        if offset == 0 or self.mm is None:
+            return 0
+        return self.mm.rfind(b"\n", 0, offset) + 1
+
+    def move_rows(self, offset, rows):
+        if self.mm is None:
+            return 0
+        if rows > 0:
+            for _ in range(rows):
+                found = self.mm.find(b"\n", offset)
+                if found < 0 or found + 1 >= self.size:
+                    break
+                offset = found + 1
+        else:
+            for _ in range(-rows):
+                if offset <= 0:
+                    break
+                offset = self.mm.rfind(b"\n", 0, offset - 1) + 1
+        return offset
+
+    def page_text(self, rows):
+        lines = []
+        offset = self.offset
+        for _ in range(rows):
+            if offset >= self.size:
+                break
+            found = self.mm.find(b"\n", offset)
+            end = self.size if found < 0 else found
+            line = self.mm[offset:min(end, offset + self.MAX_LINE_BYTES)]
+            lines.append(line.decode("utf-8", errors="replace").rstrip("\r"))
+            offset = end + 1
+        self.end_offset = min(offset, self.size)
+        return "\n".join(lines)
@@ -0,0 +1,369 @@
+import os
+import sys
+import time
+import errno
+import queue
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+
+# Event kinds delivered by FileWatcher.get_events()
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+RESCAN = "rescan"
+
+# inotify constants (from <sys/inotify.h>)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+MAX_USER_WATCHES_PATH = "/proc/sys/fs/inotify/max_user_watches"
+
+
+def inotify_watch_limit():
+    """Return the per-user inotify watch limit (the kernel default if unreadable)"""
+    try:
+        with open(MAX_USER_WATCHES_PATH) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 8192
+
+
+class InotifyBackend:
+    """Directory watches through the Linux inotify API (via ctypes)"""
+
+    def __init__(self, libc):
+        self.libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.wd_to_dir = {}
+        self.dir_to_wd = {}
+        self.last_error = 0  # errno of the last failed add()
+
+    @classmethod
+    def create(cls):
+        """Return a backend instance, or None if inotify is not usable"""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            return cls(libc)
+        except (OSError, AttributeError) as e:
+            print(f"inotify not available, using polling: {e}")
+            return None
+
+    def add(self, directory):
+        if directory in self.dir_to_wd:
+            return True
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            # Most likely the directory vanished or the watch limit was hit
+            self.last_error = ctypes.get_errno()
+            return False
+        self.wd_to_dir[wd] = directory
+        self.dir_to_wd[directory] = wd
+        return True
+
+    def remove(self, directory):
+        wd = self.dir_to_wd.pop(directory, None)
+        if wd is not None:
+            self.wd_to_dir.pop(wd, None)
+            self.libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self, timeout):
+        """Wait up to timeout seconds and return a list of (kind, path)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.extend((RESCAN, d) for d in list(self.dir_to_wd))
+                continue
+
+            directory = self.wd_to_dir.get(wd)
+            if directory is None:
+                continue
+
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                events.append((DELETED, directory))
+                self.dir_to_wd.pop(directory, None)
+                self.wd_to_dir.pop(wd, None)
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                events.append((CREATED, path))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                events.append((DELETED, path))
+            elif mask & (IN_CLOSE_WRITE | IN_ATTRIB):
+                events.append((MODIFIED, path))
+
+        return events
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class PollingBackend:
+    """Portable fallback that compares os.scandir snapshots of each directory
+
+    One scandir call covers every watched file in a directory, so the cost
+    grows with the number of directories rather than the number of files.
+    """
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.snapshots = {}
+
+    @staticmethod
+    def snapshot(directory):
+        entries = {}
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries[entry.name] = (st.st_mtime_ns, st.st_size, entry.is_dir(follow_symlinks=False))
+        return entries
+
+    def add(self, directory):
+        if directory in self.snapshots:
+            return True
+        try:
+            self.snapshots[directory] = self.snapshot(directory)
+        except OSError:
+            return False
+        return True
+
+    def remove(self, directory):
+        self.snapshots.pop(directory, None)
+
+    def read_events(self, timeout, stop_event=None):
+        """Sleep for the poll interval and return changes since the last scan"""
+        if stop_event is not None:
+            if stop_event.wait(max(timeout, self.interval)):
+                return []
+
+        events = []
+        for directory, old in list(self.snapshots.items()):
+            try:
+                new = self.snapshot(directory)
+            except OSError:
+                events.append((DELETED, directory))
+                self.snapshots.pop(directory, None)
+                continue
+
+            for name, sig in new.items():
+                previous = old.get(name)
+                if previous is None:
+                    events.append((CREATED, os.path.join(directory, name)))
+                elif previous != sig and not sig[2]:
+                    events.append((MODIFIED, os.path.join(directory, name)))
+            for name in old.keys() - new.keys():
+                events.append((DELETED, os.path.join(directory, name)))
+
+            # Only store if the directory is still watched
+            if directory in self.snapshots:
+                self.snapshots[directory] = new
+        return events
+
+    def close(self):
+        self.snapshots.clear()
+
+
+class FileWatcher:
+    """Watch open files and project directories for external changes
+
+    Files are watched through their parent directory so that editors and
+    code generators that replace files atomically are still noticed. All
+    events are collected on a background thread; call get_events() from
+    the Tk event loop to receive them on the main thread.
+
+    A directory that inotify cannot watch, usually because the user is out
+    of watches (fs.inotify.max_user_watches), is polled instead, unless
+    poll_fallback is False.
+    """
+
+    def __init__(self, poll_interval=1.0, force_polling=False, poll_fallback=True):
+        self.backend = None if force_polling else InotifyBackend.create()
+        if self.backend is None:
+            self.backend = PollingBackend(poll_interval)
+        self.poll_interval = poll_interval
+        self.poll_fallback = poll_fallback
+        self.fallback = None  # PollingBackend for directories inotify refused
+        self._reported_errors = set()
+
+        self.watched_files = set()
+        self.watched_dirs = set()
+        self._events = queue.Queue()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def uses_inotify(self):
+        return isinstance(self.backend, InotifyBackend)
+
+    def start(self):
+        """Start the background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and release the backend"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self.backend.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+    def _needed_dirs(self):
+        return self.watched_dirs | {os.path.dirname(p) for p in self.watched_files}
+
+    def _sync_backend(self, old_dirs):
+        new_dirs = self._needed_dirs()
+        for directory in old_dirs - new_dirs:
+            self.backend.remove(directory)
+            if self.fallback is not None:
+                self.fallback.remove(directory)
+        for directory in new_dirs - old_dirs:
+            if self.backend.add(directory) or not self.uses_inotify:
+                continue
+            error = self.backend.last_error
+            if error == errno.ENOENT:
+                continue  # Vanished; nothing to watch
+            if error not in self._reported_errors:
+                # Logged once per cause, not for each of possibly thousands of folders
+                self._reported_errors.add(error)
+                hint = " (raise fs.inotify.max_user_watches)" if error == errno.ENOSPC else ""
+                action = "polling it instead" if self.poll_fallback else "not watching it"
+                print(f"Cannot watch {directory} with inotify: {os.strerror(error)}{hint}; {action}")
+            if self.poll_fallback:
+                if self.fallback is None:
+                    self.fallback = PollingBackend(self.poll_interval)
+                self.fallback.add(directory)
+
+    def watch_file(self, path):
+        """Report changes to a single file"""
+        path = os.path.abspath(path)
+        with self._lock:
+            old_dirs = self._needed_dirs()
+            self.watched_files.add(path)
+            self._sync_backend(old_dirs)
+
+    def unwatch_file(self, path):
+        path = os.path.abspath(path)
+        with self._lock:
+            old_dirs = self._needed_dirs()
+            self.watched_files.discard(path)
+            self._sync_backend(old_dirs)
+
+    def watch_directory(self, directory):
+        """Report entries created, changed or deleted directly in a directory"""
+        directory = os.path.abspath(directory)
+        with self._lock:
+            old_dirs = self._needed_dirs()
+            self.watched_dirs.add(directory)
+            self._sync_backend(old_dirs)
+
+    def unwatch_directory(self, directory):
+        directory = os.path.abspath(directory)
+        with self._lock:
+            old_dirs = self._needed_dirs()
+            self.watched_dirs.discard(directory)
+            self._sync_backend(old_dirs)
+
+    def set_directories(self, directories):
+        """Watch exactly these directories, replacing any watched before
+
+        One backend update for the whole set, so a caller can watch every
+        folder of a large tree without a set difference per folder.
+        """
+        directories = {os.path.abspath(d) for d in directories}
+        with self._lock:
+            old_dirs = self._needed_dirs()
+            self.watched_dirs = directories
+            self._sync_backend(old_dirs)
+
+    def _is_interesting(self, path):
+        return (path in self.watched_files or path in self.watched_dirs
+                or os.path.dirname(path) in self.watched_dirs)
+
+    def _run(self):
+        last_poll = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                if isinstance(self.backend, PollingBackend):
+                    events = self.backend.read_events(self.poll_interval, self._stop)
+                else:
+                    events = self.backend.read_events(0.5)
+                    if self.fallback is not None and time.monotonic() - last_poll >= self.poll_interval:
+                        last_poll = time.monotonic()
+                        events += self.fallback.read_events(0)
+            except Exception as e:
+                print(f"File watcher error: {e}")
+                self._stop.wait(self.poll_interval)
+                continue
+
+            if not events:
+                continue
+            with self._lock:
+                for kind, path in events:
+                    if kind == RESCAN or self._is_interesting(path):
+                        self._events.put((kind, path))
+
+    def get_events(self):
+        """Drain pending events, coalesced to the last kind seen per path"""
+        latest = {}
+        while True:
+            try:
+                kind, path = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if latest.get(path) == CREATED and kind == MODIFIED:
+                # Created-then-written is still a creation
+                continue
+            latest[path] = kind
+        return [(kind, path) for path, kind in latest.items()]
@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import queue
+import shutil
+import subprocess
+import threading
+import tkinter as tk
+from tkinter import ttk, filedialog
+from app_paths import user_cache_dir
+
+# Printed as one JSON line by the interpreter being probed
+PROBE_SCRIPT = (
+    "import sys, json\n"
+    "try:\n"
+    "    import tkinter\n"
+    "    tk_ok = True\n"
+    "except Exception:\n"
+    "    tk_ok = False\n"
+    "print(json.dumps({'version': '%d.%d.%d' % sys.version_info[:3], 'tkinter': tk_ok,"
+    " 'prefix': sys.prefix, 'path': sys.path}))\n"
+)
+
+# Virtual environment folders looked for in the project directory
+VENV_NAMES = (".venv", "venv", "env", ".env")
+
+
+def venv_python(venv_dir):
+    """Return the interpreter inside a virtual environment folder, or None"""
+    if sys.platform == "win32":
+        candidate = os.path.join(venv_dir, "Scripts", "python.exe")
+    else:
+        candidate = os.path.join(venv_dir, "bin", "python")
+    return candidate if os.path.isfile(candidate) else None
+
+
+class InterpreterRegistry:
+    """Finds Python interpreters and caches what they provide
+
+    Probing an interpreter means starting it, which takes tens to hundreds
+    of milliseconds, so results (version, tkinter availability, sys.path)
+    are cached in the user cache directory. A cached entry stays valid
+    while the executable's size and modification time are unchanged, so
+    upgrading or recreating an environment is picked up automatically.
+    """
+
+    PROBE_TIMEOUT = 15
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path or os.path.join(user_cache_dir(), "interpreters.json")
+        self.cache = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.cache = data
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        # Probe threads save concurrently; one writer at a time keeps them
+        # off each other's temporary file, and the last writer has the
+        # latest cache
+        with self._save_lock:
+            with self._lock:
+                data = dict(self.cache)
+            tmp_path = self.cache_path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                print(f"Could not save interpreter cache: {e}")
+
+    def candidates(self, project_dir=None, custom=()):
+        """Return interpreter paths worth offering, without probing them"""
+        found = [sys.executable]
+
+        active_venv = os.environ.get("VIRTUAL_ENV")
+        if active_venv:
+            found.append(venv_python(active_venv))
+        if project_dir:
+            for name in VENV_NAMES:
+                found.append(venv_python(os.path.join(project_dir, name)))
+        for name in ("python3", "python"):
+            found.append(shutil.which(name))
+        found.extend(custom)
+
+        # Drop missing entries and duplicates (e.g. a symlinked python3)
+        result = []
+        seen = set()
+        for path in found:
+            if not path or not os.path.isfile(path):
+                continue
+            real = os.path.realpath(path)
+            if real in seen:
+                continue
+            seen.add(real)
+            result.append(os.path.abspath(path))
+        return result
+
+    def _stamp(self, path):
+        st = os.stat(os.path.realpath(path))
+        return [st.st_size, st.st_mtime_ns]
+
+    def get_info(self, path):
+        """Return cached probe results for path, or None if not cached or stale"""
+        with self._lock:
+            entry = self.cache.get(path)
+        if entry is None:
+            return None
+        try:
+            if entry.get("stamp") != self._stamp(path):
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def probe(self, path):
+        """Return probe results for path, starting it only if not cached
+
+        Returns a dict with version, tkinter, prefix and path keys, or a
+        dict with an error key if the interpreter could not be run.
+        """
+        info = self.get_info(path)
+        if info is not None:
+            return info
+
+        try:
+            stamp = self._stamp(path)
+            output = subprocess.run(
+                [path, "-c", PROBE_SCRIPT],
+                stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                timeout=self.PROBE_TIMEOUT
+            )
+            lines = output.stdout.strip().splitlines()
+            info = json.loads(lines[-1]) if lines else None
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            return {"error": str(e)}
+        if not isinstance(info, dict):
+            return {"error": "not a Python interpreter"}
+
+        info["stamp"] = stamp
+        with self._lock:
+            self.cache[path] = info
+        self.save()
+        return info
+
+    def describe(self, path):
+        """One-line label for an interpreter, using only cached information"""
+        info = self.get_info(path)
+        if info is None:
+            return path
+        tk_note = "" if info.get("tkinter") else ", no tkinter"
+        return f"Python {info.get('version', '?')}{tk_note} - {path}"
+
+
+class InterpreterDialog(tk.Toplevel):
+    """Build > Select Interpreter dialog
+
+    Lists the known interpreters straight away and fills in version and
+    tkinter details as background probes finish.
+    """
+
+    def __init__(self, parent, registry, candidates, current, callback):
+        super().__init__(parent)
+        self.registry = registry
+        self.callback = callback
+        self.paths = []
+        self._results = queue.Queue()
+
+        self.title("Select Interpreter")
+        self.transient(parent)
+        self.geometry("700x320")
+
+        self.listbox = tk.Listbox(self, activestyle="none", selectmode=tk.SINGLE)
+        self.listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.listbox.bind("<Double-1>", lambda e: self.on_ok())
+
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        ttk.Button(button_frame, text="Add...", command=self.on_add).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="OK", command=self.on_ok).pack(side=tk.RIGHT, padx=5)
+
+        for path in candidates:
+            self.add_path(path)
+        if current in self.paths:
+            self.listbox.selection_set(self.paths.index(current))
+
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.grab_set()
+        self._poll_job = self.after(100, self.poll_results)
+
+    def destroy(self):
+        self.after_cancel(self._poll_job)
+        super().destroy()
+
+    def add_path(self, path):
+        if path in self.paths:
+            return
+        self.paths.append(path)
+        info = self.registry.get_info(path)
+        if info is not None:
+            self.listbox.insert(tk.END, self.registry.describe(path))
+        else:
+            self.listbox.insert(tk.END, f"{path}    (checking...)")
+            threading.Thread(target=lambda: self._results.put((path, self.registry.probe(path))),
+                             daemon=True).start()
+
+    def poll_results(self):
+        try:
+            while True:
+                path, info = self._results.get_nowait()
+                index = self.paths.index(path)
+                if "error" in info:
+                    label = f"{path}    (unusable: {info['error']})"
+                else:
+                    label = self.registry.describe(path)
+                selected = self.listbox.curselection()
+                self.listbox.delete(index)
+                self.listbox.insert(index, label)
+                if selected and selected[0] == index:
+                    self.listbox.selection_set(index)
+        except queue.Empty:
+            pass
+        self._poll_job = self.after(100, self.poll_results)
+
+    def on_add(self):
+        path = filedialog.askopenfilename(title="Select Python Interpreter", parent=self)
+        if path:
+            self.add_path(os.path.abspath(path))
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(len(self.paths) - 1)
+
+    def on_ok(self):
+        selected = self.listbox.curselection()
+        if selected:
+            path = self.paths[selected[0]]
+            self.destroy()
+            self.callback(path)
@@ -0,0 +1,135 @@
+import json
+
+# Child side of the live preview: python -c PREVIEW_SCRIPT
+# Reads one JSON patch per line from stdin on a thread and applies it to the
+# running form from the Tk event loop:
+#   {"op": "create", "id": 1, "class": "tk.Button", "place": [x, y, w, h], "props": {...}}
+#   {"op": "place", "id": 1, "place": [x, y, w, h]}
+#   {"op": "config", "id": 1, "props": {...}}
+#   {"op": "delete", "id": 1}
+#   {"op": "raise"}
+# The window closes when stdin does.
+PREVIEW_SCRIPT = r"""
+import sys, json, queue, threading
+import tkinter as tk
+from tkinter import ttk
+
+root = tk.Tk()
+root.title("Live Preview")
+root.geometry("800x600")
+root.configure(background="#F0F0F0")
+widgets = {}
+patches = queue.Queue()
+
+def read_patches():
+    for line in sys.stdin:
+        patches.put(json.loads(line))
+    patches.put(None)
+
+def configure(widget, props):
+    # One option at a time, so a property the widget does not have is
+    # reported without losing the rest
+    for name, value in props.items():
+        try:
+            widget.configure(**{name: value})
+        except tk.TclError as e:
+            print("%s: %s" % (name, e), file=sys.stderr)
+
+def apply(patch):
+    op = patch["op"]
+    if op == "raise":
+        root.deiconify()
+        root.lift()
+        return
+    widget = widgets.get(patch["id"])
+    if op == "create":
+        module, name = patch["class"].split(".")
+        try:
+            widget = getattr(tk if module == "tk" else ttk, name)(root)
+            widget.place(x=patch["place"][0], y=patch["place"][1],
+                         width=patch["place"][2], height=patch["place"][3])
+        except (AttributeError, tk.TclError) as e:
+            print("Cannot preview %s: %s" % (patch["class"], e), file=sys.stderr)
+            return
+        widgets[patch["id"]] = widget
+        configure(widget, patch["props"])
+    elif widget is None:
+        return
+    elif op == "place":
+        x, y, width, height = patch["place"]
+        widget.place_configure(x=x, y=y, width=width, height=height)
+    elif op == "config":
+        configure(widget, patch["props"])
+    elif op == "delete":
+        widgets.pop(patch["id"]).destroy()
+
+def poll():
+    while True:
+        try:
+            patch = patches.get_nowait()
+        except queue.Empty:
+            break
+        if patch is None:
+            root.destroy()
+            return
+        apply(patch)
+    root.after(10, poll)
+
+threading.Thread(target=read_patches, daemon=True).start()
+poll()
+root.mainloop()
+"""
+
+
+class LivePreview:
+    """Keeps a running preview of the designer form in step with the design
+
+    The preview runs as an interactive RunJob, so its errors show in its
+    Output tab. sync() compares the design with what the preview was last
+    sent and writes only the differences as patches: a drag sends one
+    "place" patch per motion event, and a property edit sends just the
+    properties that changed.
+
+    A design is {widget id: (class, [x, y, width, height], {property: value})}.
+    """
+
+    def __init__(self, job):
+        self.job = job
+        self.runner = None
+        self.sent = {}
+
+    @property
+    def running(self):
+        return self.job.running
+
+    def sync(self, design):
+        if not self.job.running:
+            return
+        if self.job.runner is not self.runner:
+            # A new (or restarted) preview process starts empty
+            self.runner = self.job.runner
+            self.sent = {}
+
+        patches = []
+        for widget_id in list(self.sent):
+            if widget_id not in design or design[widget_id][0] != self.sent[widget_id][0]:
+                patches.append({"op": "delete", "id": widget_id})
+                del self.sent[widget_id]
+
+        for widget_id, (cls, place, props) in design.items():
+            previous = self.sent.get(widget_id)
+            if previous is None:
+                patches.append({"op": "create", "id": widget_id, "class": cls, "place": place, "props": props})
+            else:
+                if place != previous[1]:
+                    patches.append({"op": "place", "id": widget_id, "place": place})
+                changed = {name: value for name, value in props.items() if previous[2].get(name) != value}
+                if changed:
+                    patches.append({"op": "config", "id": widget_id, "props": changed})
+            self.sent[widget_id] = (cls, list(place), dict(props))
+
+        if patches:
+            self.job.send("".join(json.dumps(patch) + "\n" for patch in patches))
+
+    def show(self):
+        self.job.send(json.dumps({"op": "raise"}) + "\n")
@@ -4,15 +4,41 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, font
 from tkinter.scrolledtext import ScrolledText
 import re
-import subprocess
+import shlex
+import shutil
 import tempfile
+import textwrap
+import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import ctypes
 import json
+import difflib
 from functools import partial
 from typing import List, Dict, Any, Optional, Tuple
 from property_editor import PropertyEditorFactory
 from simple_icons import get_icon, get_fallback_icon
+from file_watcher import FileWatcher, CREATED, MODIFIED, DELETED, RESCAN
+from project_explorer import ProjectTree
+from quick_open import FileIndex, QuickOpenDialog
+from session import SessionStore
+from recovery_journal import RecoveryJournal
+from recent_items import RecentItemsStore
+from file_viewers import sniff_file, HexViewer, StreamingTextViewer, TEXT, BINARY
+from output_panel import OutputPanel
+from run_jobs import RunJob
+from interpreters import InterpreterRegistry, InterpreterDialog
+from warm_pool import WarmWorkerPool, worker_command
+from profiler_view import ProfileView
+from memory_profiler import MemoryView, MEMORY_SCRIPT, ON_DEMAND_SUPPORTED
+from benchmark import (BenchmarkSession, BenchmarkHistory, BenchmarkDialog, BenchmarkHistoryView,
+                       format_seconds, format_rss)
+from run_configs import RunConfigStore, RunConfigDialog
+from console import ConsolePanel, console_command
+from live_preview import LivePreview, PREVIEW_SCRIPT
+from unittest_explorer import TestExplorerView, RUNNER_SCRIPT
+from resource_monitor import Sparkline, MONITOR_AVAILABLE
+from app_paths import user_cache_dir
 
 # Try to import welcome screen, fall back if not available
 try:
@@ -23,6 +49,47 @@ except ImportError as e:
     WELCOME_AVAILABLE = False
     WelcomeScreen = None
 
+
+# Map Tkinter equivalents for Windows Forms controls
+WINFORMS_MAPPING = {
+    "Button": "Button",
+    "Label": "Label",
+    "LinkLabel": "Label",
+    "Entry": "Entry",
+    "TextBox": "Text",
+    "Checkbutton": "Checkbutton",
+    "Radiobutton": "Radiobutton",
+    "GroupBox": "LabelFrame",
+    "PictureBox": "Label",
+    "Frame": "Frame",
+    "Panel": "Frame",
+    "TabControl": "ttk.Notebook",
+    "SplitContainer": "PanedWindow",
+    "MenuStrip": "Menu",
+    "ToolStrip": "Frame",
+    "StatusStrip": "Frame",
+    "ContextMenuStrip": "Menu",
+    "DataGridView": "ttk.Treeview",
+    "Listbox": "Listbox",
+    "ListView": "ttk.Treeview",
+    "TreeView": "ttk.Treeview",
+    "ComboBox": "ttk.Combobox"
+}
+
+TTK_WIDGETS = ["Combobox", "Progressbar", "Treeview", "Notebook", "Separator"]
+
+# Designer properties left out of generated code
+SKIPPED_CODE_PROPERTIES = ("background", "foreground", "font", "relief")
+
+
+def tkinter_class(widget_type):
+    """Return the class generated code uses for a designer widget type, e.g. tk.Button"""
+    widget_type = WINFORMS_MAPPING.get(widget_type, widget_type)
+    if widget_type.startswith("ttk."):
+        return widget_type
+    return f"ttk.{widget_type}" if widget_type in TTK_WIDGETS else f"tk.{widget_type}"
+
+
 class DragDropListbox(tk.Listbox):
     """Listbox with drag and drop functionality"""
 
@@ -132,6 +199,10 @@ class FileTab(ttk.Frame):
         self.line_numbers.yview(*args)
 
     def on_text_modified(self, event=None):
+        # Ignore the event fired when the flag is cleared (e.g. after a reload)
+        if not self.editor.edit_modified():
+            return
+
         # Track modifications
         if not self.modified:
             self.modified = True
@@ -139,6 +210,42 @@ class FileTab(ttk.Frame):
             self.parent.tab(idx, text=self.parent.tab(idx, "text") + " *")
         self.editor.edit_modified(False)  # Reset the flag
 
+    def reload_content(self, content):
+        """Replace the editor text with content changed on disk
+
+        Only the lines that differ are touched, so the cursor, selection and
+        scroll position stay where they were for the unchanged parts.
+        """
+        current = self.editor.get("1.0", "end-1c")
+        if content == current or content == current + "\n":
+            return False
+
+        top_line = self.editor.index("@0,0")
+        old_lines = current.splitlines(keepends=True)
+        new_lines = content.splitlines(keepends=True)
+
+        self.editor.edit_separator()
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+
+        # Apply changes bottom-up so earlier line numbers stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            start = f"{i1 + 1}.0" if i1 < len(old_lines) else "end-1c"
+            end = f"{i2 + 1}.0" if i2 < len(old_lines) else "end-1c"
+            self.editor.delete(start, end)
+            self.editor.insert(start, "".join(new_lines[j1:j2]))
+        self.editor.edit_separator()
+
+        # Reset modification state
+        self.editor.edit_modified(False)
+        self.modified = False
+        self.editor.yview(top_line)
+
+        self.update_line_numbers()
+        self.highlight_syntax()
+        return True
+
     def update_line_numbers(self, event=None):
         # Update line numbers in the editor
         line_count = self.editor.get("1.0", tk.END).count("\n")
@@ -236,8 +343,94 @@ class FileTab(ttk.Frame):
                 self.editor.tag_add("function", func_name_start, func_name_end)
             start_pos = self.editor.index(f"{start_pos}+1l")
 
+class TabRegistry:
+    """Index of open editor tabs by widget, file path and file name
+
+    Tabs are keyed by their Tk widget name, which (unlike a notebook index)
+    does not change when other tabs are opened, closed or reordered.
+    """
+
+    def __init__(self):
+        self.by_widget = {}  # widget name -> tab
+        self.by_path = {}    # absolute file path -> tab
+        self.by_name = {}    # file name -> {widget name: tab}
+
+    def __len__(self):
+        return len(self.by_widget)
+
+    def __iter__(self):
+        return iter(list(self.by_widget.values()))
+
+    def __contains__(self, tab):
+        return str(tab) in self.by_widget
+
+    def add(self, tab):
+        """Register a tab under its widget name and current file path"""
+        self.by_widget[str(tab)] = tab
+        self._index_path(tab)
+
+    def remove(self, tab):
+        """Forget a tab; returns False if it was not registered"""
+        if self.by_widget.pop(str(tab), None) is None:
+            return False
+        self._unindex_path(tab, getattr(tab, 'filepath', None))
+        return True
+
+    def update_path(self, tab, old_path):
+        """Re-index a tab after its file path changed (e.g. Save As)"""
+        self._unindex_path(tab, old_path)
+        self._index_path(tab)
+
+    def _index_path(self, tab):
+        filepath = getattr(tab, 'filepath', None)
+        if filepath:
+            self.by_path[filepath] = tab
+            self.by_name.setdefault(os.path.basename(filepath), {})[str(tab)] = tab
+
+    def _unindex_path(self, tab, filepath):
+        if not filepath:
+            return
+        if self.by_path.get(filepath) is tab:
+            del self.by_path[filepath]
+        name = os.path.basename(filepath)
+        tabs = self.by_name.get(name)
+        if tabs is not None:
+            tabs.pop(str(tab), None)
+            if not tabs:
+                del self.by_name[name]
+
+    def get(self, widget_name):
+        """Look up a tab by widget name (as returned by Notebook.select())"""
+        return self.by_widget.get(str(widget_name))
+
+    def get_by_path(self, filepath):
+        return self.by_path.get(filepath)
+
+    def get_by_name(self, filename):
+        """Return all tabs showing a file with this base name"""
+        return list(self.by_name.get(filename, {}).values())
+
+def read_file(filepath):
+    """Sniff and read a file; returns (filepath, kind, content, error)
+
+    Only files sniffed as TEXT are read and decoded. Binary and oversized
+    files are left on disk for the memory-mapped viewers, so content is
+    None for them.
+    """
+    try:
+        kind = sniff_file(filepath)
+        if kind != TEXT:
+            return filepath, kind, None, None
+        with open(filepath, 'r') as f:
+            return filepath, kind, f.read(), None
+    except Exception as e:
+        return filepath, None, None, e
+
 class DropFrame(ttk.Frame):
-    """Frame that accepts drag and drop from files"""
+    """Frame that accepts drag and drop from files
+
+    The callback receives the list of dropped paths in one call.
+    """
 
     def __init__(self, master, callback, **kw):
         super().__init__(master, **kw)
@@ -272,8 +465,7 @@ class DropFrame(ttk.Frame):
                 filetypes=[("Python files", "*.py"), ("All files", "*.*")]
             )
             if files:
-                for file in files:
-                    self.callback(file)
+                self.callback(list(files))
         except Exception as e:
             print(f"Error during drop: {e}")
 
@@ -327,6 +519,12 @@ class TkinterStudio(tk.Tk):
 
         # Show welcome screen on startup
         self.show_welcome_on_startup = True
+        self.window_geometry = None
+        self.output_max_lines = OutputPanel.DEFAULT_MAX_LINES
+        self.output_log_file = ""
+        self.interpreter = sys.executable
+        self.custom_interpreters = []
+        self.warm_workers = 0
 
         # Set application icon (for Windows)
         if sys.platform == 'win32':
@@ -397,10 +595,64 @@ class TkinterStudio(tk.Tk):
         self.create_main_area()
         self.create_status_bar()
 
-        # Track open files
-        self.open_files = {}
+        # Track open tabs
+        self.tabs = TabRegistry()
         self.current_file = None
 
+        # Watch open files and the project directory for external changes
+        self.project_dir = os.getcwd()
+        self.run_configs = RunConfigStore(self.project_dir)
+        self.file_watcher = FileWatcher()
+        self.file_watcher.watch_directory(self.project_dir)
+        self.file_watcher.start()
+        self.after(250, self.poll_file_events)
+
+        # Fill the Solution Explorer tree lazily from the project directory
+        self.project_explorer = ProjectTree(self.project_tree, self.open_specific_file, self.file_watcher)
+        self.project_explorer.set_root(self.project_dir)
+
+        # Index project paths in the background for Go to File. With inotify
+        # the index watches the project folders itself; polling that many
+        # folders would be too slow, so then it only hears the events above
+        self.index_watcher = FileWatcher(poll_fallback=False)
+        if self.index_watcher.uses_inotify:
+            self.index_watcher.start()
+        else:
+            self.index_watcher.stop()
+            self.index_watcher = None
+        self.file_index = FileIndex(self.index_watcher)
+        self.file_index.build(self.project_dir)
+
+        # Most recently used files and projects for the welcome screen
+        self.recent_items = RecentItemsStore()
+
+        # Journal unsaved buffers so they survive a crash
+        self.recovery_journal = RecoveryJournal()
+        self._journal_jobs = {}
+        self.after(700, self.offer_crash_recovery)
+        if MONITOR_AVAILABLE:
+            self.after(500, self.update_resource_display)
+
+        # Re-apply the saved window size and reopen the last session
+        self.load_preferences()
+        if self.window_geometry:
+            try:
+                self.geometry(self.window_geometry)
+            except tk.TclError:
+                pass
+
+        # Probe the selected interpreter now so its details are cached
+        self.interpreters = InterpreterRegistry()
+        threading.Thread(target=self.interpreters.probe, args=(self.interpreter,), daemon=True).start()
+
+        # Optional pre-started interpreters for running unsaved code
+        self.warm_pool = WarmWorkerPool()
+        self.warm_workers_var.set(self.warm_workers > 0)
+        self.configure_warm_pool()
+        self.session_store = SessionStore()
+        self._pending_session_tabs = []
+        self.session_restored = self.restore_session()
+
         # Initialize toolbox
         self.populate_toolbox()
 
@@ -425,8 +677,12 @@ class TkinterStudio(tk.Tk):
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
         file_menu.add_command(label="New", accelerator="Ctrl+N", command=self.new_file)
         file_menu.add_command(label="Open...", accelerator="Ctrl+O", command=self.open_file)
+        file_menu.add_command(label="Open Folder...", command=self.open_folder)
         file_menu.add_command(label="Save", accelerator="Ctrl+S", command=self.save_file)
         file_menu.add_command(label="Save As...", accelerator="Ctrl+Shift+S", command=self.save_file_as)
+        file_menu.add_command(label="Close", accelerator="Ctrl+W", command=self.close_tab)
+        file_menu.add_separator()
+        file_menu.add_command(label="Go to File...", accelerator="Ctrl+P", command=self.show_quick_open)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.on_close)
         self.menu_bar.add_cascade(label="File", menu=file_menu)
@@ -439,6 +695,8 @@ class TkinterStudio(tk.Tk):
         edit_menu.add_command(label="Cut", accelerator="Ctrl+X", command=self.cut)
         edit_menu.add_command(label="Copy", accelerator="Ctrl+C", command=self.copy)
         edit_menu.add_command(label="Paste", accelerator="Ctrl+V", command=self.paste)
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Find in Output...", command=self.find_in_output)
         self.menu_bar.add_cascade(label="Edit", menu=edit_menu)
 
         # View menu
@@ -451,12 +709,30 @@ class TkinterStudio(tk.Tk):
         view_menu.add_command(label="Designer", command=self.view_designer)
         view_menu.add_separator()
         view_menu.add_command(label="Output", command=self.toggle_output)
+        view_menu.add_command(label="Python Console", command=self.show_console)
         self.menu_bar.add_cascade(label="View", menu=view_menu)
 
         # Build menu
         build_menu = tk.Menu(self.menu_bar, tearoff=0)
         build_menu.add_command(label="Run", accelerator="F5", command=self.run_code)
+        build_menu.add_command(label="Run with Profiler", command=self.run_with_profiler)
+        build_menu.add_command(label="Run with Memory Profiler", command=self.run_with_memory_profiler)
+        build_menu.add_command(label="Take Memory Snapshot", command=self.take_memory_snapshot,
+                               state=tk.NORMAL if ON_DEMAND_SUPPORTED else tk.DISABLED)
+        build_menu.add_command(label="Benchmark...", command=self.benchmark_current_file)
+        build_menu.add_command(label="Send Selection to Console", accelerator="F9", command=self.send_to_console)
+        build_menu.add_command(label="Test Explorer", command=self.show_test_explorer)
+        build_menu.add_command(label="Stop", accelerator="Shift+F5", command=self.stop_run)
+        build_menu.add_command(label="Restart", accelerator="Ctrl+Shift+F5", command=self.restart_run)
+        build_menu.add_separator()
+        build_menu.add_command(label="Run Configuration...", command=self.edit_run_configuration)
+        build_menu.add_command(label="Select Interpreter...", command=self.show_interpreter_dialog)
+        self.warm_workers_var = tk.BooleanVar(value=False)
+        build_menu.add_checkbutton(label="Keep Warm Interpreter for Unsaved Code",
+                                   variable=self.warm_workers_var, command=self.toggle_warm_workers)
+        build_menu.add_separator()
         build_menu.add_command(label="Generate Code from Design", command=self.generate_code_from_design)
+        build_menu.add_command(label="Live Preview", command=self.start_live_preview)
         self.menu_bar.add_cascade(label="Build", menu=build_menu)
 
         # Format menu
@@ -482,7 +758,12 @@ class TkinterStudio(tk.Tk):
         self.bind("<Control-o>", lambda e: self.open_file())
         self.bind("<Control-s>", lambda e: self.save_file())
         self.bind("<Control-Shift-S>", lambda e: self.save_file_as())
+        self.bind("<Control-p>", lambda e: self.show_quick_open())
+        self.bind("<Control-w>", lambda e: self.close_tab())
         self.bind("<F5>", lambda e: self.run_code())
+        self.bind("<Shift-F5>", lambda e: self.stop_run())
+        self.bind("<F9>", lambda e: self.send_to_console())
+        self.bind("<Control-Shift-F5>", lambda e: self.restart_run())
         self.bind("<F7>", lambda e: self.view_code())
         self.bind("<F8>", lambda e: self.view_designer())
 
@@ -571,7 +852,7 @@ class TkinterStudio(tk.Tk):
         self.file_list.bind("<Double-1>", self.on_file_double_click)
 
         # Make the solution explorer droppable
-        self.dropframe = DropFrame(self.solution_explorer, self.open_dropped_file)
+        self.dropframe = DropFrame(self.solution_explorer, self.open_dropped_files)
         self.dropframe.pack(fill=tk.BOTH, expand=True)
 
         # Toolbox tab (Windows Forms style)
@@ -745,9 +1026,34 @@ class TkinterStudio(tk.Tk):
 
         # Output panel
         self.output_frame = ttk.LabelFrame(self.vertical_pane, text="Output")
-        self.output_text = ScrolledText(self.output_frame, height=8, wrap=tk.WORD,
-                                        background="#FFFFFF", foreground="#000000")
-        self.output_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        output_toolbar = ttk.Frame(self.output_frame)
+        output_toolbar.pack(fill=tk.X, padx=5, pady=(2, 0))
+        self.stop_button = ttk.Button(output_toolbar, text="Stop", command=self.stop_run,
+                                      state=tk.DISABLED)
+        self.stop_button.pack(side=tk.LEFT, padx=(0, 2))
+        self.restart_button = ttk.Button(output_toolbar, text="Restart", command=self.restart_run,
+                                         state=tk.DISABLED)
+        self.restart_button.pack(side=tk.LEFT, padx=2)
+        self.close_output_button = ttk.Button(output_toolbar, text="Close", command=self.close_run,
+                                              state=tk.DISABLED)
+        self.close_output_button.pack(side=tk.LEFT, padx=2)
+        ttk.Button(output_toolbar, text="Find", command=self.find_in_output).pack(side=tk.LEFT, padx=2)
+        # CPU and memory of the selected run over the last minute
+        self.sparkline = Sparkline(output_toolbar)
+        if MONITOR_AVAILABLE:
+            self.sparkline.pack(side=tk.RIGHT, padx=2)
+
+        # One tab per run, so several programs can run side by side
+        self.output_notebook = ttk.Notebook(self.output_frame)
+        self.output_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.output_notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_run_buttons())
+        self.run_jobs = {}  # output tab widget name -> RunJob
+        self.profile_runs = 0
+        self.memory_jobs = {}  # RunJob started by run_with_memory_profiler -> its snapshot directory
+        self.benchmark_history = None  # Loaded on first use
+        self.console = None  # ConsolePanel, created by show_console
+        self.live_preview = None  # LivePreview, created by start_live_preview
+        self.test_explorer = None  # TestExplorerView, created by show_test_explorer
 
         # Add panels to the paned window
         self.vertical_pane.add(self.main_notebook, weight=3)
@@ -770,6 +1076,10 @@ class TkinterStudio(tk.Tk):
         self.line_col_label = ttk.Label(self.status_bar, text="Ln 1, Col 1", style='Statusbar.TLabel')
         self.line_col_label.pack(side=tk.RIGHT, padx=5, pady=2)
 
+        # Resources used by the program in the selected Output tab
+        self.resource_label = ttk.Label(self.status_bar, text="", style='Statusbar.TLabel')
+        self.resource_label.pack(side=tk.RIGHT, padx=15, pady=2)
+
         # Add position indicator for design mode
         self.position_label = ttk.Label(self.status_bar, text="", style='Statusbar.TLabel')
         self.position_label.pack(side=tk.RIGHT, padx=15, pady=2)
@@ -778,67 +1088,310 @@ class TkinterStudio(tk.Tk):
         """Create a new file tab"""
         tab = FileTab(self.editor_notebook)
         self.editor_notebook.add(tab, text="Untitled")
-        self.editor_notebook.select(self.editor_notebook.index(tk.END) - 1)
+        self.editor_notebook.select(tab)
+        self.register_tab(tab)
 
         # Focus the editor
         tab.editor.focus_set()
 
     def open_file(self):
         """Open a file dialog and load file into editor"""
-        filepath = filedialog.askopenfilename(
+        filepaths = filedialog.askopenfilenames(
             title="Open File",
             filetypes=self.file_types
         )
 
-        if filepath:
-            self.open_specific_file(filepath)
-
-    def open_specific_file(self, filepath):
-        """Open a specific file into the editor"""
-        if filepath in self.open_files:
+        if len(filepaths) == 1:
+            self.open_specific_file(filepaths[0])
+        elif filepaths:
+            self.open_files_batch(filepaths)
+
+    def open_folder(self):
+        """Choose a folder and make it the project directory"""
+        directory = filedialog.askdirectory(title="Open Folder", initialdir=self.project_dir)
+        if directory:
+            self.set_project_dir(directory)
+
+    def set_project_dir(self, directory):
+        """Show a different directory in the Solution Explorer"""
+        directory = os.path.abspath(directory)
+        self.file_watcher.unwatch_directory(self.project_dir)
+        self.project_dir = directory
+        self.run_configs = RunConfigStore(directory)
+        self.file_watcher.watch_directory(directory)
+
+        self.project_explorer.set_root(directory)
+        self.file_index.build(directory)
+        if self.test_explorer is not None and self.test_explorer in self.tabs:
+            self.test_explorer.set_root(directory)
+        self.recent_items.add_project(directory)
+
+        # File list entries are shown relative to the project
+        self.file_list.delete(0, tk.END)
+        for tab in self.tabs:
+            if getattr(tab, 'filepath', None):
+                self.add_to_file_list(tab.filepath)
+
+        self.status_label.config(text=f"Opened folder {directory}")
+
+    def get_recent_entries(self, limit=10):
+        """Return recent ("file" | "project", path) pairs, newest first"""
+        entries = [(t, "project", p) for p, t in self.recent_items.items["projects"]]
+        entries += [(t, "file", p) for p, t in self.recent_items.items["files"]]
+        # By time only: the stable sort keeps the store's newest-first order on ties
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        return [(kind, path) for _, kind, path in entries[:limit]]
+
+    def open_specific_file(self, filepath, select=True, position=tk.END, recent=True):
+        """Open a specific file into the editor and return its tab
+
+        recent=False leaves the recent files list alone, for tabs the IDE
+        opens by itself such as those of a restored session.
+        """
+        filepath = os.path.abspath(filepath)
+        tab = self.tabs.get_by_path(filepath)
+        if tab is not None:
             # File already open, switch to its tab
-            self.editor_notebook.select(self.open_files[filepath])
+            if select:
+                self.editor_notebook.select(tab)
+            return tab
+
+        filepath, kind, content, error = read_file(filepath)
+        if error is not None:
+            messagebox.showerror("Error", f"Could not open file: {error}")
+            return None
+        return self.add_file_tab(filepath, content, select=select, position=position, kind=kind,
+                                 recent=recent)
+
+    def add_file_tab(self, filepath, content, select=True, position=tk.END, kind=TEXT, recent=True):
+        """Create and register a tab for a file read by read_file
+
+        Text goes to an editor tab; binary files get a hex viewer and
+        oversized text a read-only streaming viewer.
+        """
+        if kind == TEXT:
+            tab = FileTab(self.editor_notebook, filepath=filepath, content=content)
+        elif kind == BINARY:
+            tab = HexViewer(self.editor_notebook, filepath)
+        else:
+            tab = StreamingTextViewer(self.editor_notebook, filepath)
+        filename = os.path.basename(filepath)
+
+        # Add to notebook
+        self.editor_notebook.insert(position, tab, text=filename)
+        if select:
+            self.editor_notebook.select(tab)
+            self.current_file = filepath
+
+        # Update tracking
+        self.register_tab(tab)
+        self.file_watcher.watch_file(filepath)
+
+        # Add to file list and recent files
+        self.add_to_file_list(filepath)
+        if recent:
+            self.recent_items.add_file(filepath)
+
+        # Update status
+        self.status_label.config(text=f"Opened {filename}")
+        return tab
+
+    def open_files_batch(self, filepaths):
+        """Open several files at once
+
+        Files are read and decoded in parallel on a thread pool, so the
+        total time is about that of the slowest read. Tabs are then created
+        on the main thread in a single pass.
+        """
+        to_read = []
+        last_open = None
+        for filepath in filepaths:
+            filepath = os.path.abspath(filepath)
+            tab = self.tabs.get_by_path(filepath)
+            if tab is not None:
+                last_open = tab
+            elif filepath not in to_read:
+                to_read.append(filepath)
+
+        if not to_read:
+            if last_open is not None:
+                self.editor_notebook.select(last_open)
             return
 
-        try:
-            with open(filepath, 'r') as f:
-                content = f.read()
+        self.status_label.config(text=f"Opening {len(to_read)} files...")
 
-            # Create new tab with file content
-            tab = FileTab(self.editor_notebook, filepath=filepath, content=content)
-            filename = os.path.basename(filepath)
+        def read_all():
+            with ThreadPoolExecutor(max_workers=min(16, len(to_read))) as pool:
+                results = list(pool.map(read_file, to_read))
+            self.after(0, lambda: self._add_batch_tabs(results))
 
-            # Add to notebook
-            self.editor_notebook.add(tab, text=filename)
-            tab_index = self.editor_notebook.index(tk.END) - 1
-            self.editor_notebook.select(tab_index)
+        thread = threading.Thread(target=read_all)
+        thread.daemon = True
+        thread.start()
 
-            # Update tracking
-            self.open_files[filepath] = tab_index
-            self.current_file = filepath
+    def _add_batch_tabs(self, results):
+        """Create tabs for files read by open_files_batch"""
+        errors = []
+        opened_paths = []
+        last_tab = None
+        for filepath, kind, content, error in results:
+            if error is not None:
+                errors.append(f"{os.path.basename(filepath)}: {error}")
+            elif self.tabs.get_by_path(filepath) is None:
+                last_tab = self.add_file_tab(filepath, content, select=False, kind=kind, recent=False)
+                opened_paths.append(filepath)
+        # One write of the recent list for the whole batch
+        self.recent_items.add_files(opened_paths)
+
+        if last_tab is not None:
+            self.editor_notebook.select(last_tab)
+            self.current_file = last_tab.filepath
+        opened = len(results) - len(errors)
+        self.status_label.config(text=f"Opened {opened} file(s)")
+
+        if errors:
+            messagebox.showerror("Error", "Could not open some files:\n\n" + "\n".join(errors))
+
+    def register_tab(self, tab):
+        """Track a new editor tab and journal its unsaved edits"""
+        self.tabs.add(tab)
+        if not isinstance(tab, FileTab):
+            return  # Read-only viewers have nothing to journal
+        tab.editor.bind("<<Modified>>", lambda e, t=tab: self.schedule_journal(t), add="+")
+
+    def schedule_journal(self, tab):
+        """Journal a tab's buffer shortly after the user stops typing"""
+        key = str(tab)
+        if key in self._journal_jobs:
+            self.after_cancel(self._journal_jobs[key])
+        self._journal_jobs[key] = self.after(1000, self.journal_tab, tab)
+
+    def journal_tab(self, tab):
+        """Write a tab's changes (or its clean state) to the recovery journal"""
+        key = str(tab)
+        self._journal_jobs.pop(key, None)
+        if tab not in self.tabs:
+            return
+        try:
+            if tab.modified:
+                self.recovery_journal.record(key, tab.filepath, tab.editor.get("1.0", "end-1c"))
+            else:
+                self.recovery_journal.discard(key)
+        except OSError as e:
+            print(f"Could not write recovery journal: {e}")
+
+    def offer_crash_recovery(self):
+        """Offer to restore unsaved buffers left by a session that crashed"""
+        orphans = self.recovery_journal.find_orphans()
+        if not orphans:
+            return
 
-            # Add to file list
-            if filename not in self.file_list.get(0, tk.END):
-                self.file_list.insert(tk.END, filename)
+        buffers = []
+        for path in orphans:
+            buffers.extend(RecoveryJournal.replay(path).values())
+
+        if buffers and messagebox.askyesno(
+            "Recover Unsaved Files",
+            f"TkinterStudio did not shut down cleanly last time.\n\n"
+            f"Recover {len(buffers)} unsaved file(s)?",
+            icon=messagebox.QUESTION
+        ):
+            for filepath, text in buffers:
+                tab = None
+                if filepath and os.path.isfile(filepath):
+                    tab = self.open_specific_file(filepath, recent=False)
+                if not isinstance(tab, FileTab):
+                    self.new_file()
+                    tab = self.tabs.get(self.editor_notebook.select())
+                    if filepath:
+                        self.editor_notebook.tab(tab, text=os.path.basename(filepath))
+                tab.editor.delete("1.0", tk.END)
+                tab.editor.insert("1.0", text)
+                tab.update_line_numbers()
+                tab.highlight_syntax()
+            self.status_label.config(text=f"Recovered {len(buffers)} unsaved file(s)")
+
+        # Recovered buffers are journaled again by this session
+        for path in orphans:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
-            # Update status
-            self.status_label.config(text=f"Opened {filename}")
+    def close_tab(self, tab=None):
+        """Close an editor tab (the current one by default) and free its widgets"""
+        if tab is None:
+            current = self.editor_notebook.select()
+            if not current:
+                return
+            tab = self.tabs.get(current) or self.editor_notebook.nametowidget(current)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open file: {e}")
+        if getattr(tab, 'modified', False):
+            self.editor_notebook.select(tab)
+            result = messagebox.askyesnocancel(
+                "Save Changes",
+                f"Save changes to {self.editor_notebook.tab(tab, 'text').rstrip(' *')}?",
+                icon=messagebox.QUESTION
+            )
+            if result is None:  # Cancel
+                return
+            elif result:  # Yes
+                self.save_file()
+                if tab.modified:
+                    return  # Save was cancelled or failed
 
-    def open_dropped_file(self, filepath):
+        # Drop every reference to the tab before destroying it
+        self.tabs.remove(tab)
+        self.recovery_journal.discard(str(tab))
+        filepath = getattr(tab, 'filepath', None)
+        if filepath:
+            if self.tabs.get_by_path(filepath) is None:
+                self.file_watcher.unwatch_file(filepath)
+            self.remove_from_file_list(filepath)
+            if self.current_file == filepath:
+                self.current_file = None
+
+        self.editor_notebook.forget(tab)
+        tab.destroy()
+
+    def remove_from_file_list(self, filepath):
+        """Remove a file from the Solution Explorer file list"""
+        entry = os.path.relpath(filepath, self.project_dir)
+        entries = self.file_list.get(0, tk.END)
+        if entry in entries:
+            self.file_list.delete(entries.index(entry))
+
+    def add_to_file_list(self, filepath):
+        """Show a file in the Solution Explorer file list"""
+        # Paths relative to the project stay unique when file names collide
+        entry = os.path.relpath(filepath, self.project_dir)
+        if entry not in self.file_list.get(0, tk.END):
+            self.file_list.insert(tk.END, entry)
+
+    def show_quick_open(self):
+        """Show the Go to File palette"""
+        QuickOpenDialog(self, self.file_index, self.open_specific_file)
+
+    def open_dropped_files(self, filepaths):
         """Handle files dropped onto the solution explorer"""
-        if os.path.isfile(filepath):
-            self.open_specific_file(filepath)
+        filepaths = [p for p in filepaths if os.path.isfile(p)]
+        if filepaths:
+            self.open_files_batch(filepaths)
 
-    def save_file(self):
-        """Save the current file"""
+    def current_editor_tab(self):
+        """Return the selected tab if it is an editable FileTab, else None"""
         current = self.editor_notebook.select()
         if not current:
-            return
-
+            return None
         tab = self.editor_notebook.nametowidget(current)
+        return tab if isinstance(tab, FileTab) else None
+
+    def save_file(self):
+        """Save the current file"""
+        tab = self.current_editor_tab()
+        if tab is None:
+            return
+        current = self.editor_notebook.select()
 
         if not hasattr(tab, 'filepath') or not tab.filepath:
             self.save_file_as()
@@ -851,6 +1404,7 @@ class TkinterStudio(tk.Tk):
 
             # Update tab state
             tab.modified = False
+            self.recovery_journal.discard(str(tab))
             idx = self.editor_notebook.index(current)
             filename = os.path.basename(tab.filepath)
             self.editor_notebook.tab(idx, text=filename)
@@ -863,12 +1417,10 @@ class TkinterStudio(tk.Tk):
 
     def save_file_as(self):
         """Save the current file with a new name"""
-        current = self.editor_notebook.select()
-        if not current:
+        tab = self.current_editor_tab()
+        if tab is None:
             return
 
-        tab = self.editor_notebook.nametowidget(current)
-
         initial_file = tab.filepath if hasattr(tab, 'filepath') and tab.filepath else ""
         filepath = filedialog.asksaveasfilename(
             title="Save As",
@@ -880,30 +1432,29 @@ class TkinterStudio(tk.Tk):
             return
 
         # Update tab information
+        filepath = os.path.abspath(filepath)
         tab.filepath = filepath
 
-        # If this was a new file, update tracking
-        if initial_file in self.open_files:
-            del self.open_files[initial_file]
+        # Re-index the tab under its new path
+        self.tabs.update_path(tab, initial_file)
+        if initial_file:
+            self.file_watcher.unwatch_file(initial_file)
 
-        self.open_files[filepath] = self.editor_notebook.index(current)
         self.current_file = filepath
+        self.file_watcher.watch_file(filepath)
 
         # Now save the file
         self.save_file()
 
         # Add to file list if not already there
-        filename = os.path.basename(filepath)
-        if filename not in self.file_list.get(0, tk.END):
-            self.file_list.insert(tk.END, filename)
+        self.add_to_file_list(filepath)
+        self.recent_items.add_file(filepath)
 
     def run_code(self):
         """Run the current Python file"""
-        current = self.editor_notebook.select()
-        if not current:
-            return
-
-        tab = self.editor_notebook.nametowidget(current)
+        tab = self.current_editor_tab()
+        if tab is None:
+            return  # Viewers and tool tabs have nothing to run
 
         # Save if modified
         if tab.modified:
@@ -925,77 +1476,549 @@ class TkinterStudio(tk.Tk):
         else:
             # Run unsaved code
             content = tab.editor.get("1.0", tk.END)
-            self._run_python_code(content)
+            self._run_python_code(content, tab)
+
+    def python_command(self, *args, interpreter=None):
+        """Return the command line to run args with the selected interpreter"""
+        interpreter = interpreter or self.interpreter
+        if not os.path.isfile(interpreter):
+            messagebox.showerror("Run", f"The selected interpreter no longer exists:\n{interpreter}\n\n"
+                                        "Choose another one with Build > Select Interpreter "
+                                        "or Build > Run Configuration.")
+            return None
+        return [interpreter, *args]
+
+    def script_command(self, filepath, *prefix):
+        """Return (command, cwd, env) to run a script with its run configuration
+
+        prefix goes between the interpreter and the script (e.g. "-m",
+        "cProfile"); the configured arguments follow the script. Returns
+        None, after telling the user, if the configuration cannot be used.
+        """
+        config = self.run_configs.get(filepath)
+        try:
+            args = shlex.split(config["args"])
+        except ValueError as e:
+            messagebox.showerror("Run", f"Invalid arguments in the run configuration: {e}")
+            return None
+        command = self.python_command(*prefix, filepath, *args, interpreter=config["interpreter"])
+        if command is None:
+            return None
+        cwd = self.run_configs.resolve_cwd(config)
+        if cwd is not None and not os.path.isdir(cwd):
+            messagebox.showerror("Run", f"The working directory in the run configuration does not exist:\n{cwd}")
+            return None
+        return command, cwd, RunConfigStore.environment(config)
+
+    def edit_run_configuration(self):
+        """Edit the arguments, environment and so on used to run the current file"""
+        filepath = self.saved_file_for_run("Run Configuration")
+        if filepath is None:
+            return
+        candidates = self.interpreters.candidates(self.project_dir, self.custom_interpreters)
+        RunConfigDialog(self, os.path.basename(filepath), self.run_configs.get(filepath), self.project_dir,
+                        candidates, lambda config: self.run_configs.set(filepath, config))
+
+    def show_interpreter_dialog(self):
+        candidates = self.interpreters.candidates(self.project_dir, self.custom_interpreters)
+        if self.interpreter not in candidates and os.path.isfile(self.interpreter):
+            candidates.append(self.interpreter)
+        InterpreterDialog(self, self.interpreters, candidates, self.interpreter, self.set_interpreter)
+
+    def set_interpreter(self, path):
+        """Use path for future runs and remember it if it was added by hand"""
+        self.interpreter = path
+        if path not in self.interpreters.candidates(self.project_dir) and path not in self.custom_interpreters:
+            self.custom_interpreters.append(path)
+        self.status_label.config(text=f"Interpreter: {self.interpreters.describe(path)}")
+        self.configure_warm_pool()
+        if self.console is not None:
+            # Takes effect when the console is restarted
+            self.console.job.command = console_command(path)
+
+    def toggle_warm_workers(self):
+        self.warm_workers = 1 if self.warm_workers_var.get() else 0
+        self.configure_warm_pool()
+
+    def configure_warm_pool(self):
+        """Start, resize or flush the warm worker pool to match the settings"""
+        if self.warm_workers > 0 and os.path.isfile(self.interpreter):
+            self.warm_pool.configure(self.interpreter, size=self.warm_workers)
+        else:
+            self.warm_pool.shutdown()
 
     def _run_python_script(self, script_path):
-        """Run a Python script file"""
-        self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, f"Running {os.path.basename(script_path)}...\n\n")
-
-        # Run in a separate thread to keep the UI responsive
-        thread = threading.Thread(
-            target=self._execute_python,
-            args=(["python", script_path],)
-        )
-        thread.daemon = True
-        thread.start()
+        """Run a Python script file with its run configuration"""
+        run = self.script_command(script_path)
+        if run:
+            command, cwd, env = run
+            self.start_run(os.path.basename(script_path), command, cwd=cwd, env=env)
+
+    def _run_python_code(self, code, tab=None):
+        """Run Python code from a string
+
+        The code is piped to the interpreter's stdin ("python -"), so
+        nothing is written to disk.
+        """
+        command = self.python_command("-")
+        if command is None:
+            return
+
+        title = self.editor_notebook.tab(tab, "text").rstrip(" *") if tab is not None else "Untitled"
+        if self.warm_workers > 0:
+            # Hand the code to a pre-started worker (or a cold one if none is ready)
+            command, pool = worker_command(self.interpreter), self.warm_pool
+        else:
+            pool = None
+        self.start_run(title, command, input_text=code, pool=pool, source_tab=tab)
+
+    def saved_file_for_run(self, purpose):
+        """Return the current tab's file, saved, for run modes that need a path"""
+        tab = self.current_editor_tab()
+        if tab is None:
+            return None
+        if tab.modified or not tab.filepath:
+            if not messagebox.askokcancel(purpose, "The file must be saved first. Save it now?"):
+                return None
+            self.save_file()
+            if tab.modified or not tab.filepath:
+                return None
+        return tab.filepath
+
+    def run_with_profiler(self):
+        """Run the current file under cProfile and show the results"""
+        filepath = self.saved_file_for_run("Run with Profiler")
+        if filepath is None:
+            return
 
-    def _run_python_code(self, code):
-        """Run Python code from a string"""
-        self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, "Running code...\n\n")
+        name = os.path.basename(filepath)
+        profile_dir = os.path.join(user_cache_dir(), "profiles")
+        os.makedirs(profile_dir, exist_ok=True)
+        self.profile_runs += 1
+        stats_path = os.path.join(profile_dir, f"{os.getpid()}-{self.profile_runs}.prof")
+
+        run = self.script_command(filepath, "-m", "cProfile", "-o", stats_path)
+        if run:
+            command, cwd, env = run
+            self.start_run(f"Profile {name}", command, cwd=cwd, env=env,
+                           on_exit=lambda job: self.show_profile(stats_path, name))
+
+    def show_test_explorer(self):
+        """Open the Test Explorer tab, or switch to it"""
+        if self.test_explorer is None or self.test_explorer not in self.tabs:
+            self.test_explorer = TestExplorerView(self.editor_notebook, self.project_dir,
+                                                  lambda: self.python_command("-c", RUNNER_SCRIPT),
+                                                  self.go_to_line)
+            self.editor_notebook.add(self.test_explorer, text="Test Explorer")
+            self.tabs.add(self.test_explorer)
+        self.view_code()
+        self.editor_notebook.select(self.test_explorer)
 
-        # Create a temporary file
-        fd, path = tempfile.mkstemp(suffix='.py')
+    def show_profile(self, stats_path, name):
+        """Open the stats written by a profiler run in a new tab"""
+        if not os.path.exists(stats_path):
+            self.status_label.config(text=f"No profile was written for {name}")
+            return
         try:
-            with os.fdopen(fd, 'w') as f:
-                f.write(code)
+            view = ProfileView(self.editor_notebook, stats_path, f"Profile of {name}", self.go_to_line)
+        except Exception as e:
+            messagebox.showerror("Profiler", f"Could not read profile: {e}")
+            return
+        finally:
+            try:
+                os.remove(stats_path)
+            except OSError:
+                pass
 
-            # Run the temporary file
-            thread = threading.Thread(
-                target=self._execute_python,
-                args=(["python", path],)
-            )
-            thread.daemon = True
-            thread.start()
+        self.editor_notebook.add(view, text=f"Profile: {name}")
+        self.tabs.add(view)
+        self.view_code()
+        self.editor_notebook.select(view)
 
-        except Exception as e:
-            self.output_text.insert(tk.END, f"Error: {e}\n")
+    def run_with_memory_profiler(self):
+        """Run the current file with tracemalloc and show its allocation sites"""
+        filepath = self.saved_file_for_run("Run with Memory Profiler")
+        if filepath is None:
+            return
 
-    def _execute_python(self, command):
-        """Execute a Python process and capture output"""
+        name = os.path.basename(filepath)
+        snapshot_dir = self.new_snapshot_dir()
+        run = self.script_command(filepath, "-c", MEMORY_SCRIPT, snapshot_dir)
+        if run:
+            command, cwd, env = run
+            # The directory is looked up at exit, since a restart replaces it
+            job = self.start_run(f"Memory {name}", command, cwd=cwd, env=env,
+                                 on_exit=lambda job: self.show_memory_profile(self.memory_jobs.get(job), name))
+            self.memory_jobs[job] = snapshot_dir
+        else:
+            os.rmdir(snapshot_dir)
+
+    def new_snapshot_dir(self):
+        """Return a new, empty directory for one memory profiler run
+
+        Every run gets its own, so a MemoryView deleting the snapshots it
+        has loaded can never touch those of a later run.
+        """
+        base = os.path.join(user_cache_dir(), "memory")
+        os.makedirs(base, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=base)
+
+    def renew_snapshot_dir(self, job):
+        """Point a memory profiler job at a fresh directory before it restarts"""
+        old_dir = self.memory_jobs[job]
+        new_dir = self.new_snapshot_dir()
+        job.command = [new_dir if part == old_dir else part for part in job.command]
+        self.memory_jobs[job] = new_dir
+        threading.Thread(target=shutil.rmtree, args=(old_dir, True), daemon=True).start()
+
+    def take_memory_snapshot(self):
+        """Ask the memory-profiled program in the selected Output tab for a snapshot"""
+        job = self.current_run()
+        if job not in self.memory_jobs or not job.running:
+            self.status_label.config(text="Select the Output tab of a running memory profiler run first")
+            return
         try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            job.runner.send_signal(signal.SIGUSR1)
+        except OSError as e:
+            self.status_label.config(text=f"Could not take snapshot: {e}")
+
+    def show_memory_profile(self, snapshot_dir, name):
+        """Open the snapshots written by a memory profiler run in a new tab"""
+        if snapshot_dir is None:
+            return  # The job was closed
+        if not os.path.isdir(snapshot_dir) or not os.listdir(snapshot_dir):
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            self.status_label.config(text=f"No memory snapshots were written for {name}")
+            return
+        view = MemoryView(self.editor_notebook, snapshot_dir, f"Memory of {name}", self.go_to_line)
+        self.editor_notebook.add(view, text=f"Memory: {name}")
+        self.tabs.add(view)
+        self.view_code()
+        self.editor_notebook.select(view)
+
+    def benchmark_current_file(self):
+        """Ask how many runs to time, then benchmark the current file"""
+        filepath = self.saved_file_for_run("Benchmark")
+        if filepath is not None:
+            BenchmarkDialog(self, os.path.basename(filepath),
+                            lambda runs, warmup: self.start_benchmark(filepath, runs, warmup))
+
+    def start_benchmark(self, filepath, runs, warmup):
+        """Run a script warmup + runs times, one after another, in one Output tab"""
+        run = self.script_command(filepath)
+        if run is None:
+            return
+        command, cwd, env = run
+        session = BenchmarkSession(filepath, runs, warmup)
+        self.start_run(f"Benchmark {os.path.basename(filepath)}", command, cwd=cwd, env=env,
+                       on_exit=lambda job: self.on_benchmark_run_finished(job, session))
+        self.status_label.config(text=f"Benchmark run 1 of {session.total}...")
+
+    def on_benchmark_run_finished(self, job, session):
+        """Record one benchmark run and start the next, or report the results"""
+        if session.done:
+            return  # The user restarted a finished benchmark
+        session.add_run(job.runner)
+        if not session.done:
+            self.status_label.config(text=f"Benchmark run {session.completed + 1} of {session.total}...")
+            # Start the next run once this exit has been handled
+            self.after_idle(lambda: job.start() if str(job.panel.frame) in self.run_jobs else None)
+            return
 
-            stdout, stderr = process.communicate()
+        name = os.path.basename(session.filepath)
+        if session.failed is not None:
+            job.panel.write(f"\nBenchmark stopped: run {session.completed} exited with code {session.failed}.\n",
+                            "error")
+            self.status_label.config(text=f"Benchmark of {name} stopped")
+            return
 
-            # Update UI in the main thread
-            self.after(0, lambda: self._update_output(stdout, stderr, process.returncode))
+        result = session.result()
+        if self.benchmark_history is None:
+            self.benchmark_history = BenchmarkHistory()
+        self.benchmark_history.add(session.filepath, result)
+
+        wall = result["wall"]
+        cpu = result["cpu"]
+        job.panel.write(
+            f"\nBenchmark of {name}: {result['n']} runs after {result['warmup']} warm-up\n"
+            f"  wall  mean {format_seconds(wall[0])}  stddev {format_seconds(wall[1])}  min {format_seconds(wall[2])}\n"
+            + (f"  cpu   mean {format_seconds(cpu[0])}  stddev {format_seconds(cpu[1])}  min {format_seconds(cpu[2])}\n"
+               if cpu else "  cpu   not available on this platform\n")
+            + f"  peak RSS {format_rss(result['rss'])}\n"
+            + (f"  CPU and RSS missing for {result['missing']} of {result['n']} runs\n"
+               if result["missing"] else "")
+        )
+        self.status_label.config(text=f"Benchmark of {name}: mean {format_seconds(wall[0])}")
 
-        except Exception as e:
-            self.after(0, lambda: self._update_output("", str(e), 1))
+        view = BenchmarkHistoryView(self.editor_notebook, session.filepath,
+                                    self.benchmark_history.get(session.filepath))
+        self.editor_notebook.add(view, text=f"Benchmark: {name}")
+        self.tabs.add(view)
+        self.view_code()
+        self.editor_notebook.select(view)
+
+    def on_output_link(self, panel, filename, line):
+        """Jump to a traceback frame clicked in an Output tab"""
+        job = self.run_jobs.get(str(panel.frame))
+        if job is not None and filename in ("<stdin>", job.stdin_name):
+            # Code piped from an editor tab: line numbers match the tab
+            if job.source_tab is not None and job.source_tab in self.tabs:
+                self.editor_notebook.select(job.source_tab)
+                self.select_line(job.source_tab, line)
+            else:
+                self.status_label.config(text="The tab this code was run from has been closed")
+            return
+
+        if not os.path.isabs(filename):
+            filename = os.path.join((job.cwd if job is not None else None) or os.getcwd(), filename)
+        if os.path.isfile(filename):
+            self.go_to_line(filename, line)
+        else:
+            self.status_label.config(text=f"Cannot open {filename}")
 
-    def _update_output(self, stdout, stderr, returncode):
-        """Update the output panel with process results"""
-        if stdout:
-            self.output_text.insert(tk.END, stdout)
+    def go_to_line(self, filepath, line):
+        """Open a file (or switch to its tab) and select a line in it"""
+        tab = self.open_specific_file(filepath)
+        if not isinstance(tab, FileTab):
+            return None
+        self.select_line(tab, line)
+        return tab
+
+    def select_line(self, tab, line):
+        self.view_code()
+        index = f"{line}.0"
+        tab.editor.tag_remove(tk.SEL, "1.0", tk.END)
+        tab.editor.tag_add(tk.SEL, index, f"{index} lineend")
+        tab.editor.mark_set(tk.INSERT, index)
+        tab.editor.see(index)
+        tab.editor.focus_set()
 
-        if stderr:
-            self.output_text.insert(tk.END, stderr, "error")
-            self.output_text.tag_configure("error", foreground="red")
+    def start_run(self, title, command, cwd=None, env=None, input_text=None, pool=None, source_tab=None,
+                  on_exit=None, interactive=False):
+        """Start a command as a new job in its own Output tab
 
-        if returncode == 0:
-            self.output_text.insert(tk.END, "\nProcess completed successfully.\n")
+        A finished run of the same title is replaced; one that is still
+        running is left alone and the new run gets a tab of its own.
+        """
+        for tab_id, job in list(self.run_jobs.items()):
+            if job.title == title and not job.running:
+                self.close_run(tab_id)
+                break
+
+        panel = OutputPanel(self.output_notebook, height=8, wrap=tk.WORD,
+                            background="#FFFFFF", foreground="#000000",
+                            max_lines=self.output_max_lines,
+                            log_path=self.output_log_path(title),
+                            link_callback=self.on_output_link)
+        # The tab is the panel's frame: the Text widget itself is a child of
+        # that frame, not of the notebook, so the notebook cannot manage it
+        self.output_notebook.add(panel.frame, text=title)
+        self.output_notebook.select(panel.frame)
+
+        job = RunJob(panel, title, command, cwd=cwd, env=env, on_state_change=self.on_run_state_changed,
+                     input_text=input_text, pool=pool, source_tab=source_tab, on_exit=on_exit,
+                     interactive=interactive)
+        self.run_jobs[str(panel.frame)] = job
+        job.start()
+        return job
+
+    def output_log_path(self, title):
+        """Return the log file for a run, derived from the output_log_file setting"""
+        if not self.output_log_file:
+            return None
+        root, ext = os.path.splitext(self.output_log_file)
+        name = re.sub(r"[^\w.-]+", "_", title)
+        return f"{root}-{name}{ext or '.log'}"
+
+    def current_run(self):
+        """Return the job shown in the selected Output tab, if any"""
+        current = self.output_notebook.select()
+        return self.run_jobs.get(current) if current else None
+
+    def stop_run(self):
+        job = self.current_run()
+        if job is not None:
+            job.stop()
+
+    def restart_run(self):
+        job = self.current_run()
+        if job is not None:
+            # Unsaved code is re-read so the restart runs the latest edits
+            if job.source_tab is not None and job.source_tab in self.tabs:
+                job.input_text = job.source_tab.editor.get("1.0", tk.END)
+            if job in self.memory_jobs:
+                self.renew_snapshot_dir(job)
+            job.restart()
+
+    def show_console(self):
+        """Show the Python console, starting its interpreter on first use"""
+        if self.console is None:
+            self.console = ConsolePanel(self.output_notebook, console_command(self.interpreter),
+                                        cwd=self.project_dir, max_lines=self.output_max_lines,
+                                        link_callback=self.on_output_link)
+            self.output_notebook.add(self.console, text="Console")
+            self.console.start()
+        if not self.output_frame.winfo_ismapped():
+            self.toggle_output()
+        self.output_notebook.select(self.console)
+        self.console.input.focus_set()
+        return self.console
+
+    def find_in_output(self):
+        """Show the find and filter bar of the selected Output tab"""
+        if not self.output_frame.winfo_ismapped():
+            self.toggle_output()
+        job = self.current_run()
+        if job is not None:
+            job.panel.show_find_bar()
+        elif self.console is not None and self.output_notebook.select() == str(self.console):
+            self.console.output.show_find_bar()
+
+    def send_to_console(self):
+        """Run the editor's selection, or the current line, in the console"""
+        tab = self.current_editor_tab()
+        if tab is None:
+            return
+        editor = tab.editor
+        if editor.tag_ranges(tk.SEL):
+            source = editor.get("sel.first linestart", "sel.last")
         else:
-            self.output_text.insert(tk.END, f"\nProcess exited with code {returncode}.\n", "error")
+            source = editor.get("insert linestart", "insert lineend")
+        console = self.show_console()
+        editor.focus_set()
+        # Indented code from inside a block runs at the top level
+        console.send(textwrap.dedent(source))
+
+    def close_run(self, tab_id=None):
+        """Close an Output tab, killing its process if it is still running"""
+        tab_id = tab_id or self.output_notebook.select()
+        if self.console is not None and tab_id == str(self.console):
+            self.console.close()
+            self.output_notebook.forget(self.console)
+            self.console.destroy()
+            self.console = None
+            self.update_run_buttons()
+            return
+        job = self.run_jobs.pop(tab_id, None)
+        if job is None:
+            return
+        snapshot_dir = self.memory_jobs.pop(job, None)
+        if snapshot_dir is not None and job.running:
+            # Killed before it exited, so no view will load and delete them
+            threading.Thread(target=shutil.rmtree, args=(snapshot_dir, True), daemon=True).start()
+        job.close()
+        self.output_notebook.forget(job.panel.frame)
+        job.panel.frame.destroy()
+        self.update_run_buttons()
+
+    def on_run_state_changed(self, job):
+        """Show a job's state in its tab title and the output toolbar"""
+        if str(job.panel.frame) not in self.run_jobs:
+            return
+        if job.running:
+            state = "running"
+        elif job.runner is not None and job.runner.elapsed is not None:
+            state = f"exit {job.returncode}, {job.runner.elapsed:.1f} s"
+        else:
+            state = f"exit {job.returncode}"
+        self.output_notebook.tab(job.panel.frame, text=f"{job.title} ({state})")
+        self.update_run_buttons()
+
+        if not job.running:
+            self.status_label.config(text=f"{job.title} exited with code {job.returncode}")
+        elif self.live_preview is not None and job is self.live_preview.job:
+            # A restarted preview needs the whole design again
+            self.sync_live_preview()
+
+    def update_resource_display(self):
+        """Show the latest resource sample of the selected run, twice a second"""
+        job = self.current_run()
+        monitor = job.monitor if job is not None else None
+        if monitor is not None and monitor.latest is not None:
+            if job.running:
+                self.resource_label.config(text=f"{job.title}: {monitor.describe()}")
+            else:
+                self.resource_label.config(text="")
+            self.sparkline.show(monitor.history)
+        else:
+            self.resource_label.config(text="")
+            self.sparkline.show(())
+        self.after(500, self.update_resource_display)
+
+    def update_run_buttons(self):
+        job = self.current_run()
+        self.stop_button.config(state=tk.NORMAL if job is not None and job.running else tk.DISABLED)
+        self.restart_button.config(state=tk.NORMAL if job is not None else tk.DISABLED)
+        console_selected = self.console is not None and self.output_notebook.select() == str(self.console)
+        self.close_output_button.config(state=tk.NORMAL if job is not None or console_selected else tk.DISABLED)
+
+    def poll_file_events(self):
+        """Apply file system changes reported by the file watcher"""
+        try:
+            for kind, path in self.file_watcher.get_events():
+                self.project_explorer.handle_event(kind, path)
+                self.file_index.handle_event(kind, path)
+
+                tab = self.tabs.get_by_path(path)
+                if tab is not None:
+                    if kind in (CREATED, MODIFIED):
+                        self.reload_file_tab(tab)
+                    elif kind == DELETED:
+                        self.mark_file_tab_deleted(tab)
+                elif kind == RESCAN:
+                    # Events were dropped, re-check every open file
+                    for tab in self.tabs:
+                        if getattr(tab, 'filepath', None) and os.path.exists(tab.filepath):
+                            self.reload_file_tab(tab)
+            if self.index_watcher is not None:
+                for kind, path in self.index_watcher.get_events():
+                    self.file_index.handle_event(kind, path)
+        except Exception as e:
+            print(f"Error handling file changes: {e}")
+
+        self.after(250, self.poll_file_events)
 
-        # Scroll to the end
-        self.output_text.see(tk.END)
+    def reload_file_tab(self, tab):
+        """Reload a tab whose file was changed outside the IDE"""
+        if not isinstance(tab, FileTab):
+            try:
+                tab.reload()
+            except OSError:
+                pass
+            return
+
+        try:
+            with open(tab.filepath, 'r') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return
+
+        filename = os.path.basename(tab.filepath)
+        current = tab.editor.get("1.0", "end-1c")
+        if content == current or content == current + "\n":
+            # Nothing to reload, but the file may have come back after a delete
+            self.editor_notebook.tab(tab, text=filename + (" *" if tab.modified else ""))
+            return
+
+        if tab.modified:
+            reload = messagebox.askyesno(
+                "File Changed",
+                f"{filename} has been changed outside the editor.\n\n"
+                "Reload it and discard your changes?",
+                icon=messagebox.WARNING
+            )
+            if not reload:
+                return
+
+        if tab.reload_content(content):
+            self.editor_notebook.tab(tab, text=filename)
+            self.status_label.config(text=f"Reloaded {filename} (changed on disk)")
+
+    def mark_file_tab_deleted(self, tab):
+        """Flag a tab whose file was removed outside the IDE"""
+        filename = os.path.basename(tab.filepath)
+        self.editor_notebook.tab(tab, text=f"{filename} (deleted)")
+        self.status_label.config(text=f"{filename} was deleted on disk")
 
     def on_tab_changed(self, event):
         """Handle tab change events"""
@@ -1014,13 +2037,14 @@ class TkinterStudio(tk.Tk):
         if not selection:
             return
 
-        filename = self.file_list.get(selection[0])
+        entry = self.file_list.get(selection[0])
 
-        # Find the file in open_files
-        for filepath, tab_index in self.open_files.items():
-            if os.path.basename(filepath) == filename:
-                self.editor_notebook.select(tab_index)
-                return
+        # Entries are relative to the project, so this selects the right tab
+        # even when several open files share a name
+        filepath = os.path.normpath(os.path.join(self.project_dir, entry))
+        tab = self.tabs.get_by_path(filepath)
+        if tab is not None:
+            self.editor_notebook.select(tab)
 
     def toggle_solution_explorer(self):
         """Toggle visibility of solution explorer"""
@@ -1071,9 +2095,8 @@ class TkinterStudio(tk.Tk):
     # Edit operations
     def undo(self):
         """Undo last edit"""
-        current = self.editor_notebook.select()
-        if current:
-            tab = self.editor_notebook.nametowidget(current)
+        tab = self.current_editor_tab()
+        if tab is not None:
             try:
                 tab.editor.edit_undo()
             except tk.TclError:
@@ -1082,9 +2105,8 @@ class TkinterStudio(tk.Tk):
 
     def redo(self):
         """Redo last undone edit"""
-        current = self.editor_notebook.select()
-        if current:
-            tab = self.editor_notebook.nametowidget(current)
+        tab = self.current_editor_tab()
+        if tab is not None:
             try:
                 tab.editor.edit_redo()
             except tk.TclError:
@@ -1093,25 +2115,22 @@ class TkinterStudio(tk.Tk):
 
     def cut(self):
         """Cut selected text to clipboard"""
-        current = self.editor_notebook.select()
-        if current:
-            tab = self.editor_notebook.nametowidget(current)
+        tab = self.current_editor_tab()
+        if tab is not None:
             if tab.editor.tag_ranges(tk.SEL):
                 tab.editor.event_generate("<<Cut>>")
 
     def copy(self):
         """Copy selected text to clipboard"""
-        current = self.editor_notebook.select()
-        if current:
-            tab = self.editor_notebook.nametowidget(current)
+        tab = self.current_editor_tab()
+        if tab is not None:
             if tab.editor.tag_ranges(tk.SEL):
                 tab.editor.event_generate("<<Copy>>")
 
     def paste(self):
         """Paste clipboard text"""
-        current = self.editor_notebook.select()
-        if current:
-            tab = self.editor_notebook.nametowidget(current)
+        tab = self.current_editor_tab()
+        if tab is not None:
             tab.editor.event_generate("<<Paste>>")
 
     def show_about(self):
@@ -1169,8 +2188,24 @@ class TkinterStudio(tk.Tk):
                     self.editor_notebook.select(tab_id)
                     self.save_file()
 
-        # Save preferences
+        # Save preferences and the open session
         self.save_preferences()
+        self.save_session()
+
+        # Stop watching the file system
+        self.file_watcher.stop()
+        if self.index_watcher is not None:
+            self.index_watcher.stop()
+
+        # Don't leave running programs behind
+        for job in self.run_jobs.values():
+            job.close()
+        if self.console is not None:
+            self.console.close()
+        self.warm_pool.shutdown()
+
+        # A clean exit leaves nothing to recover
+        self.recovery_journal.close(clean=True)
 
         # Destroy the window
         self.destroy()
@@ -1217,7 +2252,12 @@ class TkinterStudio(tk.Tk):
         try:
             prefs = {
                 "show_welcome_on_startup": self.show_welcome_on_startup,
-                "window_size": self.geometry()
+                "window_size": self.geometry(),
+                "output_max_lines": self.output_max_lines,
+                "output_log_file": self.output_log_file,
+                "interpreter": self.interpreter,
+                "custom_interpreters": self.custom_interpreters,
+                "warm_workers": self.warm_workers
             }
 
             # Create preferences directory if it doesn't exist
@@ -1240,11 +2280,161 @@ class TkinterStudio(tk.Tk):
                     prefs = json.load(f)
 
                 self.show_welcome_on_startup = prefs.get("show_welcome_on_startup", True)
+                self.window_geometry = prefs.get("window_size")
+                self.output_max_lines = prefs.get("output_max_lines", OutputPanel.DEFAULT_MAX_LINES)
+                self.output_log_file = prefs.get("output_log_file", "")
+                self.interpreter = prefs.get("interpreter") or sys.executable
+                self.custom_interpreters = prefs.get("custom_interpreters", [])
+                self.warm_workers = prefs.get("warm_workers", 0)
         except Exception as e:
             # Use defaults if we can't load preferences
             print(f"Could not load preferences: {e}")
             self.show_welcome_on_startup = True
 
+    def save_session(self):
+        """Save open tabs, pane sizes and the designer document"""
+        try:
+            tabs = []
+            selected = 0
+            current = self.editor_notebook.select()
+            for tab_id in self.editor_notebook.tabs():
+                tab = self.tabs.get(tab_id)
+                if tab is None or not getattr(tab, 'filepath', None) or not hasattr(tab, 'editor'):
+                    continue
+                if tab_id == current:
+                    selected = len(tabs)
+                tabs.append([tab.filepath, tab.editor.index(tk.INSERT), tab.editor.index("@0,0")])
+
+            # Tabs that were still waiting to be restored keep their state
+            tabs.extend(record for _, record in self._pending_session_tabs)
+
+            panes = {}
+            for name, paned in (("main", self.main_paned),
+                                ("vertical", self.vertical_pane),
+                                ("designer", self.designer_pane)):
+                if len(paned.panes()) > 1:
+                    panes[name] = paned.sashpos(0)
+
+            self.session_store.save({
+                "geometry": self.geometry(),
+                "panes": panes,
+                "view": self.main_notebook.index(self.main_notebook.select()),
+                "sel": selected,
+                "tabs": tabs,
+                "design": self.serialize_design(),
+            })
+        except Exception as e:
+            # Print error but don't crash
+            print(f"Could not save session: {e}")
+
+    def restore_session(self):
+        """Reopen the last session; returns True if any tab was restored
+
+        The previously selected tab is opened right away. The others are
+        opened one per event loop iteration so the window stays responsive.
+        """
+        session = self.session_store.load()
+        if not session:
+            return False
+
+        try:
+            self.restore_design(session.get("design"))
+            self.main_notebook.select(session.get("view", 0))
+        except Exception as e:
+            print(f"Could not restore designer: {e}")
+        self.after(200, lambda: self.restore_pane_sizes(session.get("panes", {})))
+
+        records = [r for r in session.get("tabs", []) if os.path.isfile(r[0])]
+        if not records:
+            return False
+
+        selected = min(max(session.get("sel", 0), 0), len(records) - 1)
+        self._restored_tab_indexes = [selected]
+        self._restore_tab(records[selected], select=True)
+
+        self._pending_session_tabs = [(i, r) for i, r in enumerate(records) if i != selected]
+        self.after_idle(self._hydrate_session_tabs)
+        return True
+
+    def _restore_tab(self, record, select=False, position=tk.END):
+        filepath, insert, top = record
+        tab = self.open_specific_file(filepath, select=select, position=position, recent=False)
+        if tab is not None and hasattr(tab, 'editor'):
+            tab.editor.mark_set(tk.INSERT, insert)
+            tab.editor.yview(top)
+            tab.line_numbers.yview(top)
+        return tab
+
+    def _hydrate_session_tabs(self):
+        """Open the next pending session tab in its original position"""
+        if not self._pending_session_tabs:
+            self.status_label.config(text="Session restored")
+            return
+
+        index, record = self._pending_session_tabs.pop(0)
+        position = sum(1 for i in self._restored_tab_indexes if i < index)
+        self._restored_tab_indexes.append(index)
+        self._restore_tab(record, position=min(position, self.editor_notebook.index(tk.END)))
+
+        self.after(1, self._hydrate_session_tabs)
+
+    def restore_pane_sizes(self, panes):
+        """Move the pane sashes back to their saved positions"""
+        for name, paned in (("main", self.main_paned),
+                            ("vertical", self.vertical_pane),
+                            ("designer", self.designer_pane)):
+            if name in panes and len(paned.panes()) > 1:
+                try:
+                    paned.sashpos(0, panes[name])
+                except tk.TclError:
+                    pass
+
+    def serialize_design(self):
+        """Return the designer document in the session's compact layout"""
+        widgets = []
+        for widget_info in self.design_widgets.values():
+            widgets.append([
+                widget_info["type"], widget_info["name"],
+                int(widget_info["x"]), int(widget_info["y"]),
+                int(widget_info["width"]), int(widget_info["height"]),
+                widget_info["properties"]
+            ])
+        return {
+            "form": [self.form_width_var.get(), self.form_height_var.get()],
+            "widgets": widgets
+        }
+
+    def restore_design(self, design):
+        """Recreate a designer document saved by serialize_design"""
+        if not design:
+            return
+
+        form_width, form_height = design.get("form", ["400", "300"])
+        self.form_width_var.set(str(form_width))
+        self.form_height_var.set(str(form_height))
+        self.design_canvas.coords(self.form_container, 10, 30, 10 + int(form_width), 30 + int(form_height))
+        self.design_canvas.coords(self.form_titlebar, 10, 10, 10 + int(form_width), 30)
+
+        for widget_type, name, x, y, width, height, properties in design.get("widgets", []):
+            widget_id = self.add_widget_to_design_at_position(widget_type, x, y, generate_code=False)
+            widget_info = self.design_widgets[widget_id]
+            widget_info["name"] = name
+            widget_info["properties"] = properties
+
+            # Restore the exact geometry, bypassing grid snapping
+            widget_info["x"], widget_info["y"] = x, y
+            widget_info["width"], widget_info["height"] = width, height
+            self.design_canvas.coords(widget_id, x, y, x + width, y + height)
+            self.design_canvas.coords(widget_info["text_id"], x + width / 2, y + height / 2)
+            if "text" in properties:
+                self.design_canvas.itemconfig(widget_info["text_id"], text=properties["text"])
+            for pos, handle_id in widget_info["handles"].items():
+                hx = x + {"w": 0, "e": width}.get(pos[-1], width / 2)
+                hy = y + {"n": 0, "s": height}.get(pos[0], height / 2)
+                self.design_canvas.coords(handle_id, hx - 3, hy - 3, hx + 3, hy + 3)
+
+        self.update_properties_panel()
+
     def populate_toolbox(self):
         """Populate the toolbox with Tkinter widgets in Windows Forms style"""
         # Create a treeview for the toolbox categories
@@ -1459,7 +2649,7 @@ class TkinterStudio(tk.Tk):
         """Add a widget to the design canvas at default position"""
         self.add_widget_to_design_at_position(widget_name, 50, 50)
 
-    def add_widget_to_design_at_position(self, widget_name, x, y):
+    def add_widget_to_design_at_position(self, widget_name, x, y, generate_code=True):
         """Add a widget to the design canvas at specified position"""
         # Switch to designer view
         self.view_designer()
@@ -1551,7 +2741,8 @@ class TkinterStudio(tk.Tk):
         self.design_canvas.tag_bind("handle", "<ButtonRelease-1>", self.on_handle_release)
 
         # Generate code
-        self.generate_code_from_design()
+        if generate_code:
+            self.generate_code_from_design()
 
         return widget_id
 
@@ -1601,13 +2792,14 @@ class TkinterStudio(tk.Tk):
         # Make properties editable with double-click
         self.properties_tree.bind("<Double-1>", self.edit_property)
 
-        # Add Edit Properties button
-        edit_btn = ttk.Button(
-            self.properties_frame,
-            text="Edit Properties...",
-            command=lambda: self.edit_property(None)
-        )
-        edit_btn.pack(pady=5, padx=5)
+        # Add Edit Properties button (once; restoring a session selects many widgets)
+        if not hasattr(self, "edit_properties_button"):
+            self.edit_properties_button = ttk.Button(
+                self.properties_frame,
+                text="Edit Properties...",
+                command=lambda: self.edit_property(None)
+            )
+            self.edit_properties_button.pack(pady=5, padx=5)
 
     def edit_property(self, event):
         """Edit a property value using the property editor"""
@@ -1714,6 +2906,8 @@ class TkinterStudio(tk.Tk):
             except ValueError:
                 pass
 
+        self.sync_live_preview()
+
     def on_widget_press(self, event):
         """Handle widget selection on press"""
         # Find the widget under cursor
@@ -1790,6 +2984,7 @@ class TkinterStudio(tk.Tk):
 
         # Update status bar with position
         self.status_label.config(text=f"Position: ({int(x1)}, {int(y1)}) Size: {int(x2-x1)}×{int(y2-y1)}")
+        self.sync_live_preview()
 
     def on_widget_release(self, event):
         """Handle end of widget drag"""
@@ -1937,6 +3132,7 @@ class TkinterStudio(tk.Tk):
         # Update drag position
         self._drag_data["x"] = event.x
         self._drag_data["y"] = event.y
+        self.sync_live_preview()
 
     def on_handle_release(self, event):
         """Handle resize handle release"""
@@ -1951,18 +3147,16 @@ class TkinterStudio(tk.Tk):
 
     def generate_code_from_design(self):
         """Generate Python code from the design"""
+        self.sync_live_preview()
         if not self.design_widgets:
             messagebox.showinfo("Generate Code", "No widgets to generate code from.")
             return
 
         # Create a new code tab if needed
         self.view_code()
-        current = self.editor_notebook.select()
-
-        if not current:
+        if self.current_editor_tab() is None:
             self.new_file()
-            current = self.editor_notebook.select()
-
+        current = self.editor_notebook.select()
         tab = self.editor_notebook.nametowidget(current)
 
         # Generate code
@@ -1980,6 +3174,34 @@ class TkinterStudio(tk.Tk):
         # Update status
         self.status_label.config(text="Generated code from design")
 
+    def start_live_preview(self):
+        """Show the design in a running window that follows designer edits"""
+        if self.live_preview is not None and self.live_preview.running:
+            self.live_preview.show()
+            return
+        command = self.python_command("-c", PREVIEW_SCRIPT)
+        if command is None:
+            return
+        job = self.start_run("Live Preview", command, interactive=True)
+        self.live_preview = LivePreview(job)
+        self.sync_live_preview()
+
+    def preview_design(self):
+        """Return the design in the layout LivePreview.sync expects"""
+        design = {}
+        for widget_id, widget_info in self.design_widgets.items():
+            props = {prop: value for prop, value in widget_info["properties"].items()
+                     if prop not in SKIPPED_CODE_PROPERTIES}
+            place = [int(widget_info["x"]), int(widget_info["y"]),
+                     int(widget_info["width"]), int(widget_info["height"])]
+            design[widget_id] = (tkinter_class(widget_info["type"]), place, props)
+        return design
+
+    def sync_live_preview(self):
+        """Send the preview whatever changed in the design since the last sync"""
+        if self.live_preview is not None and self.live_preview.running:
+            self.live_preview.sync(self.preview_design())
+
     def generate_tkinter_code(self):
         """Generate Tkinter code from the design"""
         code = [
@@ -2002,32 +3224,6 @@ class TkinterStudio(tk.Tk):
             "    def create_widgets(self):"
         ]
 
-        # Map Tkinter equivalents for Windows Forms controls
-        winforms_mapping = {
-            "Button": "Button",
-            "Label": "Label",
-            "LinkLabel": "Label",
-            "Entry": "Entry",
-            "TextBox": "Text",
-            "Checkbutton": "Checkbutton",
-            "Radiobutton": "Radiobutton",
-            "GroupBox": "LabelFrame",
-            "PictureBox": "Label",
-            "Frame": "Frame",
-            "Panel": "Frame",
-            "TabControl": "ttk.Notebook",
-            "SplitContainer": "PanedWindow",
-            "MenuStrip": "Menu",
-            "ToolStrip": "Frame",
-            "StatusStrip": "Frame",
-            "ContextMenuStrip": "Menu",
-            "DataGridView": "ttk.Treeview",
-            "Listbox": "Listbox",
-            "ListView": "ttk.Treeview",
-            "TreeView": "ttk.Treeview",
-            "ComboBox": "ttk.Combobox"
-        }
-
         # Add widget creation code
         for widget_id, widget_info in self.design_widgets.items():
             original_type = widget_info["type"]
@@ -2035,23 +3231,13 @@ class TkinterStudio(tk.Tk):
             properties = widget_info["properties"]
 
             # Map to Tkinter equivalent
-            widget_type = winforms_mapping.get(original_type, original_type)
-
-            # Determine if this is a ttk widget
-            ttk_widgets = ["Combobox", "Progressbar", "Treeview", "Notebook", "Separator"]
-            if widget_type.startswith("ttk."):
-                module = ""
-            else:
-                module = "ttk" if widget_type in ttk_widgets else "tk"
-
-            # Format widget type with module
-            full_type = widget_type if widget_type.startswith("ttk.") else f"{module}.{widget_type}"
+            full_type = tkinter_class(original_type)
 
             # Format properties
             props = []
             for prop, value in properties.items():
                 # Skip some properties or format them differently
-                if prop in ["background", "foreground", "font", "relief"]:
+                if prop in SKIPPED_CODE_PROPERTIES:
                     continue
 
                 # Format string values
@@ -2166,6 +3352,8 @@ class TkinterStudio(tk.Tk):
                     self.design_canvas.move(w_info["text_id"], 0, dy)
                     w_info["y"] = new_y
 
+        self.sync_live_preview()
+
     def make_same_size(self):
         """Make all widgets the same size as the selected widget"""
         if not self.selected_widget:
@@ -2201,6 +3389,8 @@ class TkinterStudio(tk.Tk):
                     y + (target_height / 2)
                 )
 
+        self.sync_live_preview()
+
     def resize_form(self):
         """Resize the form container"""
         try:
@@ -2257,8 +3447,12 @@ class TkinterStudio(tk.Tk):
                 self.open_file()
             elif action == "recent" and args:
                 path = args[0]
-                if os.path.exists(path):
+                if os.path.isdir(path):
+                    self.set_project_dir(path)
+                elif os.path.isfile(path):
                     self.open_specific_file(path)
+                else:
+                    self.recent_items.remove(path)
             elif action == "close" and args:
                 self.show_welcome_on_startup = args[0]
 
@@ -2268,11 +3462,12 @@ class TkinterStudio(tk.Tk):
         # Only show welcome screen if enabled and available
         if self.show_welcome_on_startup and WELCOME_AVAILABLE and WelcomeScreen:
             try:
-                welcome = WelcomeScreen(self, welcome_callback)
+                welcome = WelcomeScreen(self, welcome_callback, self.get_recent_entries())
             except Exception as e:
                 print(f"Error showing welcome screen: {e}")
-                self.new_file()
-        else:
+                if not self.session_restored:
+                    self.new_file()
+        elif not self.session_restored:
             # Create default file
             self.new_file()
 
@@ -0,0 +1,214 @@
+import os
+import glob
+import shutil
+import signal
+import threading
+import tracemalloc
+import tkinter as tk
+from tkinter import ttk
+
+# Bootstrap run in the child: python -c MEMORY_SCRIPT <snapshot dir> <script> [args]
+# Snapshots are written at exit and whenever the process receives SIGUSR1.
+MEMORY_SCRIPT = r"""
+import os, sys, types, signal, tracemalloc
+
+out_dir, target = sys.argv[1], sys.argv[2]
+os.makedirs(out_dir, exist_ok=True)
+sys.argv = sys.argv[2:]
+sys.path[0] = os.path.dirname(os.path.abspath(target))
+snapshots = [0]
+
+def dump(label):
+    snapshots[0] += 1
+    path = os.path.join(out_dir, "%03d-%s.snapshot" % (snapshots[0], label))
+    tracemalloc.take_snapshot().dump(path)
+    print("[memory profiler] snapshot %d taken (%s)" % (snapshots[0], label), file=sys.stderr)
+
+if hasattr(signal, "SIGUSR1"):
+    signal.signal(signal.SIGUSR1, lambda signum, frame: dump("on demand"))
+
+with open(target, "rb") as f:
+    code = compile(f.read(), target, "exec")
+
+# Run in a __main__ that outlives the program (unlike runpy's temporary
+# module), so the exit snapshot still sees its module-level data
+main = types.ModuleType("__main__")
+main.__file__ = target
+main.__builtins__ = __builtins__
+sys.modules["__main__"] = main
+
+tracemalloc.start(int(os.environ.get("TKSTUDIO_TRACEMALLOC_FRAMES", "1")))
+try:
+    exec(code, main.__dict__)
+finally:
+    dump("exit")
+"""
+
+# Allocations made by the profiler itself
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+# Taking an on-demand snapshot needs a signal the child can catch
+ON_DEMAND_SUPPORTED = hasattr(signal, "SIGUSR1")
+
+
+def memory_command(interpreter, snapshot_dir, script):
+    return [interpreter, "-c", MEMORY_SCRIPT, snapshot_dir, script]
+
+
+def format_size(size):
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
+
+
+def load_snapshots(snapshot_dir):
+    """Load the snapshots in a directory, oldest first, as (label, snapshot)"""
+    snapshots = []
+    for path in sorted(glob.glob(os.path.join(snapshot_dir, "*.snapshot"))):
+        name = os.path.basename(path)[:-len(".snapshot")]
+        number, _, label = name.partition("-")
+        snapshot = tracemalloc.Snapshot.load(path).filter_traces(SNAPSHOT_FILTERS)
+        snapshots.append((f"#{int(number)} {label}", snapshot))
+    return snapshots
+
+
+class MemoryView(ttk.Frame):
+    """Top allocation sites from tracemalloc snapshots
+
+    Shows one snapshot grouped by file or by line, or the difference
+    between two snapshots. Snapshots are loaded on a background thread,
+    because a large program's snapshot can take a few seconds to read.
+    Double-clicking a line opens it through open_callback(filepath, line).
+    """
+
+    TOP_N = 200
+
+    def __init__(self, parent, snapshot_dir, title, open_callback):
+        super().__init__(parent)
+        self.title = title
+        self.open_callback = open_callback
+        self.snapshots = []
+        self.row_locations = {}
+
+        self.create_widgets()
+        self.status.config(text=f"{title}: loading snapshots...")
+        threading.Thread(target=self._load, args=(snapshot_dir,), daemon=True).start()
+
+    def _load(self, snapshot_dir):
+        try:
+            snapshots = load_snapshots(snapshot_dir)
+            error = None
+        except (OSError, ValueError, EOFError) as e:
+            snapshots, error = [], e
+        finally:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+        try:
+            self.after(0, lambda: self.on_loaded(snapshots, error))
+        except (RuntimeError, tk.TclError):
+            pass  # The view was closed while loading
+
+    def create_widgets(self):
+        self.status = ttk.Label(self, text="", anchor=tk.W)
+        self.status.pack(fill=tk.X, padx=5, pady=2)
+
+        controls = ttk.Frame(self)
+        controls.pack(fill=tk.X, padx=5, pady=2)
+
+        ttk.Label(controls, text="Snapshot:").pack(side=tk.LEFT)
+        self.snapshot_var = tk.StringVar()
+        self.snapshot_box = ttk.Combobox(controls, textvariable=self.snapshot_var, state="readonly", width=20)
+        self.snapshot_box.pack(side=tk.LEFT, padx=(2, 10))
+
+        ttk.Label(controls, text="Compare with:").pack(side=tk.LEFT)
+        self.compare_var = tk.StringVar(value="(none)")
+        self.compare_box = ttk.Combobox(controls, textvariable=self.compare_var, state="readonly", width=20)
+        self.compare_box.pack(side=tk.LEFT, padx=(2, 10))
+
+        ttk.Label(controls, text="Group by:").pack(side=tk.LEFT)
+        self.group_var = tk.StringVar(value="lineno")
+        ttk.Radiobutton(controls, text="Line", value="lineno", variable=self.group_var,
+                        command=self.refresh).pack(side=tk.LEFT)
+        ttk.Radiobutton(controls, text="File", value="filename", variable=self.group_var,
+                        command=self.refresh).pack(side=tk.LEFT)
+
+        self.snapshot_box.bind("<<ComboboxSelected>>", lambda e: self.refresh())
+        self.compare_box.bind("<<ComboboxSelected>>", lambda e: self.refresh())
+
+        frame = ttk.Frame(self)
+        frame.pack(fill=tk.BOTH, expand=True)
+        columns = ("size", "size_diff", "count", "count_diff")
+        self.tree = ttk.Treeview(frame, columns=columns, selectmode="browse")
+        self.tree.heading("#0", text="location")
+        self.tree.column("#0", width=420, stretch=True)
+        for name, heading in zip(columns, ("size", "size +/-", "blocks", "blocks +/-")):
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=90, anchor=tk.E, stretch=False)
+        scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.bind("<Double-1>", self.on_double_click)
+
+    def on_loaded(self, snapshots, error):
+        if error is not None:
+            self.status.config(text=f"{self.title}: could not read snapshots: {error}")
+            return
+        if not snapshots:
+            self.status.config(text=f"{self.title}: no snapshots were written")
+            return
+
+        self.snapshots = snapshots
+        labels = [label for label, _ in snapshots]
+        self.snapshot_box.config(values=labels)
+        self.compare_box.config(values=["(none)"] + labels)
+        self.snapshot_var.set(labels[-1])
+        # With several snapshots, show what changed since the first one
+        self.compare_var.set(labels[0] if len(labels) > 1 else "(none)")
+        self.refresh()
+
+    def snapshot_for(self, label):
+        return next((s for l, s in self.snapshots if l == label), None)
+
+    def refresh(self):
+        snapshot = self.snapshot_for(self.snapshot_var.get())
+        if snapshot is None:
+            return
+        group = self.group_var.get()
+        baseline = self.snapshot_for(self.compare_var.get())
+
+        self.tree.delete(*self.tree.get_children())
+        self.row_locations = {}
+        if baseline is not None and baseline is not snapshot:
+            stats = snapshot.compare_to(baseline, group)
+            rows = [(s.traceback[0], s.size, s.size_diff, s.count, s.count_diff) for s in stats]
+        else:
+            stats = snapshot.statistics(group)
+            rows = [(s.traceback[0], s.size, None, s.count, None) for s in stats]
+
+        for frame, size, size_diff, count, count_diff in rows[:self.TOP_N]:
+            label = frame.filename if group == "filename" else f"{frame.filename}:{frame.lineno}"
+            item = self.tree.insert("", tk.END, text=label, values=(
+                format_size(size),
+                "" if size_diff is None else format_size(size_diff),
+                count,
+                "" if count_diff is None else f"{count_diff:+d}",
+            ))
+            self.row_locations[item] = (frame.filename, frame.lineno if group == "lineno" else 1)
+
+        total = sum(trace.size for trace in snapshot.traces)
+        self.status.config(text=f"{self.title}: {format_size(total)} traced in {self.snapshot_var.get()}, "
+                                f"top {min(len(rows), self.TOP_N)} of {len(rows)} sites")
+
+    def on_double_click(self, event):
+        location = self.row_locations.get(self.tree.identify_row(event.y))
+        if location and os.path.isfile(location[0]):
+            self.open_callback(*location)
@@ -0,0 +1,433 @@
+import os
+import re
+import tkinter as tk
+from tkinter import ttk
+from tkinter.scrolledtext import ScrolledText
+
+# A traceback frame line: File "path", line 12
+LINK_PATTERN = re.compile(r'File "([^"\n]+)", line (\d+)')
+
+# Line flags kept in the line index
+STDERR_LINE = 1
+WARNING_LINE = 2
+ERROR_LINE = 4
+ERROR_PATTERN = re.compile(r"ERROR|CRITICAL|FATAL|FAIL(?:ED)?\b|Traceback \(most|(?:Error|Exception)\b")
+WARNING_PATTERN = re.compile(r"WARN(?:ING)?\b|Warning\b")
+
+
+class OutputPanel(ScrolledText):
+    """Output text area that keeps at most max_lines lines
+
+    Old lines are dropped from the top once the panel holds max_lines plus
+    a tenth more, so trimming happens in batches rather than on every
+    insert, and the Text widget (and Tk's memory) never grows past a fixed
+    size however much a program prints. A single "lines hidden" marker
+    replaces whatever was trimmed.
+
+    When log_path is set, everything written since the last clear() is
+    also appended to that file, so the full output of a run is still
+    available after the panel has trimmed it.
+
+    Text written with links=True has its traceback frame references
+    tagged as links. Only the chunk being written is scanned, so streamed
+    output is never rescanned. Clicking a link calls
+    link_callback(panel, filename, line).
+
+    Every line written is also kept in a line index (its text and whether
+    it came from stderr or looks like a warning or error), so set_filter()
+    can find and hide lines without reading the Text widget back. Lines
+    that do not pass the filter are hidden with an elided tag rather than
+    deleted, and the index is scanned FILTER_BATCH lines per event loop
+    turn so even a huge panel stays responsive while filtering.
+    """
+
+    DEFAULT_MAX_LINES = 10000
+    FILTER_BATCH = 20000
+
+    def __init__(self, master, max_lines=DEFAULT_MAX_LINES, log_path=None, link_callback=None, **kw):
+        super().__init__(master, **kw)
+        self.max_lines = max_lines
+        self.log_path = log_path
+        self.link_callback = link_callback
+        self.line_count = 1        # Lines in the widget, as Tk counts them
+        self.trimmed_lines = 0
+        self._log_file = None
+        self.lines = []            # Line index: text of each line after the marker
+        self.line_flags = []       # STDERR_LINE | WARNING_LINE | ERROR_LINE per line
+        self._line_open = False    # The last indexed line has no newline yet
+        self.filter = None         # (pattern, stream, severity, only_matching)
+        self.filter_callback = None
+        self.match_count = 0
+        self.find_bar = None
+        self._filter_pos = 0       # Lines before this are filtered
+        self._filter_job = None
+
+        self.tag_configure("error", foreground="red")
+        self.tag_configure("trimmed", foreground="#808080")
+        self.tag_configure("link", underline=True)
+        self.tag_bind("link", "<Enter>", lambda e: self.config(cursor="hand2"))
+        self.tag_bind("link", "<Leave>", lambda e: self.config(cursor=""))
+        self.tag_bind("link", "<Button-1>", self.on_link_click)
+        self.tag_configure("match", background="#FFF176")
+        self.tag_configure("current_match", background="#FFA726")
+        self.tag_configure("hidden", elide=True)
+        self.bind("<Control-f>", lambda e: self.show_find_bar() or "break")
+        self.bind("<Destroy>", lambda e: self.close_log() if e.widget is self else None)
+
+    def set_limits(self, max_lines=None, log_path=None):
+        """Apply the line limit and log file from the user's settings"""
+        if max_lines:
+            self.max_lines = max(int(max_lines), 100)
+        self.log_path = log_path or None
+
+    def clear(self):
+        """Empty the panel and start a new log"""
+        self.delete("1.0", tk.END)
+        self.line_count = 1
+        self.trimmed_lines = 0
+        self.lines = []
+        self.line_flags = []
+        self._line_open = False
+        self.match_count = 0
+        self._filter_pos = 0
+        self.close_log()
+        if self.log_path:
+            try:
+                directory = os.path.dirname(self.log_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._log_file = open(self.log_path, "w", encoding="utf-8")
+            except OSError as e:
+                print(f"Could not open output log: {e}")
+
+    def write(self, text, tags=(), links=False):
+        """Append text at the end, trimming old lines when over the limit"""
+        if not text:
+            return
+        start = self.index("end-1c")
+        self.insert(tk.END, text, tags)
+        if links:
+            for match in LINK_PATTERN.finditer(text):
+                self.tag_add("link", f"{start}+{match.start()}c", f"{start}+{match.end()}c")
+        self.line_count += text.count("\n")
+        if self.filter is not None:
+            # Retract an open last line while its old text can still be counted
+            self._unfilter(len(self.lines) - self._line_open)
+        self._index_lines(text, STDERR_LINE if "error" in tags else 0)
+        if self.filter is not None and self._filter_job is None:
+            self._filter_step()
+        if self._log_file is not None:
+            self._log_file.write(text)
+
+        if self.line_count > self.max_lines + self.max_lines // 10:
+            self.trim()
+
+    def trim(self):
+        """Drop lines from the top so that max_lines remain"""
+        marker = 1 if self.trimmed_lines else 0
+        excess = self.line_count - self.max_lines
+        if excess <= 0:
+            return
+        self.delete("1.0", f"{excess + marker + 1}.0")
+        if self.filter is not None:
+            dropped = min(excess, self._filter_pos)
+            self.match_count -= self._count_matches(0, dropped)
+            self._filter_pos -= dropped
+        del self.lines[:excess]
+        del self.line_flags[:excess]
+        self.trimmed_lines += excess
+        self.line_count -= excess
+
+        note = f"... {self.trimmed_lines:,} earlier lines not shown"
+        if self._log_file is not None:
+            note += f" (full output in {self.log_path})"
+        self.insert("1.0", note + "\n", "trimmed")
+
+    def _index_lines(self, text, stream):
+        """Add written text to the line index; returns the first line it changed"""
+        pieces = text.split("\n")
+        first = len(self.lines)
+        first_stream = stream
+        if self._line_open:
+            # The chunk continues the last line
+            first -= 1
+            pieces[0] = self.lines.pop() + pieces[0]
+            first_stream |= self.line_flags.pop() & STDERR_LINE
+        self._line_open = pieces[-1] != ""
+        if not self._line_open:
+            pieces.pop()
+        previous = self.line_flags[-1] if self.line_flags else 0
+        for number, line in enumerate(pieces):
+            flags = first_stream if number == 0 else stream
+            if ERROR_PATTERN.search(line):
+                flags |= ERROR_LINE
+            elif WARNING_PATTERN.search(line):
+                flags |= WARNING_LINE
+            elif line[:1] in (" ", "\t"):
+                # Indented lines (traceback frames, wrapped messages) belong to the line above
+                flags |= previous & (WARNING_LINE | ERROR_LINE)
+            self.lines.append(line)
+            self.line_flags.append(flags)
+            previous = flags
+        return first
+
+    def _first_line(self):
+        """Tk line number of the first indexed line"""
+        return 2 if self.trimmed_lines else 1
+
+    def set_filter(self, pattern=None, stream=None, severity=0, only_matching=False):
+        """Highlight matches of pattern and hide the lines that do not pass
+
+        pattern is a compiled regex or None; stream is "stdout", "stderr" or
+        None for both; severity is 0, WARNING_LINE (warnings and errors) or
+        ERROR_LINE. With only_matching, lines without a match are hidden
+        too. set_filter() with no arguments shows every line again.
+        """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+        self.tag_remove("hidden", "1.0", tk.END)
+        self.tag_remove("match", "1.0", tk.END)
+        self.tag_remove("current_match", "1.0", tk.END)
+        self.match_count = 0
+        self._filter_pos = 0
+        if pattern is None and stream is None and not severity:
+            self.filter = None
+            if self.filter_callback is not None:
+                self.filter_callback(0, True)
+            return
+        self.filter = (pattern, stream, severity, only_matching)
+        self._filter_step()
+
+    def line_visible(self, number):
+        """Return True if line number of the index passes the filter"""
+        if self.filter is None:
+            return True
+        pattern, stream, severity, only_matching = self.filter
+        flags = self.line_flags[number]
+        if stream is not None and bool(flags & STDERR_LINE) != (stream == "stderr"):
+            return False
+        if severity and not flags & (ERROR_LINE if severity == ERROR_LINE else ERROR_LINE | WARNING_LINE):
+            return False
+        if only_matching and pattern is not None and not pattern.search(self.lines[number]):
+            return False
+        return True
+
+    def _matches(self, number):
+        return [match.span() for match in self.filter[0].finditer(self.lines[number])
+                if match.end() > match.start()]
+
+    def _count_matches(self, start, end):
+        if self.filter is None or self.filter[0] is None:
+            return 0
+        return sum(len(self._matches(number)) for number in range(start, end) if self.line_visible(number))
+
+    def _unfilter(self, first):
+        """Drop the filter tags and matches of lines from first on, so they are filtered again"""
+        if first < self._filter_pos:
+            start = f"{first + self._first_line()}.0"
+            self.tag_remove("hidden", start, tk.END)
+            self.tag_remove("match", start, tk.END)
+            self.match_count -= self._count_matches(first, self._filter_pos)
+            self._filter_pos = first
+
+    def _filter_step(self):
+        """Tag the next batch of indexed lines as hidden or matching"""
+        self._filter_job = None
+        offset = self._first_line()
+        start = self._filter_pos
+        end = min(len(self.lines), start + self.FILTER_BATCH)
+        hidden = []
+        matches = []
+        hidden_from = None
+        for number in range(start, end):
+            if not self.line_visible(number):
+                if hidden_from is None:
+                    hidden_from = number
+                continue
+            if hidden_from is not None:
+                hidden += (f"{hidden_from + offset}.0", f"{number + offset}.0")
+                hidden_from = None
+            if self.filter[0] is not None:
+                for match_start, match_end in self._matches(number):
+                    matches += (f"{number + offset}.{match_start}", f"{number + offset}.{match_end}")
+        if hidden_from is not None:
+            hidden += (f"{hidden_from + offset}.0", f"{end + offset}.0")
+        # One Tcl call per batch, however many ranges there are
+        if hidden:
+            self.tag_add("hidden", *hidden)
+        if matches:
+            self.tag_add("match", *matches)
+        self.match_count += len(matches) // 2
+        self._filter_pos = end
+
+        done = end >= len(self.lines)
+        if not done:
+            self._filter_job = self.after(1, self._filter_step)
+        if self.filter_callback is not None:
+            self.filter_callback(self.match_count, done)
+
+    def find_next(self, backwards=False):
+        """Select the next (or previous) visible match; returns False if there is none"""
+        if self.filter is None or self.filter[0] is None or not self.lines:
+            return False
+        count = len(self.lines)
+        offset = self._first_line()
+        step = -1 if backwards else 1
+        current = self.tag_ranges("current_match")
+        if current:
+            number, column = (int(part) for part in str(current[0]).split("."))
+            number -= offset
+        else:
+            number, column = (count - 1 if backwards else 0), None
+
+        # Around the whole index once, ending back on the starting line
+        for _ in range(count + 1):
+            if 0 <= number < count and self.line_visible(number):
+                spans = self._matches(number)
+                if column is not None:
+                    spans = [span for span in spans if (span[0] < column if backwards else span[0] > column)]
+                if spans:
+                    match_start, match_end = spans[-1] if backwards else spans[0]
+                    line = number + offset
+                    self.tag_remove("current_match", "1.0", tk.END)
+                    self.tag_add("current_match", f"{line}.{match_start}", f"{line}.{match_end}")
+                    self.see(f"{line}.{match_start}")
+                    return True
+            column = None
+            number = (number + step) % count
+        return False
+
+    def show_find_bar(self):
+        """Show the find bar above the output and focus its pattern field"""
+        if self.find_bar is None:
+            self.find_bar = OutputFindBar(self)
+        if not self.find_bar.winfo_manager():
+            self.find_bar.pack(side=tk.TOP, fill=tk.X, before=self.vbar)
+            self.find_bar.update_filter()
+        self.find_bar.entry.focus_set()
+        self.find_bar.entry.select_range(0, tk.END)
+
+    def on_link_click(self, event):
+        """Re-parse the clicked line and report the file and line number"""
+        index = self.index(f"@{event.x},{event.y}")
+        line_text = self.get(f"{index} linestart", f"{index} lineend")
+        column = int(index.split(".")[1])
+        for match in LINK_PATTERN.finditer(line_text):
+            if match.start() <= column <= match.end() and self.link_callback is not None:
+                self.link_callback(self, match.group(1), int(match.group(2)))
+                break
+        return "break"
+
+    def flush_log(self):
+        if self._log_file is not None:
+            try:
+                self._log_file.flush()
+            except OSError:
+                pass
+
+    def close_log(self):
+        if self._log_file is not None:
+            try:
+                self._log_file.close()
+            except OSError:
+                pass
+            self._log_file = None
+
+
+class OutputFindBar(ttk.Frame):
+    """Find and filter bar shown above an OutputPanel
+
+    Typing updates the filter after a short pause, so a long panel is not
+    refiltered on every keystroke. Enter and Shift+Enter move between
+    matches; Escape closes the bar and shows every line again.
+    """
+
+    STREAMS = {"stdout and stderr": None, "stdout only": "stdout", "stderr only": "stderr"}
+    SEVERITIES = {"All lines": 0, "Warnings and errors": WARNING_LINE, "Errors only": ERROR_LINE}
+    DELAY_MS = 150
+
+    def __init__(self, panel):
+        super().__init__(panel.frame)
+        self.panel = panel
+        self._pending = None
+        self.error = None
+        self.pattern_var = tk.StringVar()
+        self.regex_var = tk.BooleanVar(value=False)
+        self.case_var = tk.BooleanVar(value=False)
+        self.only_matching_var = tk.BooleanVar(value=False)
+        self.stream_var = tk.StringVar(value=next(iter(self.STREAMS)))
+        self.severity_var = tk.StringVar(value=next(iter(self.SEVERITIES)))
+
+        ttk.Label(self, text="Find:").pack(side=tk.LEFT, padx=(2, 2))
+        self.entry = ttk.Entry(self, textvariable=self.pattern_var, width=24)
+        self.entry.pack(side=tk.LEFT, pady=2)
+        self.entry.bind("<Return>", lambda e: self.find(False))
+        self.entry.bind("<Shift-Return>", lambda e: self.find(True))
+        self.entry.bind("<Escape>", lambda e: self.close())
+        ttk.Button(self, text="Previous", command=lambda: self.find(True)).pack(side=tk.LEFT, padx=(4, 0))
+        ttk.Button(self, text="Next", command=lambda: self.find(False)).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(self, text="Regex", variable=self.regex_var).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(self, text="Match case", variable=self.case_var).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(self, text="Matching lines only",
+                        variable=self.only_matching_var).pack(side=tk.LEFT, padx=2)
+        ttk.Combobox(self, textvariable=self.stream_var, values=list(self.STREAMS), state="readonly",
+                     width=16).pack(side=tk.LEFT, padx=2)
+        ttk.Combobox(self, textvariable=self.severity_var, values=list(self.SEVERITIES), state="readonly",
+                     width=18).pack(side=tk.LEFT, padx=2)
+        ttk.Button(self, text="\u2715", width=2, command=self.close).pack(side=tk.RIGHT, padx=2)
+        self.status = ttk.Label(self, text="")
+        self.status.pack(side=tk.LEFT, padx=4)
+
+        for var in (self.pattern_var, self.regex_var, self.case_var, self.only_matching_var,
+                    self.stream_var, self.severity_var):
+            var.trace("w", self.schedule_update)
+        panel.filter_callback = self.show_progress
+
+    def schedule_update(self, *args):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self.DELAY_MS, self.update_filter)
+
+    def update_filter(self):
+        """Apply the bar's settings to the panel"""
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        text = self.pattern_var.get()
+        pattern = None
+        self.error = None
+        if text:
+            try:
+                pattern = re.compile(text if self.regex_var.get() else re.escape(text),
+                                     0 if self.case_var.get() else re.IGNORECASE)
+            except re.error as e:
+                self.error = f"Invalid pattern: {e}"
+        self.panel.set_filter(pattern, self.STREAMS[self.stream_var.get()],
+                              self.SEVERITIES[self.severity_var.get()], self.only_matching_var.get())
+
+    def show_progress(self, match_count, done):
+        if self.error:
+            text = self.error
+        elif self.pattern_var.get():
+            text = f"{match_count:,} matches" + ("" if done else " so far...")
+        else:
+            text = ""
+        self.status.config(text=text)
+
+    def find(self, backwards):
+        if self._pending is not None:
+            self.update_filter()
+        if not self.panel.find_next(backwards) and self.pattern_var.get() and not self.error:
+            self.status.config(text="No matches")
+        return "break"
+
+    def close(self):
+        """Hide the bar and show every line again"""
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        self.pack_forget()
+        self.panel.set_filter()
+        self.panel.focus_set()
+        return "break"
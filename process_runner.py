@@ -0,0 +1,186 @@
+import os
+import sys
+import time
+import queue
+import signal
+import subprocess
+import threading
+
+# Stream names used in output items
+STDOUT = "stdout"
+STDERR = "stderr"
+EXIT = "exit"
+
+
+class ProcessRunner:
+    """Runs a child process and streams its output line by line
+
+    One reader thread per pipe pushes (stream, line) items onto a shared
+    queue as lines arrive, so stdout and stderr stay interleaved in the
+    order they were written. When both pipes are closed and the process
+    has exited, a final (EXIT, returncode) item is queued.
+
+    The queue is bounded: if the UI falls behind, the reader threads block,
+    the pipe fills and the child waits, so a chatty script cannot grow the
+    IDE's memory without limit.
+
+    The child is started in its own process group (a new session on POSIX,
+    a new console process group on Windows) so stop() also reaches any
+    processes it spawned.
+
+    With stdin_pipe set, the program's stdin is a pipe that send_input()
+    fills and closes, or that write_input() keeps feeding; otherwise it
+    reads from the null device.
+    """
+
+    QUEUE_SIZE = 10000
+
+    def __init__(self, command, cwd=None, env=None, stdin_pipe=False):
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.stdin_pipe = stdin_pipe
+        self.process = None
+        self.returncode = None
+        self.started = None
+        self.elapsed = None
+        self.rusage = None  # Resource usage of the child, where os.wait4 exists
+        self._input = None  # Text waiting for write_input's writer thread
+        self.queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+
+    def start(self):
+        """Start the process; raises OSError if it cannot be launched"""
+        env = dict(os.environ if self.env is None else self.env)
+        # Python children flush every line instead of every 8 KiB
+        env.setdefault("PYTHONUNBUFFERED", "1")
+        env.setdefault("PYTHONIOENCODING", "utf-8")
+
+        if sys.platform == "win32":
+            group_options = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group_options = {"start_new_session": True}
+
+        self.started = time.monotonic()
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE if self.stdin_pipe else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.cwd,
+            env=env,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **group_options
+        )
+
+        readers = [
+            threading.Thread(target=self._read_pipe, args=(self.process.stdout, STDOUT), daemon=True),
+            threading.Thread(target=self._read_pipe, args=(self.process.stderr, STDERR), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        threading.Thread(target=self._wait, args=(readers,), daemon=True).start()
+
+    def send_input(self, text):
+        """Write text to the process's stdin on a thread, then close it"""
+        def write():
+            try:
+                self.process.stdin.write(text)
+                self.process.stdin.close()
+            except (OSError, ValueError):
+                pass  # The process exited without reading everything
+
+        threading.Thread(target=write, daemon=True).start()
+
+    def write_input(self, text):
+        """Queue text for the process's stdin, leaving it open for more
+
+        Writes happen on a thread, in order, so a child that is busy and
+        not reading cannot block the caller.
+        """
+        if self._input is None:
+            self._input = queue.Queue()
+            threading.Thread(target=self._write_stdin, args=(self._input,), daemon=True).start()
+        self._input.put(text)
+
+    def _write_stdin(self, pending):
+        while True:
+            text = pending.get()
+            if text is None:
+                return
+            try:
+                self.process.stdin.write(text)
+                self.process.stdin.flush()
+            except (OSError, ValueError):
+                return  # The process exited
+
+    def _read_pipe(self, pipe, stream):
+        try:
+            for line in iter(pipe.readline, ""):
+                self.queue.put((stream, line))
+        except (OSError, ValueError):
+            pass
+        finally:
+            pipe.close()
+
+    def _wait(self, readers):
+        for reader in readers:
+            reader.join()
+        self.returncode = self._reap()
+        self.elapsed = time.monotonic() - self.started
+        if self._input is not None:
+            self._input.put(None)  # Let the stdin writer thread finish
+        self.queue.put((EXIT, self.returncode))
+
+    def _reap(self):
+        """Wait for the child, collecting its resource usage if possible
+
+        This thread is the only one that reaps the child: running and
+        send_signal() go by returncode rather than Popen.poll(), which
+        would reap it first and lose the rusage.
+        """
+        if hasattr(os, "wait4"):
+            try:
+                _, status, self.rusage = os.wait4(self.process.pid, 0)
+                self.process.returncode = os.waitstatus_to_exitcode(status)
+                return self.process.returncode
+            except ChildProcessError:
+                pass  # Reaped elsewhere after all; rusage stays None
+        return self.process.wait()
+
+    def get_output(self, max_items=1000):
+        """Return up to max_items queued (stream, text) items without blocking"""
+        items = []
+        try:
+            while len(items) < max_items:
+                items.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return items
+
+    @property
+    def running(self):
+        return self.process is not None and self.returncode is None
+
+    def send_signal(self, sig):
+        """Send a signal to the child while it runs; raises OSError on failure"""
+        if self.running:
+            os.kill(self.process.pid, sig)
+
+    def stop(self, force=False):
+        """Ask the process group to exit, or kill it outright if force is set"""
+        if not self.running:
+            return
+        try:
+            if sys.platform == "win32":
+                if force:
+                    subprocess.run(["taskkill", "/T", "/F", "/PID", str(self.process.pid)],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                else:
+                    self.process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(self.process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except OSError:
+            pass
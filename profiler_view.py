@@ -0,0 +1,173 @@
+import os
+import pstats
+import tkinter as tk
+from tkinter import ttk
+
+# (column id, heading, sort key on a row tuple); rows are
+# (key, label, primitive calls, total calls, tottime, cumtime)
+COLUMNS = (
+    ("ncalls", "ncalls", lambda r: r[3]),
+    ("tottime", "tottime", lambda r: r[4]),
+    ("tpercall", "percall", lambda r: r[4] / r[3] if r[3] else 0),
+    ("cumtime", "cumtime", lambda r: r[5]),
+    ("cpercall", "percall", lambda r: r[5] / r[2] if r[2] else 0),
+)
+
+
+def function_label(key):
+    """Format a pstats function key (file, line, name) for display"""
+    filename, line, name = key
+    if filename == "~" and line == 0:
+        return name  # Built-in function
+    return f"{name}  ({os.path.basename(filename)}:{line})"
+
+
+def format_calls(primitive, total):
+    return str(total) if primitive == total else f"{total}/{primitive}"
+
+
+class ProfileView(ttk.Frame):
+    """Sortable view of a cProfile stats file
+
+    The top table lists every profiled function; click a heading to sort.
+    Selecting a function fills the callers and callees tables below;
+    double-clicking a caller or callee moves the selection to it.
+    Double-clicking a function in the top table calls
+    open_callback(filepath, line) if it lives in a source file.
+    """
+
+    def __init__(self, parent, stats_path, title, open_callback):
+        super().__init__(parent)
+        self.title = title
+        self.open_callback = open_callback
+        self.sort_column = "cumtime"
+        self.sort_reverse = True
+
+        stats = pstats.Stats(stats_path)
+        stats.calc_callees()
+        self.stats = stats.stats
+        self.callees = stats.all_callees
+        self.total_time = stats.total_tt
+
+        self.rows = [(key, function_label(key), cc, nc, tt, ct)
+                     for key, (cc, nc, tt, ct, _) in self.stats.items()]
+        self.row_keys = {}  # tree item -> function key, for all three tables
+
+        self.create_widgets()
+        self.populate()
+
+    def create_widgets(self):
+        ttk.Label(self, text=f"{self.title}: {len(self.rows)} functions, "
+                             f"{self.total_time:.3f} s total", anchor=tk.W
+                  ).pack(fill=tk.X, padx=5, pady=2)
+
+        paned = ttk.PanedWindow(self, orient=tk.VERTICAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = self.make_table(paned, sortable=True)
+        paned.add(self.tree.master, weight=3)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Double-1>", self.on_double_click)
+
+        related = ttk.PanedWindow(paned, orient=tk.HORIZONTAL)
+        paned.add(related, weight=1)
+        callers_frame = ttk.LabelFrame(related, text="Called by")
+        callees_frame = ttk.LabelFrame(related, text="Calls")
+        related.add(callers_frame, weight=1)
+        related.add(callees_frame, weight=1)
+        self.callers_tree = self.make_table(callers_frame)
+        self.callers_tree.master.pack(fill=tk.BOTH, expand=True)
+        self.callees_tree = self.make_table(callees_frame)
+        self.callees_tree.master.pack(fill=tk.BOTH, expand=True)
+
+        # Drill down from a caller or callee into the main table
+        self.callers_tree.bind("<Double-1>", self.on_related_double_click)
+        self.callees_tree.bind("<Double-1>", self.on_related_double_click)
+
+    def make_table(self, parent, sortable=False):
+        frame = ttk.Frame(parent)
+        names = [c[0] for c in COLUMNS]
+        tree = ttk.Treeview(frame, columns=names, selectmode="browse")
+        tree.heading("#0", text="function",
+                     command=(lambda: self.sort_by("function")) if sortable else "")
+        tree.column("#0", width=360, stretch=True)
+        for name, heading, _ in COLUMNS:
+            tree.heading(name, text=heading,
+                         command=(lambda n=name: self.sort_by(n)) if sortable else "")
+            tree.column(name, width=80, anchor=tk.E, stretch=False)
+
+        scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scroll.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        return tree
+
+    def row_values(self, cc, nc, tt, ct):
+        return (format_calls(cc, nc), f"{tt:.4f}", f"{tt / nc:.6f}" if nc else "0",
+                f"{ct:.4f}", f"{ct / cc:.6f}" if cc else "0")
+
+    def populate(self):
+        """Insert the functions once; sorting only reorders the items"""
+        for key, label, cc, nc, tt, ct in self.rows:
+            item = self.tree.insert("", tk.END, text=label, values=self.row_values(cc, nc, tt, ct))
+            self.row_keys[item] = key
+        self.items = {key: item for item, key in self.row_keys.items()}
+        self.sort_by(self.sort_column, toggle=False)
+
+    def sort_by(self, column, toggle=True):
+        if toggle:
+            if column == self.sort_column:
+                self.sort_reverse = not self.sort_reverse
+            else:
+                # Numbers read best largest first, names alphabetically
+                self.sort_reverse = column != "function"
+        self.sort_column = column
+
+        if column == "function":
+            key_func = lambda r: r[1].lower()
+        else:
+            key_func = next(c[2] for c in COLUMNS if c[0] == column)
+        self.rows.sort(key=key_func, reverse=self.sort_reverse)
+        for index, row in enumerate(self.rows):
+            self.tree.move(self.items[row[0]], "", index)
+
+        for name, heading, _ in COLUMNS:
+            self.tree.heading(name, text=heading + self.sort_marker(name))
+        self.tree.heading("#0", text="function" + self.sort_marker("function"))
+
+    def sort_marker(self, column):
+        if column != self.sort_column:
+            return ""
+        return " ▼" if self.sort_reverse else " ▲"
+
+    def fill_related(self, tree, entries):
+        tree.delete(*tree.get_children())
+        for key, (cc, nc, tt, ct) in sorted(entries.items(), key=lambda e: e[1][3], reverse=True):
+            item = tree.insert("", tk.END, text=function_label(key), values=self.row_values(cc, nc, tt, ct))
+            self.row_keys[item] = key
+
+    def on_select(self, event=None):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        key = self.row_keys[selection[0]]
+        for tree in (self.callers_tree, self.callees_tree):
+            for item in tree.get_children():
+                self.row_keys.pop(item, None)
+        self.fill_related(self.callers_tree, self.stats[key][4])
+        self.fill_related(self.callees_tree, self.callees.get(key, {}))
+
+    def on_related_double_click(self, event):
+        item = self.items.get(self.row_keys.get(event.widget.identify_row(event.y)))
+        if item is not None:
+            self.tree.selection_set(item)
+            self.tree.see(item)
+        return "break"
+
+    def on_double_click(self, event):
+        key = self.row_keys.get(self.tree.identify_row(event.y))
+        if key is None:
+            return
+        filename, line, _ = key
+        if line > 0 and os.path.isfile(filename):
+            self.open_callback(filename, line)
@@ -0,0 +1,300 @@
+import os
+import re
+import queue
+import fnmatch
+import threading
+import tkinter as tk
+from file_watcher import MODIFIED
+
+# Always hidden, whatever the project's .gitignore says
+DEFAULT_IGNORE_PATTERNS = [
+    ".git/", ".hg/", ".svn/", "__pycache__/", "*.py[cod]",
+    ".mypy_cache/", ".pytest_cache/", ".ruff_cache/", ".tox/", ".nox/",
+    "node_modules/", ".venv/", "venv/", "*.egg-info/",
+]
+
+
+class IgnoreRules:
+    """Subset of .gitignore matching used to hide entries in the project tree
+
+    Supports comments, negation (!), directory-only patterns (trailing /),
+    anchored patterns (containing /) and the usual glob wildcards. The last
+    matching pattern wins, as in git.
+    """
+
+    def __init__(self, patterns=None):
+        self.rules = []
+        for pattern in patterns or []:
+            self.add(pattern)
+
+    @classmethod
+    def from_directory(cls, root):
+        """Build rules from the defaults plus root/.gitignore if present"""
+        rules = cls(DEFAULT_IGNORE_PATTERNS)
+        try:
+            with open(os.path.join(root, ".gitignore"), "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    rules.add(line)
+        except OSError:
+            pass
+        return rules
+
+    def add(self, pattern):
+        pattern = pattern.rstrip("\n").rstrip()
+        if not pattern or pattern.startswith("#"):
+            return
+
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if pattern.startswith("**/"):
+            pattern = pattern[3:]
+            anchored = "/" in pattern
+        if not pattern:
+            return
+
+        regex = re.compile(fnmatch.translate(pattern))
+        self.rules.append((regex, negate, dir_only, anchored))
+
+    def is_ignored(self, rel_path, is_dir):
+        """Check a path relative to the project root (using / separators)"""
+        name = rel_path.rsplit("/", 1)[-1]
+        for regex, negate, dir_only, anchored in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path if anchored else name):
+                return not negate
+        return False
+
+
+class DirectoryLister:
+    """Lists directories with os.scandir on a worker thread
+
+    Listings are cached together with the directory's modification time,
+    so re-expanding a folder that has not changed costs a single stat.
+    Results are collected with get_results() from the Tk event loop.
+    """
+
+    def __init__(self, rules=None):
+        self.root = None
+        self.rules = rules or IgnoreRules()
+        self.cache = {}
+        self._requests = queue.Queue()
+        self._pending = set()
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="DirectoryLister", daemon=True)
+        self._thread.start()
+
+    def set_root(self, root, rules=None):
+        with self._lock:
+            self.root = root
+            self.rules = rules or IgnoreRules.from_directory(root)
+            self.cache.clear()
+
+    def request(self, directory):
+        """Queue a listing; duplicate requests for the same directory merge"""
+        with self._lock:
+            if directory in self._pending:
+                return
+            self._pending.add(directory)
+        self._requests.put(directory)
+
+    def invalidate(self, directory):
+        with self._lock:
+            self.cache.pop(directory, None)
+
+    def get_results(self):
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def list_directory(self, directory):
+        """Return sorted (name, is_dir) pairs for a directory, using the cache"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self.cache.get(directory)
+            root, rules = self.root, self.rules
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        rel_dir = os.path.relpath(directory, root).replace(os.sep, "/") if root else ""
+        prefix = "" if rel_dir in (".", "") else rel_dir + "/"
+
+        entries = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not rules.is_ignored(prefix + entry.name, is_dir):
+                        entries.append((entry.name, is_dir))
+        except OSError:
+            return None
+
+        # Folders first, then case-insensitive by name
+        entries.sort(key=lambda e: (not e[1], e[0].lower()))
+
+        with self._lock:
+            self.cache[directory] = (mtime, entries)
+        return entries
+
+    def _run(self):
+        while True:
+            directory = self._requests.get()
+            with self._lock:
+                self._pending.discard(directory)
+            entries = self.list_directory(directory)
+            self._results.put((directory, entries))
+
+
+class ProjectTree:
+    """Drives a ttk.Treeview that shows the project directory lazily
+
+    Folders are only listed when they are expanded, listings run on a
+    worker thread, and large folders are inserted in batches so the UI
+    keeps responding. File system events update the tree in place.
+    """
+
+    LOADING = "::loading"
+    BATCH_SIZE = 500
+
+    def __init__(self, tree, open_callback, watcher=None):
+        self.tree = tree
+        self.open_callback = open_callback
+        self.watcher = watcher
+        self.root = None
+        self.loaded = set()
+        self.lister = DirectoryLister()
+
+        self.tree.bind("<<TreeviewOpen>>", self.on_open)
+        self.tree.bind("<Double-1>", self.on_double_click)
+        self.tree.after(30, self._pump)
+
+    def set_root(self, root):
+        """Show a new project directory"""
+        self.root = os.path.abspath(root)
+        for directory in self.loaded:
+            if self.watcher and directory != self.root:
+                self.watcher.unwatch_directory(directory)
+        self.loaded.clear()
+
+        self.tree.delete(*self.tree.get_children(""))
+        self.tree.heading("#0", text=os.path.basename(self.root) or self.root, anchor=tk.W)
+        self.lister.set_root(self.root)
+        self.lister.request(self.root)
+
+    def _iid(self, path):
+        return "" if path == self.root else path
+
+    def on_open(self, event=None):
+        """Load a folder's children the first time it is expanded"""
+        iid = self.tree.focus()
+        if iid and "directory" in self.tree.item(iid, "tags") and iid not in self.loaded:
+            self.lister.request(iid)
+
+    def on_double_click(self, event):
+        iid = self.tree.identify_row(event.y)
+        if iid and "file" in self.tree.item(iid, "tags"):
+            self.open_callback(iid)
+
+    def handle_event(self, kind, path):
+        """Update the tree for a file watcher event"""
+        if self.root is None or (kind == MODIFIED and not os.path.isdir(path)):
+            # Content changes do not affect the listing
+            return
+        parent = os.path.dirname(path)
+        if path in self.loaded:
+            if os.path.isdir(path):
+                # A rescan of a loaded folder refreshes its own listing too
+                self.lister.invalidate(path)
+                self.lister.request(path)
+            else:
+                self._forget_directory(path)
+        if parent in self.loaded:
+            self.lister.invalidate(parent)
+            self.lister.request(parent)
+
+    def _forget_directory(self, directory):
+        prefix = directory + os.sep
+        for loaded in [d for d in self.loaded if d == directory or d.startswith(prefix)]:
+            self.loaded.discard(loaded)
+            if self.watcher:
+                self.watcher.unwatch_directory(loaded)
+
+    def _pump(self):
+        try:
+            for directory, entries in self.lister.get_results():
+                self._apply_listing(directory, entries)
+        except tk.TclError:
+            return  # Tree destroyed
+        except Exception as e:
+            print(f"Error updating project tree: {e}")
+        self.tree.after(30, self._pump)
+
+    def _apply_listing(self, directory, entries):
+        iid = self._iid(directory)
+        if iid and not self.tree.exists(iid):
+            return
+        if entries is None:
+            if iid:
+                self.tree.delete(iid)
+                self._forget_directory(directory)
+            return
+
+        if directory not in self.loaded:
+            self.loaded.add(directory)
+            if self.watcher:
+                self.watcher.watch_directory(directory)
+
+        placeholder = iid + self.LOADING
+        if self.tree.exists(placeholder):
+            self.tree.delete(placeholder)
+
+        wanted = [(os.path.join(directory, name), name, is_dir) for name, is_dir in entries]
+        wanted_paths = {path for path, _, _ in wanted}
+
+        # Remove entries that disappeared
+        stale = [child for child in self.tree.get_children(iid) if child not in wanted_paths]
+        for child in stale:
+            self._forget_directory(child)
+        if stale:
+            self.tree.delete(*stale)
+
+        # The remaining children are already in sorted order, so inserting
+        # the missing entries in order, each at its index in the listing,
+        # places them without touching their siblings
+        missing = [(index, entry) for index, entry in enumerate(wanted) if not self.tree.exists(entry[0])]
+        if not missing:
+            return
+        self._insert_batch(iid, missing, 0)
+
+    def _insert_batch(self, iid, entries, start):
+        if iid and not self.tree.exists(iid):
+            return
+        for index, (path, name, is_dir) in entries[start:start + self.BATCH_SIZE]:
+            if self.tree.exists(path):
+                continue
+            if is_dir:
+                self.tree.insert(iid, index, iid=path, text=name, tags=("directory",))
+                self.tree.insert(path, "end", iid=path + self.LOADING, text="Loading...")
+            else:
+                self.tree.insert(iid, index, iid=path, text=name, tags=("file",))
+
+        start += self.BATCH_SIZE
+        if start < len(entries):
+            self.tree.after(1, self._insert_batch, iid, entries, start)
@@ -0,0 +1,392 @@
+import os
+import re
+import itertools
+import threading
+import tkinter as tk
+from tkinter import ttk
+from file_watcher import CREATED, DELETED, RESCAN, inotify_watch_limit
+from project_explorer import IgnoreRules
+
+# Characters after which a match counts as the start of a word
+WORD_SEPARATORS = "/\\_-. "
+
+
+def subsequence_pattern(query, in_name=False):
+    """Compile a regex that matches when query is a subsequence of a path
+
+    Each gap uses a negated character class ([^\\nb]*b) so the engine finds
+    the leftmost match without backtracking. With in_name, the match must
+    lie in the file name (after the last "/").
+    """
+    gap = "[^\n/%s]*%s" if in_name else "[^\n%s]*%s"
+    parts = [re.escape(query[0])]
+    for ch in query[1:]:
+        parts.append(gap % (re.escape(ch), re.escape(ch)))
+    if in_name:
+        parts.append("[^/]*$")
+    return re.compile("".join(parts))
+
+
+def fuzzy_score(query, path):
+    """Score a lowercase path against a lowercase query (higher is better)
+
+    Returns None when query is not a subsequence of path. Matches inside the
+    file name, at word starts and in consecutive runs score higher; long
+    paths and big gaps score lower.
+    """
+    base_start = path.rfind("/") + 1
+
+    # Prefer a match that lies entirely in the file name
+    for start in (base_start, 0):
+        pos = start
+        score = 20 if start == base_start else 0
+        last = -2
+        for ch in query:
+            found = path.find(ch, pos)
+            if found < 0:
+                break
+            if found == last + 1:
+                score += 8
+            else:
+                score -= min(found - pos, 10)
+            if found == 0 or path[found - 1] in WORD_SEPARATORS:
+                score += 6
+            if found >= base_start:
+                score += 3
+            last = found
+            pos = found + 1
+        else:
+            return score - len(path) // 8
+    return None
+
+
+class FileIndex:
+    """In-memory index of project file paths for fuzzy lookup
+
+    The index is built once on a background thread and then kept current
+    from file watcher events. Paths are kept lowercase and sorted by length.
+    Every match inside a file name is scored, so an exact name deep in the
+    tree still ranks first. Of the matches that span folders only the
+    shortest SCORE_LIMIT are, since they cannot beat a file name match.
+
+    With a watcher of its own, the index watches the folders it indexed,
+    so files created anywhere in the project are found, not only those in
+    folders the Solution Explorer has expanded. A folder that is created
+    or moved in is scanned into the index in the background. inotify
+    watches are shared by every program the user runs, so the index takes
+    at most a quarter of them, keeping the shallowest folders.
+    """
+
+    MAX_FILES = 500000
+    SCORE_LIMIT = 400
+    # Only one or two letter queries match this many file names
+    NAME_SCORE_LIMIT = 10000
+
+    def __init__(self, watcher=None):
+        self.root = None
+        self.watcher = watcher   # FileWatcher used only by the index, or None
+        self.max_watches = inotify_watch_limit() // 4 if watcher is not None else 0
+        self._watches_capped = False
+        self.rules = None
+        self.directories = set()  # absolute paths of the folders indexed
+        self.paths = []          # lowercase relative paths, shortest first
+        self.original = {}       # lowercase -> list of relative paths as on disk
+        self.ready = False
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._last_query = None
+        self._last_matches = None
+        self._last_name_matches = None
+
+    def build(self, root):
+        """Start indexing root in the background"""
+        self.root = os.path.abspath(root)
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self.ready = False
+        thread = threading.Thread(target=self._build, args=(self.root, generation),
+                                  name="FileIndex", daemon=True)
+        thread.start()
+
+    def _scan(self, prefix, top, rules, limit):
+        """Walk top; returns (relative file paths, directories walked)"""
+        found = []
+        directories = []
+        stack = [(prefix, top)]
+        while stack and len(found) < limit:
+            prefix, directory = stack.pop()
+            directories.append(directory)
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        rel = prefix + entry.name
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            continue
+                        if rules.is_ignored(rel, is_dir):
+                            continue
+                        if is_dir:
+                            stack.append((rel + "/", entry.path))
+                        else:
+                            found.append(rel)
+            except OSError:
+                continue
+        return found, directories
+
+    def _build(self, root, generation):
+        rules = IgnoreRules.from_directory(root)
+        found, directories = self._scan("", root, rules, self.MAX_FILES)
+
+        original = {}
+        for rel in found:
+            original.setdefault(rel.lower(), []).append(rel)
+        paths = sorted(original, key=lambda p: (len(p), p))
+
+        with self._lock:
+            if generation != self._generation:
+                return  # A newer build was started
+            self.paths = paths
+            self.original = original
+            self.rules = rules
+            self.directories = set(directories)
+            self.ready = True
+            self._last_query = None
+            self._last_matches = None
+        self._watch(directories)
+
+    def _add_tree(self, directory, generation):
+        """Index a folder that appeared after the build"""
+        rel = self._relative(directory)
+        if rel is None or rel == "." or self.rules.is_ignored(rel, True):
+            return
+        found, directories = self._scan(rel + "/", directory, self.rules, self.MAX_FILES)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self.directories.update(directories)
+            watched = set(self.directories)
+        for rel in found:
+            self.add(os.path.join(self.root, rel))
+        self._watch(watched)
+
+    def _watch(self, directories):
+        """Have the watcher watch directories, or the max_watches shallowest of them"""
+        if self.watcher is None:
+            return
+        capped = len(directories) > self.max_watches
+        if capped:
+            total = len(directories)
+            directories = sorted(directories, key=lambda d: d.count(os.sep))[:self.max_watches]
+            if not self._watches_capped:
+                print(f"Go to File watches {self.max_watches} of {total} project folders; "
+                      "files created deeper show up once their folder is expanded")
+        self._watches_capped = capped
+        self.watcher.set_directories(directories)
+
+    def _relative(self, path):
+        rel = os.path.relpath(path, self.root)
+        if rel.startswith(".."):
+            return None
+        return rel.replace(os.sep, "/")
+
+    def add(self, path):
+        rel = self._relative(path)
+        if rel is None or os.path.isdir(path):
+            return
+        key = rel.lower()
+        with self._lock:
+            variants = self.original.setdefault(key, [])
+            if rel in variants:
+                return
+            variants.append(rel)
+            if len(variants) == 1:
+                self._insert_sorted(key)
+            self._last_query = None
+
+    def _position(self, key):
+        # Binary search on (length, path), the order used by _build
+        target = (len(key), key)
+        lo, hi = 0, len(self.paths)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (len(self.paths[mid]), self.paths[mid]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _insert_sorted(self, key):
+        self.paths.insert(self._position(key), key)
+
+    def remove(self, path):
+        rel = self._relative(path)
+        if rel is None:
+            return
+        key = rel.lower()
+        with self._lock:
+            variants = self.original.get(key)
+            if not variants or rel not in variants:
+                return
+            variants.remove(rel)
+            if not variants:
+                del self.original[key]
+                del self.paths[self._position(key)]
+            self._last_query = None
+
+    def remove_tree(self, directory):
+        """Drop every indexed file below a deleted folder"""
+        rel = self._relative(directory)
+        if rel is None or rel == ".":
+            return
+        prefix = rel.lower() + "/"
+        with self._lock:
+            if directory not in self.directories:
+                return
+            below = directory + os.sep
+            self.directories = {d for d in self.directories if d != directory and not d.startswith(below)}
+            watched = set(self.directories)
+            gone = [key for key in self.original if key.startswith(prefix)]
+            for key in gone:
+                variants = self.original[key]
+                variants[:] = [v for v in variants if not v.startswith(rel + "/")]
+                if not variants:
+                    del self.original[key]
+            if gone:
+                self.paths = [key for key in self.paths if key in self.original]
+                self._last_query = None
+        self._watch(watched)
+
+    def handle_event(self, kind, path):
+        """Keep the index current from a file watcher event"""
+        if self.root is None:
+            return
+        if kind == CREATED:
+            if os.path.isdir(path):
+                if self.ready:
+                    threading.Thread(target=self._add_tree, args=(path, self._generation),
+                                     name="FileIndex", daemon=True).start()
+            else:
+                self.add(path)
+        elif kind == DELETED:
+            self.remove(path)
+            # Only does anything if path was an indexed folder
+            self.remove_tree(path)
+        elif kind == RESCAN and path == self.root:
+            self.build(self.root)
+
+    def search(self, query, limit=50):
+        """Return up to limit absolute paths ranked by fuzzy score"""
+        query = query.strip().lower().replace("\\", "/")
+        if not query:
+            return []
+
+        with self._lock:
+            # Narrow the previous result set when the query was extended
+            if self._last_query and query.startswith(self._last_query):
+                candidates = self._last_matches
+                name_candidates = self._last_name_matches
+            else:
+                candidates = self.paths
+                name_candidates = None
+            matches = list(filter(subsequence_pattern(query).search, candidates))
+            name_pattern = subsequence_pattern(query, in_name=True)
+            in_name = list(filter(name_pattern.search, matches if name_candidates is None else name_candidates))
+            self._last_query = query
+            self._last_matches = matches
+            self._last_name_matches = in_name
+            original = self.original
+
+        across = itertools.islice(itertools.filterfalse(name_pattern.search, matches), self.SCORE_LIMIT)
+        scored = []
+        for path in itertools.chain(in_name[:self.NAME_SCORE_LIMIT], across):
+            score = fuzzy_score(query, path)
+            if score is not None:
+                scored.append((-score, len(path), path))
+        scored.sort()
+
+        results = []
+        for _, _, key in scored:
+            for rel in original.get(key, ()):
+                results.append(os.path.join(self.root, rel.replace("/", os.sep)))
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+
+class QuickOpenDialog(tk.Toplevel):
+    """Ctrl+P "Go to File" palette"""
+
+    def __init__(self, parent, index, callback):
+        super().__init__(parent)
+        self.index = index
+        self.callback = callback
+        self.results = []
+
+        self.title("Go to File")
+        self.transient(parent)
+        self.resizable(False, False)
+
+        # Position near the top of the main window
+        parent.update_idletasks()
+        width = 600
+        x = parent.winfo_rootx() + max((parent.winfo_width() - width) // 2, 0)
+        y = parent.winfo_rooty() + 60
+        self.geometry(f"{width}x360+{x}+{y}")
+
+        self.query_var = tk.StringVar()
+        self.query_var.trace("w", self.on_query_changed)
+        self.entry = ttk.Entry(self, textvariable=self.query_var)
+        self.entry.pack(fill=tk.X, padx=5, pady=5)
+
+        self.listbox = tk.Listbox(self, activestyle="none", selectmode=tk.SINGLE)
+        self.listbox.pack(fill=tk.BOTH, expand=True, padx=5)
+
+        self.status = ttk.Label(self, text="" if index.ready else "Indexing project files...")
+        self.status.pack(fill=tk.X, padx=5, pady=(2, 5))
+
+        self.entry.bind("<Down>", lambda e: self.move_selection(1))
+        self.entry.bind("<Up>", lambda e: self.move_selection(-1))
+        self.entry.bind("<Return>", self.on_accept)
+        self.listbox.bind("<Double-1>", self.on_accept)
+        self.bind("<Escape>", lambda e: self.destroy())
+
+        self.entry.focus_set()
+        self.grab_set()
+
+    def on_query_changed(self, *args):
+        self.results = self.index.search(self.query_var.get())
+
+        self.listbox.delete(0, tk.END)
+        root = self.index.root
+        for path in self.results:
+            rel_dir = os.path.relpath(os.path.dirname(path), root)
+            location = "" if rel_dir == "." else f"    {rel_dir}"
+            self.listbox.insert(tk.END, os.path.basename(path) + location)
+        if self.results:
+            self.listbox.selection_set(0)
+
+        if not self.index.ready:
+            self.status.config(text="Indexing project files...")
+        else:
+            self.status.config(text=f"{len(self.results)} result(s)")
+
+    def move_selection(self, delta):
+        if not self.results:
+            return "break"
+        current = self.listbox.curselection()
+        index = (current[0] if current else -1) + delta
+        index = max(0, min(index, len(self.results) - 1))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+
+    def on_accept(self, event=None):
+        current = self.listbox.curselection()
+        if current and current[0] < len(self.results):
+            path = self.results[current[0]]
+            self.destroy()
+            self.callback(path)
+        return "break"
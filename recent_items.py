@@ -0,0 +1,71 @@
+import os
+import json
+import time
+
+
+class RecentItemsStore:
+    """Persistent most-recently-used list of files and projects
+
+    Stored in preferences/recent.json as:
+        {"files": [[path, timestamp], ...], "projects": [[path, timestamp], ...]}
+    newest first. Nothing here touches the listed paths, so loading the
+    store is instant even when some entries live on unreachable drives.
+    """
+
+    MAX_ITEMS = 15
+
+    def __init__(self, path=os.path.join("preferences", "recent.json")):
+        self.path = path
+        self.items = {"files": [], "projects": []}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for kind in self.items:
+                self.items[kind] = [list(entry) for entry in data.get(kind, [])][:self.MAX_ITEMS]
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def save(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.items, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"Could not save recent items: {e}")
+
+    def _add(self, kind, paths):
+        """Move paths to the front, the last one newest, and save once"""
+        now = int(time.time())
+        entries = self.items[kind]
+        for path in paths:
+            path = os.path.abspath(path)
+            entries = [entry for entry in entries if entry[0] != path]
+            entries.insert(0, [path, now])
+        self.items[kind] = entries[:self.MAX_ITEMS]
+        self.save()
+
+    def add_file(self, path):
+        self._add("files", [path])
+
+    def add_files(self, paths):
+        if paths:
+            self._add("files", paths)
+
+    def add_project(self, path):
+        self._add("projects", [path])
+
+    def remove(self, path):
+        for kind in self.items:
+            self.items[kind] = [entry for entry in self.items[kind] if entry[0] != path]
+        self.save()
+
+    def files(self):
+        return [entry[0] for entry in self.items["files"]]
+
+    def projects(self):
+        return [entry[0] for entry in self.items["projects"]]
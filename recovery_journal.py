@@ -0,0 +1,182 @@
+import os
+import sys
+import json
+import glob
+from app_paths import user_cache_dir
+
+JOURNAL_SUFFIX = ".journal"
+
+
+def pid_exists(pid):
+    """Check whether a process is still running"""
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":
+        # os.kill() would terminate the process on Windows
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _common_prefix_length(a, b):
+    # Binary search with slice comparisons, which run in C
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a, b, limit):
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def compute_delta(old, new):
+    """Return (start, end, text) such that old[:start] + text + old[end:] == new"""
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
+
+
+class RecoveryJournal:
+    """Append-only journal of unsaved editor buffers for crash recovery
+
+    Each session writes one file of JSON lines to the user cache directory:
+
+        ["s", key, filepath, text]         full snapshot of a buffer
+        ["d", key, start, end, text]       replace text[start:end] of a buffer
+        ["x", key]                         buffer saved or closed, forget it
+
+    Only the changed span of a buffer is written on each update, so typing
+    in a large file costs a few bytes of I/O. When the file grows past
+    COMPACT_BYTES it is rewritten as one snapshot per dirty buffer. A clean
+    exit deletes the journal; a journal left by a process that is no longer
+    running means the IDE crashed and its buffers can be replayed.
+    """
+
+    COMPACT_BYTES = 256 * 1024
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.join(user_cache_dir(), "recovery")
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, f"session-{os.getpid()}{JOURNAL_SUFFIX}")
+        self.buffers = {}  # key -> [filepath, text] as last journaled
+        self._file = None
+        self._size = 0
+
+    def _append(self, entry):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        self._file.write(line)
+        self._file.flush()
+        self._size += len(line)
+
+    def record(self, key, filepath, text):
+        """Journal the current text of a dirty buffer"""
+        previous = self.buffers.get(key)
+        if previous is None or previous[0] != filepath:
+            self._append(["s", key, filepath, text])
+        else:
+            if previous[1] == text:
+                return
+            start, end, new_text = compute_delta(previous[1], text)
+            self._append(["d", key, start, end, new_text])
+        self.buffers[key] = [filepath, text]
+
+        if self._size > self.COMPACT_BYTES:
+            self.compact()
+
+    def discard(self, key):
+        """Forget a buffer that was saved or closed"""
+        if self.buffers.pop(key, None) is not None:
+            self._append(["x", key])
+
+    def compact(self):
+        """Rewrite the journal as one snapshot per dirty buffer"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        tmp_path = self.path + ".tmp"
+        size = 0
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, (filepath, text) in self.buffers.items():
+                line = json.dumps(["s", key, filepath, text], separators=(",", ":")) + "\n"
+                f.write(line)
+                size += len(line)
+        os.replace(tmp_path, self.path)
+        self._size = size
+
+    def close(self, clean=True):
+        """Close the journal; a clean shutdown removes it"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if clean:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def replay(path):
+        """Rebuild {key: (filepath, text)} from a journal file
+
+        A truncated last line (the crash happened mid-write) is ignored.
+        """
+        buffers = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    op, key = entry[0], entry[1]
+                    if op == "s":
+                        buffers[key] = [entry[2], entry[3]]
+                    elif op == "d" and key in buffers:
+                        start, end, text = entry[2], entry[3], entry[4]
+                        old = buffers[key][1]
+                        buffers[key][1] = old[:start] + text + old[end:]
+                    elif op == "x":
+                        buffers.pop(key, None)
+        except OSError:
+            return {}
+        return {key: tuple(value) for key, value in buffers.items()}
+
+    def find_orphans(self):
+        """Return journals left behind by sessions that are no longer running"""
+        orphans = []
+        for path in glob.glob(os.path.join(self.directory, "session-*" + JOURNAL_SUFFIX)):
+            if path == self.path:
+                continue
+            try:
+                pid = int(os.path.basename(path)[len("session-"):-len(JOURNAL_SUFFIX)])
+            except ValueError:
+                continue
+            if not pid_exists(pid):
+                orphans.append(path)
+        return orphans
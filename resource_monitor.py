@@ -0,0 +1,106 @@
+import os
+import time
+from collections import deque
+import tkinter as tk
+from memory_profiler import format_size
+
+# Sampling reads /proc, so it is only available on Linux
+MONITOR_AVAILABLE = os.path.isdir("/proc/self/fd")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if MONITOR_AVAILABLE else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if MONITOR_AVAILABLE else 4096
+
+
+def read_proc(pid):
+    """Return (CPU seconds, RSS bytes, threads, open FDs) of a process, or None if it is gone"""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        fds = len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        return None
+    # The command name in parentheses may contain spaces; fields start after it
+    fields = stat[stat.rfind(b")") + 2:].split()
+    cpu = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS  # utime + stime
+    return cpu, int(fields[21]) * PAGE_SIZE, int(fields[17]), fds
+
+
+class ResourceMonitor:
+    """Samples a child process's CPU, memory, threads and file descriptors
+
+    sample() is cheap to call often (the run pump calls it every frame);
+    it only reads /proc once every INTERVAL seconds. CPU is a percentage
+    of one core over the last interval, so a busy multi-threaded program
+    can exceed 100%. The last HISTORY samples are kept for the sparkline,
+    and the peaks for the whole run.
+    """
+
+    INTERVAL = 0.5
+    HISTORY = 120
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.latest = None   # {"cpu", "rss", "threads", "fds"}
+        self.peaks = {"cpu": 0.0, "rss": 0, "threads": 0, "fds": 0}
+        self.history = deque(maxlen=self.HISTORY)  # (cpu, rss) pairs
+        self._last_time = None
+        self._last_cpu = None
+
+    def sample(self):
+        """Take a sample if one is due; returns True if it did"""
+        now = time.monotonic()
+        if self._last_time is not None and now - self._last_time < self.INTERVAL:
+            return False
+        reading = read_proc(self.pid)
+        if reading is None:
+            return False
+        cpu_seconds, rss, threads, fds = reading
+
+        cpu = 0.0
+        if self._last_time is not None:
+            cpu = max(0.0, (cpu_seconds - self._last_cpu) / (now - self._last_time) * 100)
+        self._last_time, self._last_cpu = now, cpu_seconds
+
+        self.latest = {"cpu": cpu, "rss": rss, "threads": threads, "fds": fds}
+        for name, value in self.latest.items():
+            self.peaks[name] = max(self.peaks[name], value)
+        self.history.append((cpu, rss))
+        return True
+
+    def describe(self):
+        latest = self.latest
+        return (f"CPU {latest['cpu']:.0f}%  RSS {format_size(latest['rss'])}  "
+                f"threads {latest['threads']}  FDs {latest['fds']}")
+
+    def describe_peaks(self):
+        peaks = self.peaks
+        return (f"Peak CPU {peaks['cpu']:.0f}%, peak RSS {format_size(peaks['rss'])}, "
+                f"max threads {peaks['threads']}, max open FDs {peaks['fds']}.")
+
+
+class Sparkline(tk.Canvas):
+    """Tiny chart of a monitor's history: RSS as a filled area, CPU as a line"""
+
+    def __init__(self, master, width=120, height=18, **kw):
+        super().__init__(master, width=width, height=height, highlightthickness=0,
+                         background="#FFFFFF", **kw)
+        self.size = (width, height)
+
+    def show(self, history):
+        self.delete("all")
+        if len(history) < 2:
+            return
+        width, height = self.size
+        step = width / (ResourceMonitor.HISTORY - 1)
+        start = width - step * (len(history) - 1)
+        top_rss = max(rss for _, rss in history) or 1
+        top_cpu = max(100.0, max(cpu for cpu, _ in history))
+
+        area = [start, height]
+        line = []
+        for index, (cpu, rss) in enumerate(history):
+            x = start + index * step
+            area += [x, height - 1 - (height - 2) * rss / top_rss]
+            line += [x, height - 1 - (height - 2) * cpu / top_cpu]
+        area += [width, height]
+        self.create_polygon(area, fill="#C8DCF0", outline="")
+        self.create_line(line, fill="#C00000")
@@ -0,0 +1,167 @@
+import os
+import json
+import shlex
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+# Project settings live in this directory under the project root
+PROJECT_SETTINGS_DIR = ".tkinterstudio"
+
+DEFAULT_CONFIG = {
+    "args": "",          # Command line arguments, split with shell rules
+    "cwd": "",           # Working directory, relative to the project; "" = the IDE's
+    "interpreter": "",   # "" = the interpreter selected in Build > Select Interpreter
+    "env": {},           # Extra environment variables
+    "unbuffered": True,  # Python flushes output line by line instead of in 8 KiB bursts
+}
+
+
+def parse_env(text):
+    """Parse KEY=VALUE lines into a dict; raises ValueError on a bad line"""
+    env = {}
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"Line {number} is not KEY=VALUE: {line}")
+        env[key] = value.strip()
+    return env
+
+
+def format_env(env):
+    return "".join(f"{key}={value}\n" for key, value in env.items())
+
+
+class RunConfigStore:
+    """Run configurations of a project's files
+
+    Stored in .tkinterstudio/run_configs.json in the project directory so
+    they can be shared with the project, keyed by file path relative to
+    the project (with forward slashes). Files without a configuration, or
+    whose configuration is all defaults, have no entry.
+    """
+
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+        self.path = os.path.join(project_dir, PROJECT_SETTINGS_DIR, "run_configs.json")
+        self.configs = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.configs = data
+        except (OSError, ValueError):
+            pass
+
+    def key(self, filepath):
+        return os.path.relpath(os.path.abspath(filepath), self.project_dir).replace(os.sep, "/")
+
+    def get(self, filepath):
+        """Return the file's configuration, with defaults for missing keys"""
+        return dict(DEFAULT_CONFIG, **self.configs.get(self.key(filepath), {}))
+
+    def set(self, filepath, config):
+        key = self.key(filepath)
+        changed = {name: value for name, value in config.items()
+                   if name in DEFAULT_CONFIG and value != DEFAULT_CONFIG[name]}
+        if changed:
+            self.configs[key] = changed
+        else:
+            self.configs.pop(key, None)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.configs, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not save run configurations: {e}")
+
+    def resolve_cwd(self, config):
+        """Return the absolute working directory of a configuration, or None"""
+        if not config["cwd"]:
+            return None
+        return os.path.normpath(os.path.join(self.project_dir, config["cwd"]))
+
+    @staticmethod
+    def environment(config):
+        """Return the environment for a run, or None to inherit the IDE's"""
+        if not config["env"] and config["unbuffered"]:
+            return None
+        env = dict(os.environ, **config["env"])
+        if not config["unbuffered"]:
+            # An empty value turns buffering back on; the runner only
+            # sets PYTHONUNBUFFERED when it is absent
+            env["PYTHONUNBUFFERED"] = ""
+        return env
+
+
+class RunConfigDialog(tk.Toplevel):
+    """Edits the run configuration of one file"""
+
+    def __init__(self, parent, filename, config, project_dir, interpreters, callback):
+        super().__init__(parent)
+        self.callback = callback
+        self.project_dir = project_dir
+        self.title(f"Run Configuration - {filename}")
+        self.transient(parent)
+        self.columnconfigure(1, weight=1)
+
+        self.args_var = tk.StringVar(value=config["args"])
+        self.cwd_var = tk.StringVar(value=config["cwd"])
+        self.interpreter_var = tk.StringVar(value=config["interpreter"])
+        self.unbuffered_var = tk.BooleanVar(value=config["unbuffered"])
+
+        ttk.Label(self, text="Arguments:").grid(row=0, column=0, sticky=tk.W, padx=10, pady=(10, 2))
+        ttk.Entry(self, textvariable=self.args_var, width=50).grid(row=0, column=1, columnspan=2, sticky=tk.EW,
+                                                                  padx=(0, 10), pady=(10, 2))
+
+        ttk.Label(self, text="Working directory:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=2)
+        ttk.Entry(self, textvariable=self.cwd_var).grid(row=1, column=1, sticky=tk.EW, pady=2)
+        ttk.Button(self, text="Browse...", command=self.browse_cwd).grid(row=1, column=2, padx=10, pady=2)
+
+        ttk.Label(self, text="Interpreter:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=2)
+        ttk.Combobox(self, textvariable=self.interpreter_var, values=[""] + list(interpreters)).grid(
+            row=2, column=1, columnspan=2, sticky=tk.EW, padx=(0, 10), pady=2)
+
+        ttk.Label(self, text="Environment\n(KEY=VALUE):").grid(row=3, column=0, sticky=tk.NW, padx=10, pady=2)
+        self.env_text = tk.Text(self, width=50, height=6)
+        self.env_text.grid(row=3, column=1, columnspan=2, sticky=tk.NSEW, padx=(0, 10), pady=2)
+        self.env_text.insert("1.0", format_env(config["env"]))
+        self.rowconfigure(3, weight=1)
+
+        ttk.Checkbutton(self, text="Unbuffered output (show output as soon as it is printed)",
+                        variable=self.unbuffered_var).grid(row=4, column=1, columnspan=2, sticky=tk.W, pady=2)
+
+        buttons = ttk.Frame(self)
+        buttons.grid(row=5, column=0, columnspan=3, sticky=tk.E, padx=10, pady=10)
+        ttk.Button(buttons, text="OK", command=self.on_ok).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Cancel", command=self.destroy).pack(side=tk.LEFT)
+
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.grab_set()
+
+    def browse_cwd(self):
+        directory = filedialog.askdirectory(parent=self, title="Working Directory", initialdir=self.project_dir)
+        if directory:
+            self.cwd_var.set(os.path.relpath(directory, self.project_dir))
+
+    def on_ok(self):
+        try:
+            shlex.split(self.args_var.get())
+            env = parse_env(self.env_text.get("1.0", "end-1c"))
+        except ValueError as e:
+            messagebox.showerror("Run Configuration", str(e), parent=self)
+            return
+        config = {
+            "args": self.args_var.get().strip(),
+            "cwd": self.cwd_var.get().strip(),
+            "interpreter": self.interpreter_var.get().strip(),
+            "env": env,
+            "unbuffered": bool(self.unbuffered_var.get()),
+        }
+        self.destroy()
+        self.callback(config)
@@ -0,0 +1,181 @@
+from process_runner import ProcessRunner, STDERR, EXIT
+from resource_monitor import ResourceMonitor, MONITOR_AVAILABLE
+
+
+class RunJob:
+    """One program run, streaming into its own OutputPanel
+
+    A job can be stopped and restarted any number of times; each start
+    clears the panel and launches a fresh ProcessRunner with the same
+    command. on_state_change(job) is called whenever the job starts or
+    exits, so the IDE can update tab titles and buttons, and on_exit(job)
+    after every exit, for run modes that collect results from disk.
+
+    input_text, if given, is written to the program's stdin. With a
+    WarmWorkerPool, each start first tries to take a pre-started worker
+    for the command's interpreter and only launches the command itself
+    when none is ready.
+
+    Programs read from stdin report their file as "<stdin>" in
+    tracebacks. When source_tab is set, those references are rewritten to
+    name the editor tab the code came from; line numbers already match
+    the tab because the buffer is sent unchanged.
+
+    An interactive job keeps the program's stdin open; send() writes to
+    it while the program runs.
+
+    Where /proc is available, the pump also samples the program's CPU,
+    memory, threads and open files into self.monitor, and the peaks are
+    reported with the exit code.
+    """
+
+    # Process output is moved into the panel at most this many lines per
+    # pump, every PUMP_MS milliseconds
+    BATCH_LINES = 2000
+    PUMP_MS = 30
+    # How long stop() waits for the process group to exit before killing it
+    KILL_AFTER_MS = 2000
+
+    def __init__(self, panel, title, command, cwd=None, env=None, on_state_change=None,
+                 input_text=None, pool=None, source_tab=None, on_exit=None, interactive=False):
+        self.panel = panel
+        self.title = title
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.on_state_change = on_state_change
+        self.on_exit = on_exit
+        self.input_text = input_text
+        self.pool = pool
+        self.source_tab = source_tab  # Editor tab whose buffer is sent as stdin
+        self.interactive = interactive
+        self.runner = None
+        self.monitor = None
+
+    @property
+    def running(self):
+        return self.runner is not None and self.runner.returncode is None
+
+    @property
+    def returncode(self):
+        return None if self.runner is None else self.runner.returncode
+
+    def start(self, clear=True):
+        """Clear the panel and start the command
+
+        With clear=False the earlier output stays, below a separator line.
+        """
+        if clear:
+            self.panel.clear()
+            self.panel.write(f"Running {self.title}...\n\n")
+        else:
+            self.panel.write(f"\n--- Restarted {self.title} ---\n\n")
+
+        runner = None
+        if self.pool is not None and self.env is None and not self.interactive:
+            runner = self.pool.take(self.command[0], self.cwd)
+        if runner is None:
+            runner = ProcessRunner(self.command, cwd=self.cwd, env=self.env,
+                                   stdin_pipe=self.input_text is not None or self.interactive)
+            try:
+                runner.start()
+            except OSError as e:
+                self.runner = runner
+                runner.returncode = 1
+                self._append([(STDERR, f"{e}\n")])
+                self.panel.write("\nProcess could not be started.\n", "error")
+                self._notify()
+                return
+
+        self.runner = runner
+        self.monitor = ResourceMonitor(runner.process.pid) if MONITOR_AVAILABLE else None
+        if self.input_text is not None:
+            runner.send_input(self.input_text)
+        self._pump(runner)
+        self._notify()
+
+    def stop(self):
+        """Stop the process group, killing it if it does not exit in time"""
+        runner = self.runner
+        if runner is None or not runner.running:
+            return
+        runner.stop()
+        self.panel.after(self.KILL_AFTER_MS, lambda: runner.stop(force=True))
+
+    def send(self, text):
+        """Write to an interactive job's stdin; returns False if it is not running"""
+        if not self.interactive or not self.running:
+            return False
+        self.runner.write_input(text)
+        return True
+
+    def restart(self):
+        if self.runner is not None and self.runner.running:
+            self.runner.stop(force=True)
+        self.start()
+
+    def close(self):
+        """Kill the process"""
+        if self.runner is not None:
+            self.runner.stop(force=True)
+        self.runner = None
+
+    @property
+    def stdin_name(self):
+        """Name shown instead of <stdin> in tracebacks"""
+        return f"<{self.title}>"
+
+    def _notify(self):
+        if self.on_state_change is not None:
+            self.on_state_change(self)
+
+    def _pump(self, runner):
+        """Move queued process output into the panel, one batch per frame"""
+        if runner is not self.runner:
+            return  # Restarted or closed, this output is no longer wanted
+
+        if self.monitor is not None:
+            self.monitor.sample()
+        items = runner.get_output(self.BATCH_LINES)
+        if items:
+            self._append(items)
+        if not items or items[-1][0] != EXIT:
+            self.panel.after(self.PUMP_MS, self._pump, runner)
+        else:
+            self._notify()
+            if self.on_exit is not None:
+                self.on_exit(self)
+
+    def _append(self, items):
+        """Insert (stream, text) items, merging runs from the same stream"""
+        panel = self.panel
+        # Only follow the output if the user has not scrolled up
+        follow = panel.yview()[1] >= 0.999
+
+        chunk = []
+        chunk_stream = None
+        for stream, text in items + [(None, None)]:
+            if stream != chunk_stream and chunk:
+                text_chunk = "".join(chunk)
+                if chunk_stream == STDERR:
+                    if self.source_tab is not None:
+                        text_chunk = text_chunk.replace('File "<stdin>"', f'File "{self.stdin_name}"')
+                    panel.write(text_chunk, "error", links=True)
+                else:
+                    panel.write(text_chunk)
+                chunk = []
+            chunk_stream = stream
+            if stream == EXIT:
+                elapsed = f" after {self.runner.elapsed:.2f} s" if self.runner.elapsed is not None else ""
+                if text == 0:
+                    panel.write(f"\nProcess completed successfully{elapsed}.\n")
+                else:
+                    panel.write(f"\nProcess exited with code {text}{elapsed}.\n", "error")
+                if self.monitor is not None and self.monitor.latest is not None:
+                    panel.write(self.monitor.describe_peaks() + "\n")
+            elif stream is not None:
+                chunk.append(text)
+
+        panel.flush_log()
+        if follow:
+            panel.see("end")
@@ -0,0 +1,49 @@
+import os
+import json
+
+SESSION_VERSION = 1
+
+
+class SessionStore:
+    """Reads and writes the IDE session (open tabs, panes, designer document)
+
+    The session is stored as compact JSON, with tabs and designer widgets as
+    positional arrays rather than objects, so a 40-tab session stays a few
+    kilobytes. Writes go to a temporary file first so a crash while saving
+    never leaves a truncated session behind.
+
+    Layout (version 1):
+        {"v": 1,
+         "geometry": "1200x800+10+10",
+         "panes": {"main": 250, "vertical": 500, "designer": 600},
+         "view": 0,                                   # 0 = Code, 1 = Design
+         "sel": 2,                                    # index of the selected tab
+         "tabs": [[path, insert_index, top_index], ...],
+         "design": {"form": [w, h],
+                    "widgets": [[type, name, x, y, w, h, properties], ...]}}
+    """
+
+    def __init__(self, path=os.path.join("preferences", "session.json")):
+        self.path = path
+
+    def load(self):
+        """Return the saved session dict, or None if there is none"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(session, dict) or session.get("v") != SESSION_VERSION:
+            return None
+        return session
+
+    def save(self, session):
+        session = dict(session, v=SESSION_VERSION)
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(session, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,62 @@
+"""Tests for the console's input handling"""
+
+import json
+import subprocess
+import sys
+
+from console import CONSOLE_SCRIPT, ConsolePanel, is_complete
+
+
+def test_is_complete():
+    assert is_complete("x = 1")
+    assert is_complete("print('hi')")
+    assert not is_complete("if x:")
+    assert not is_complete("for i in range(3):\n")
+    assert is_complete("def f():\n    return 1\n")
+    assert not is_complete("(1,\n 2")
+    # Invalid code counts as complete so the console can report it
+    assert is_complete("1 +* 2")
+
+
+def test_console_script_keeps_state_and_echoes_expressions():
+    inputs = ["x = 20", "x + 1", "def f():\n    return x * 2\n", "f()", "1 / 0", "x"]
+    result = subprocess.run([sys.executable, "-c", CONSOLE_SCRIPT], capture_output=True, text=True,
+                            input="".join(json.dumps(source) + "\n" for source in inputs), timeout=30)
+    assert result.stdout.split() == ["21", "40", "20"]
+    assert "ZeroDivisionError" in result.stderr
+    assert "<string>" not in result.stderr
+
+
+class FakeJob:
+    running = False
+
+    def __init__(self):
+        self.starts = []
+        self.sent = []
+
+    def start(self, clear=True):
+        self.starts.append(clear)
+        self.running = True
+
+    def send(self, text):
+        self.sent.append(text)
+
+
+class FakeOutput:
+    def __init__(self):
+        self.text = "Traceback ...\nSystemExit: died\n"
+
+    def write(self, text, tags=()):
+        self.text += text
+
+    def see(self, index):
+        pass
+
+
+def test_sending_to_a_dead_interpreter_restarts_it_without_clearing():
+    console = object.__new__(ConsolePanel)
+    console.__dict__.update(job=FakeJob(), output=FakeOutput(), history=[], history_index=0)
+    console.send("x = 1")
+    assert console.job.starts == [False]
+    assert console.output.text.startswith("Traceback ...\nSystemExit: died\n")
+    assert console.job.sent == [json.dumps("x = 1") + "\n"]
@@ -0,0 +1,82 @@
+"""Tests for choosing how a file is opened"""
+
+from file_viewers import (sniff_file, HexViewer, StreamingTextViewer, TEXT, BINARY, LARGE_TEXT,
+                          LARGE_TEXT_BYTES)
+
+
+def test_text_files(tmp_path):
+    path = tmp_path / "a.py"
+    path.write_text("print('hi')\n\tindented\r\n\x1b[0m colours\n", encoding="utf-8")
+    assert sniff_file(str(path)) == TEXT
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert sniff_file(str(empty)) == TEXT
+
+
+def test_binary_by_extension_nul_or_control_characters(tmp_path):
+    by_extension = tmp_path / "image.PNG"
+    by_extension.write_text("not really an image")
+    assert sniff_file(str(by_extension)) == BINARY
+
+    nul = tmp_path / "data"
+    nul.write_bytes(b"abc\0def")
+    assert sniff_file(str(nul)) == BINARY
+
+    control = tmp_path / "control"
+    control.write_bytes(bytes(range(1, 9)) * 10 + b"text")
+    assert sniff_file(str(control)) == BINARY
+
+
+def test_large_text(tmp_path):
+    path = tmp_path / "big.log"
+    path.write_bytes(b"line\n" * (LARGE_TEXT_BYTES // 5 + 1))
+    assert sniff_file(str(path)) == LARGE_TEXT
+
+
+class Label:
+    def config(self, **options):
+        pass
+
+
+def open_viewer(cls, path):
+    # The paging logic without the widgets, which need a display
+    viewer = object.__new__(cls)
+    viewer.__dict__.update(filepath=str(path), offset=0, end_offset=0, mm=None, size=0,
+                           info_label=Label(), file=open(path, "rb"))
+    viewer.map_file()
+    return viewer
+
+
+def test_hex_rows(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(40)))
+    viewer = open_viewer(HexViewer, path)
+    try:
+        assert viewer.clamp_offset(viewer.move_rows(0, 10)) == 32
+        lines = viewer.page_text(2).split("\n")
+        assert lines[0].startswith("00000000  00 01 02")
+        assert lines[1].startswith("00000010  10 11")
+        assert viewer.end_offset == 32
+    finally:
+        viewer.close()
+
+
+def test_truncated_file_is_remapped_before_reading(tmp_path):
+    path = tmp_path / "big.log"
+    path.write_bytes(b"".join(b"line %d\n" % i for i in range(10000)))
+    viewer = open_viewer(StreamingTextViewer, path)
+    try:
+        viewer.offset = viewer.clamp_offset(viewer.size - 100)
+        with open(path, "r+b") as f:
+            f.truncate(20)
+        viewer.check_size()
+        assert viewer.size == 20
+        assert viewer.offset == 14
+        assert viewer.page_text(5) == "line 2"
+
+        with open(path, "r+b") as f:
+            f.truncate(0)
+        viewer.check_size()
+        assert viewer.mm is None and viewer.size == 0 and viewer.offset == 0
+    finally:
+        viewer.close()
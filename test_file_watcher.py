@@ -0,0 +1,44 @@
+"""Tests for the file watcher's polling fallback"""
+
+import errno
+
+from file_watcher import CREATED, FileWatcher, InotifyBackend
+
+
+def test_directories_inotify_refuses_are_polled(tmp_path, capsys):
+    watcher = FileWatcher(poll_interval=0.05)
+    if not watcher.uses_inotify:
+        watcher.stop()
+        return  # Nothing to fall back from
+    try:
+        def refuse(directory):
+            watcher.backend.last_error = errno.ENOSPC
+            return False
+        watcher.backend.add = refuse
+        watcher.watch_directory(str(tmp_path))
+        watcher.watch_directory(str(tmp_path / "missing"))
+        assert "max_user_watches" in capsys.readouterr().out
+        assert str(tmp_path) in watcher.fallback.snapshots
+
+        watcher.start()
+        (tmp_path / "new.py").write_text("")
+        events = []
+        for _ in range(100):
+            events += watcher.get_events()
+            if events:
+                break
+            watcher._stop.wait(0.05)
+        assert (CREATED, str(tmp_path / "new.py")) in events
+    finally:
+        watcher.stop()
+
+
+def test_no_fallback_when_disabled(tmp_path):
+    watcher = FileWatcher(poll_fallback=False)
+    try:
+        if isinstance(watcher.backend, InotifyBackend):
+            watcher.backend.add = lambda directory: False
+        watcher.watch_directory(str(tmp_path))
+        assert watcher.fallback is None
+    finally:
+        watcher.stop()
@@ -0,0 +1,76 @@
+"""Tests for the live preview's design diffing"""
+
+import json
+
+from live_preview import LivePreview
+
+
+class FakeJob:
+    """Stands in for an interactive RunJob, recording what is sent"""
+
+    def __init__(self):
+        self.running = True
+        self.runner = object()
+        self.sent = []
+
+    def send(self, text):
+        self.sent.extend(json.loads(line) for line in text.splitlines())
+        return True
+
+
+def test_sync_sends_only_differences():
+    job = FakeJob()
+    preview = LivePreview(job)
+    design = {1: ("tk.Button", [10, 10, 80, 25], {"text": "OK"})}
+    preview.sync(design)
+    assert job.sent == [{"op": "create", "id": 1, "class": "tk.Button",
+                         "place": [10, 10, 80, 25], "props": {"text": "OK"}}]
+
+    job.sent.clear()
+    preview.sync(design)
+    assert job.sent == []
+
+    preview.sync({1: ("tk.Button", [20, 10, 80, 25], {"text": "Go", "bg": "red"})})
+    assert job.sent == [{"op": "place", "id": 1, "place": [20, 10, 80, 25]},
+                        {"op": "config", "id": 1, "props": {"text": "Go", "bg": "red"}}]
+
+
+def test_sync_replaces_widgets_whose_class_changed_and_deletes_removed_ones():
+    job = FakeJob()
+    preview = LivePreview(job)
+    preview.sync({1: ("tk.Label", [0, 0, 10, 10], {}), 2: ("tk.Entry", [0, 20, 10, 10], {})})
+    job.sent.clear()
+
+    preview.sync({1: ("ttk.Label", [0, 0, 10, 10], {})})
+    assert [patch["op"] for patch in job.sent] == ["delete", "delete", "create"]
+    assert {patch["id"] for patch in job.sent if patch["op"] == "delete"} == {1, 2}
+
+
+def test_sync_starts_over_for_a_new_process_and_skips_a_stopped_one():
+    job = FakeJob()
+    preview = LivePreview(job)
+    design = {1: ("tk.Button", [0, 0, 10, 10], {})}
+    preview.sync(design)
+
+    job.runner = object()  # Restarted
+    job.sent.clear()
+    preview.sync(design)
+    assert [patch["op"] for patch in job.sent] == ["create"]
+
+    job.running = False
+    job.sent.clear()
+    preview.sync({})
+    assert job.sent == []
+
+
+def test_sent_state_is_not_shared_with_the_design():
+    job = FakeJob()
+    preview = LivePreview(job)
+    place = [0, 0, 10, 10]
+    props = {"text": "a"}
+    preview.sync({1: ("tk.Button", place, props)})
+    place[0] = 5
+    props["text"] = "b"
+    job.sent.clear()
+    preview.sync({1: ("tk.Button", place, props)})
+    assert [patch["op"] for patch in job.sent] == ["place", "config"]
@@ -0,0 +1,102 @@
+"""Tests for the Output panel's line index and filter math
+
+Tk cannot be assumed here, so the panel's Text methods are replaced by
+stand-ins that record the tag ranges the filter would apply.
+"""
+
+import re
+
+from output_panel import ERROR_LINE, STDERR_LINE, WARNING_LINE, OutputPanel
+
+
+def make_panel(max_lines=10000):
+    panel = object.__new__(OutputPanel)
+    panel.__dict__.update(max_lines=max_lines, log_path=None, link_callback=None, line_count=1,
+                          trimmed_lines=0, _log_file=None, lines=[], line_flags=[], _line_open=False,
+                          filter=None, filter_callback=None, match_count=0, find_bar=None,
+                          _filter_pos=0, _filter_job=None)
+    panel.tags = {}
+    panel.current = ()
+    panel.index = lambda index: "1.0"
+    panel.insert = lambda *args: None
+    panel.delete = lambda *args: None
+    panel.see = lambda index: None
+    panel.after = lambda ms, func, *args: "after#1"
+    panel.after_cancel = lambda job: None
+    panel.tag_add = lambda tag, *ranges: panel.tags.setdefault(tag, []).extend(zip(ranges[::2], ranges[1::2]))
+    panel.tag_remove = lambda tag, *args: panel.tags.pop(tag, None)
+    panel.tag_ranges = lambda tag: panel.current if tag == "current_match" else ()
+    return panel
+
+
+def test_index_joins_partial_lines_and_classifies_them():
+    panel = make_panel()
+    panel.write("hello\nWARNING: careful\n")
+    panel.write("Traceback (most recent call last):\n  File \"a.py\", line 1\n", "error")
+    panel.write("ValueError: bad", "error")
+    panel.write("\nok par")
+    panel.write("tial\n")
+    assert panel.lines == ["hello", "WARNING: careful", "Traceback (most recent call last):",
+                           '  File "a.py", line 1', "ValueError: bad", "ok partial"]
+    assert panel.line_flags == [0, WARNING_LINE, STDERR_LINE | ERROR_LINE, STDERR_LINE | ERROR_LINE,
+                                STDERR_LINE | ERROR_LINE, 0]
+    assert not panel._line_open
+
+
+def test_filter_hides_ranges_and_highlights_matches():
+    panel = make_panel()
+    panel.write("one\ntwo\n")
+    panel.write("err two\n", "error")
+    panel.write("three\n")
+
+    panel.set_filter(re.compile("two"), only_matching=True)
+    assert panel.tags["hidden"] == [("1.0", "2.0"), ("4.0", "5.0")]
+    assert panel.tags["match"] == [("2.0", "2.3"), ("3.4", "3.7")]
+    assert panel.match_count == 2
+
+    panel.set_filter(stream="stdout")
+    assert panel.tags["hidden"] == [("3.0", "4.0")]
+    panel.set_filter(stream="stderr")
+    assert panel.tags["hidden"] == [("1.0", "3.0"), ("4.0", "5.0")]
+
+    panel.set_filter()
+    assert panel.filter is None and "hidden" not in panel.tags
+
+
+def test_streamed_lines_are_filtered_as_they_arrive():
+    panel = make_panel()
+    panel.set_filter(re.compile("x"), only_matching=True)
+    panel.write("x1\ny")
+    assert panel.tags["hidden"] == [("2.0", "3.0")]
+    panel.write("x\n")  # Completes "yx", which now matches
+    assert "hidden" not in panel.tags
+    assert panel.match_count == 2
+
+
+def test_trimming_keeps_the_index_in_step():
+    panel = make_panel(max_lines=100)
+    panel.set_filter(re.compile("7"))
+    for i in range(1000):
+        panel.write(f"line {i}\n")
+    assert len(panel.lines) == panel.line_count - 1
+    assert panel.lines[0] == f"line {panel.trimmed_lines}"
+    assert panel.match_count == sum(line.count("7") for line in panel.lines)
+    assert panel._first_line() == 2
+
+
+def test_find_next_wraps_and_skips_hidden_lines():
+    panel = make_panel()
+    panel.write("a b a\nno\na\n")
+    panel.set_filter(re.compile("a"))
+
+    def find(backwards=False):
+        assert panel.find_next(backwards)
+        panel.current = (panel.tags["current_match"][-1][0],)
+        return panel.current[0]
+
+    assert [find(), find(), find(), find()] == ["1.0", "1.4", "3.0", "1.0"]
+    assert find(backwards=True) == "3.0"
+
+    panel.set_filter(re.compile("a"), severity=ERROR_LINE)
+    panel.current = ()
+    assert not panel.find_next()
@@ -0,0 +1,53 @@
+"""Tests for the .gitignore subset used by the project tree"""
+
+from project_explorer import IgnoreRules, DEFAULT_IGNORE_PATTERNS
+
+
+def test_name_patterns_match_at_any_depth():
+    rules = IgnoreRules(["*.log"])
+    assert rules.is_ignored("debug.log", False)
+    assert rules.is_ignored("build/out/debug.log", False)
+    assert not rules.is_ignored("debug.txt", False)
+
+
+def test_directory_only_patterns():
+    rules = IgnoreRules(["build/"])
+    assert rules.is_ignored("build", True)
+    assert rules.is_ignored("src/build", True)
+    assert not rules.is_ignored("build", False)
+
+
+def test_anchored_patterns_match_from_the_root():
+    rules = IgnoreRules(["/docs/*.html", "src/gen"])
+    assert rules.is_ignored("docs/index.html", False)
+    assert not rules.is_ignored("other/docs/index.html", False)
+    assert rules.is_ignored("src/gen", True)
+    assert not rules.is_ignored("lib/src/gen", True)
+
+
+def test_leading_double_star_is_unanchored():
+    rules = IgnoreRules(["**/cache"])
+    assert rules.is_ignored("cache", True)
+    assert rules.is_ignored("a/b/cache", True)
+
+
+def test_last_matching_pattern_wins():
+    rules = IgnoreRules(["*.py[cod]", "!keep.pyc"])
+    assert rules.is_ignored("mod.pyc", False)
+    assert not rules.is_ignored("keep.pyc", False)
+    rules.add("keep.pyc")
+    assert rules.is_ignored("keep.pyc", False)
+
+
+def test_comments_and_blank_lines_are_skipped():
+    rules = IgnoreRules(["# comment", "", "   ", "/"])
+    assert rules.rules == []
+
+
+def test_from_directory_reads_gitignore(tmp_path):
+    (tmp_path / ".gitignore").write_text("secret.txt\n!.venv/\n", encoding="utf-8")
+    rules = IgnoreRules.from_directory(str(tmp_path))
+    assert len(rules.rules) == len(DEFAULT_IGNORE_PATTERNS) + 2
+    assert rules.is_ignored("secret.txt", False)
+    assert rules.is_ignored("__pycache__", True)
+    assert not rules.is_ignored(".venv", True)
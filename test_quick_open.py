@@ -0,0 +1,104 @@
+"""Tests for Go to File scoring and the file index"""
+
+import shutil
+import time
+
+from file_watcher import CREATED, DELETED
+from quick_open import FileIndex, fuzzy_score, subsequence_pattern
+
+
+def test_fuzzy_score_requires_a_subsequence():
+    assert fuzzy_score("mpy", "main.py") is not None
+    assert fuzzy_score("xyz", "main.py") is None
+    assert subsequence_pattern("mpy").search("main.py")
+    assert not subsequence_pattern("ypm").search("main.py")
+
+
+def test_fuzzy_score_prefers_file_names_and_word_starts():
+    # Matched in the file name rather than the directories
+    assert fuzzy_score("main", "src/main.py") > fuzzy_score("main", "main/src/other.py")
+    # Consecutive characters beat scattered ones
+    assert fuzzy_score("run", "run_jobs.py") > fuzzy_score("run", "r_u_n.py")
+    # Shorter paths win ties
+    assert fuzzy_score("app", "app.py") > fuzzy_score("app", "a/b/c/d/e/f/g/app.py")
+
+
+def build_index(root):
+    index = FileIndex()
+    index.build(str(root))
+    deadline = time.monotonic() + 5
+    while not index.ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert index.ready
+    return index
+
+
+def test_index_skips_ignored_files_and_keeps_shortest_first(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "module.py").write_text("")
+    (tmp_path / "a.py").write_text("")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "a.cpython-311.pyc").write_text("")
+    index = build_index(tmp_path)
+    assert index.paths == ["a.py", "pkg/module.py"]
+    assert index.search("mod") == [str(tmp_path / "pkg" / "module.py")]
+
+
+def test_index_add_remove_and_new_folders(tmp_path):
+    (tmp_path / "b.py").write_text("")
+    index = build_index(tmp_path)
+
+    (tmp_path / "long_name.py").write_text("")
+    index.add(str(tmp_path / "long_name.py"))
+    assert index.paths == ["b.py", "long_name.py"]
+    index.remove(str(tmp_path / "b.py"))
+    assert index.paths == ["long_name.py"]
+
+    new = tmp_path / "new" / "deep"
+    new.mkdir(parents=True)
+    (new / "x.py").write_text("")
+    index.handle_event(CREATED, str(tmp_path / "new"))
+    deadline = time.monotonic() + 5
+    while "new/deep/x.py" not in index.paths and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert "new/deep/x.py" in index.paths
+
+    shutil.rmtree(tmp_path / "new")
+    index.handle_event(DELETED, str(tmp_path / "new"))
+    assert index.paths == ["long_name.py"]
+    assert not any(d.startswith(str(tmp_path / "new")) for d in index.directories)
+
+
+def test_search_ranks_a_deep_exact_name_above_many_short_matches(tmp_path):
+    # Shorter paths that match only across folders
+    (tmp_path / "widget_").mkdir()
+    for i in range(FileIndex.SCORE_LIMIT + 100):
+        (tmp_path / "widget_" / f"factory{i}.py").write_text("")
+    deep = tmp_path / "very" / "long" / "path" / "to" / "the" / "package"
+    deep.mkdir(parents=True)
+    (deep / "widget_factory.py").write_text("")
+    index = build_index(tmp_path)
+    index.search("w")  # Typed one letter at a time, the later queries narrow this one's matches
+    assert index.search("widget_factory.py", 1) == [str(deep / "widget_factory.py")]
+
+
+class RecordingWatcher:
+    def __init__(self):
+        self.directories = None
+
+    def set_directories(self, directories):
+        self.directories = set(directories)
+
+
+def test_index_watches_only_the_shallowest_folders_within_its_share(tmp_path):
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    (tmp_path / "d").mkdir()
+    watcher = RecordingWatcher()
+    index = FileIndex(watcher)
+    index.max_watches = 3
+    index.build(str(tmp_path))
+    deadline = time.monotonic() + 5
+    while watcher.directories is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert watcher.directories == {str(tmp_path), str(tmp_path / "a"), str(tmp_path / "d")}
+    assert len(index.directories) == 5
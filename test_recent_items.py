@@ -0,0 +1,18 @@
+"""Tests for the recent files and projects list"""
+
+from main import TkinterStudio
+from recent_items import RecentItemsStore
+
+
+def test_a_batch_is_listed_newest_first(tmp_path):
+    store = RecentItemsStore(str(tmp_path / "recent.json"))
+    store.add_project(str(tmp_path / "project"))
+    store.add_files([str(tmp_path / "b.py"), str(tmp_path / "z.py"), str(tmp_path / "a.py")])
+    assert store.files() == [str(tmp_path / n) for n in ("a.py", "z.py", "b.py")]
+    assert RecentItemsStore(store.path).items == store.items
+
+    app = object.__new__(TkinterStudio)
+    app.recent_items = store
+    # All added in the same second, so only the store's order can tell them apart
+    entries = app.get_recent_entries()
+    assert [path for kind, path in entries if kind == "file"] == store.files()
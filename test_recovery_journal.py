@@ -0,0 +1,76 @@
+"""Tests for the crash recovery journal"""
+
+import json
+import random
+
+from recovery_journal import RecoveryJournal, compute_delta
+
+
+def apply_delta(old, delta):
+    start, end, text = delta
+    return old[:start] + text + old[end:]
+
+
+def test_compute_delta_is_minimal():
+    assert compute_delta("hello world", "hello brave world") == (6, 6, "brave ")
+    assert compute_delta("abc", "abc") == (3, 3, "")
+    assert compute_delta("", "new") == (0, 0, "new")
+    assert compute_delta("gone", "") == (0, 4, "")
+    # Repeated characters: prefix and suffix must not overlap
+    assert apply_delta("aaa", compute_delta("aaa", "aaaa")) == "aaaa"
+
+
+def test_compute_delta_round_trips_random_edits():
+    rng = random.Random(1)
+    text = "".join(rng.choice("ab\n") for _ in range(200))
+    for _ in range(200):
+        start = rng.randrange(len(text) + 1)
+        end = rng.randrange(start, len(text) + 1)
+        new = text[:start] + "".join(rng.choice("abc\n") for _ in range(rng.randrange(5))) + text[end:]
+        assert apply_delta(text, compute_delta(text, new)) == new
+        text = new
+
+
+def test_replay_rebuilds_buffers(tmp_path):
+    journal = RecoveryJournal(str(tmp_path))
+    journal.record("1", "a.py", "print('a')\n")
+    journal.record("1", "a.py", "print('ab')\n")
+    journal.record("2", None, "scratch")
+    journal.record("3", "c.py", "saved later")
+    journal.discard("3")
+    journal.close(clean=False)
+
+    with open(journal.path, encoding="utf-8") as f:
+        ops = [json.loads(line)[0] for line in f]
+    assert ops == ["s", "d", "s", "s", "x"]
+    assert RecoveryJournal.replay(journal.path) == {"1": ("a.py", "print('ab')\n"), "2": (None, "scratch")}
+
+
+def test_replay_ignores_a_truncated_last_line(tmp_path):
+    journal = RecoveryJournal(str(tmp_path))
+    journal.record("1", "a.py", "one")
+    journal.close(clean=False)
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('["d","1",0,3,"tw')
+    assert RecoveryJournal.replay(journal.path) == {"1": ("a.py", "one")}
+
+
+def test_compact_keeps_the_same_state(tmp_path):
+    journal = RecoveryJournal(str(tmp_path))
+    journal.COMPACT_BYTES = 200
+    text = ""
+    for i in range(50):
+        text += f"line {i}\n"
+        journal.record("1", "a.py", text)
+    journal.close(clean=False)
+    with open(journal.path, encoding="utf-8") as f:
+        assert len(f.readlines()) < 50
+    assert RecoveryJournal.replay(journal.path) == {"1": ("a.py", text)}
+
+
+def test_clean_close_removes_the_journal(tmp_path):
+    journal = RecoveryJournal(str(tmp_path))
+    journal.record("1", "a.py", "x")
+    journal.close()
+    assert RecoveryJournal.replay(journal.path) == {}
+    assert journal.find_orphans() == []
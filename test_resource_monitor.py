@@ -0,0 +1,55 @@
+"""Tests for sampling a process's resources from /proc"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from resource_monitor import MONITOR_AVAILABLE, PAGE_SIZE, ResourceMonitor, read_proc
+
+pytestmark = pytest.mark.skipif(not MONITOR_AVAILABLE, reason="needs /proc")
+
+
+def test_read_proc_field_offsets():
+    release = threading.Event()
+    extra = [threading.Thread(target=release.wait) for _ in range(3)]
+    for thread in extra:
+        thread.start()
+    try:
+        cpu, rss, threads, fds = read_proc(os.getpid())
+        tasks = len(os.listdir("/proc/self/task"))
+        open_fds = len(os.listdir("/proc/self/fd"))
+    finally:
+        release.set()
+        for thread in extra:
+            thread.join()
+
+    times = os.times()
+    assert 0 <= cpu <= times.user + times.system + 0.05
+    with open("/proc/self/statm") as f:
+        resident = int(f.read().split()[1]) * PAGE_SIZE
+    assert abs(rss - resident) <= 4 * 1024 * 1024
+    assert threads == tasks >= 4
+    # listdir of /proc/self/fd holds one extra descriptor of its own
+    assert abs(fds - open_fds) <= 1
+
+
+def test_read_proc_of_a_missing_process():
+    # Above the kernel's largest possible pid
+    assert read_proc(2 ** 22 + 1) is None
+
+
+def test_monitor_samples_at_most_once_per_interval():
+    monitor = ResourceMonitor(os.getpid())
+    assert monitor.sample()
+    assert not monitor.sample()
+    monitor._last_time -= ResourceMonitor.INTERVAL
+    end = time.process_time() + 0.05
+    while time.process_time() < end:
+        pass
+    assert monitor.sample()
+    assert len(monitor.history) == 2
+    assert monitor.peaks["cpu"] > 0
+    assert monitor.peaks["rss"] >= monitor.latest["rss"] > 0
+    assert "RSS" in monitor.describe() and "Peak CPU" in monitor.describe_peaks()
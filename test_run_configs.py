@@ -0,0 +1,45 @@
+"""Tests for per-file run configurations"""
+
+import os
+
+import pytest
+
+from run_configs import RunConfigStore, DEFAULT_CONFIG, parse_env, format_env
+
+
+def test_parse_env():
+    text = "# comment\n\nDEBUG=1\n  PATH_EXTRA = /opt/bin \nEMPTY=\nURL=a=b\n"
+    assert parse_env(text) == {"DEBUG": "1", "PATH_EXTRA": "/opt/bin", "EMPTY": "", "URL": "a=b"}
+    assert parse_env(format_env({"A": "1", "B": "x y"})) == {"A": "1", "B": "x y"}
+
+
+@pytest.mark.parametrize("line", ["NO_EQUALS", "=value"])
+def test_parse_env_rejects_bad_lines(line):
+    with pytest.raises(ValueError, match="Line 2"):
+        parse_env("OK=1\n" + line)
+
+
+def test_store_round_trip_keeps_only_changed_values(tmp_path):
+    script = tmp_path / "src" / "app.py"
+    store = RunConfigStore(str(tmp_path))
+    assert store.get(str(script)) == DEFAULT_CONFIG
+
+    store.set(str(script), dict(DEFAULT_CONFIG, args="--fast", env={"A": "1"}))
+    assert store.configs == {"src/app.py": {"args": "--fast", "env": {"A": "1"}}}
+    reloaded = RunConfigStore(str(tmp_path))
+    assert reloaded.get(str(script))["args"] == "--fast"
+
+    reloaded.set(str(script), dict(DEFAULT_CONFIG))
+    assert RunConfigStore(str(tmp_path)).configs == {}
+
+
+def test_working_directory_and_environment(tmp_path):
+    store = RunConfigStore(str(tmp_path))
+    assert store.resolve_cwd(DEFAULT_CONFIG) is None
+    assert store.resolve_cwd(dict(DEFAULT_CONFIG, cwd="sub/../data")) == os.path.join(str(tmp_path), "data")
+
+    assert RunConfigStore.environment(DEFAULT_CONFIG) is None
+    env = RunConfigStore.environment(dict(DEFAULT_CONFIG, env={"A": "1"}))
+    assert env["A"] == "1"
+    assert env.get("PYTHONUNBUFFERED") == os.environ.get("PYTHONUNBUFFERED")
+    assert RunConfigStore.environment(dict(DEFAULT_CONFIG, unbuffered=False))["PYTHONUNBUFFERED"] == ""
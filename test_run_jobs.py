@@ -0,0 +1,37 @@
+"""Smoke test for starting a run in its own Output tab (needs a display)"""
+
+import sys
+import time
+import tkinter as tk
+
+import pytest
+
+
+def test_start_run_shows_output_in_a_tab(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    from main import TkinterStudio
+
+    try:
+        app = TkinterStudio()
+    except tk.TclError as e:
+        pytest.skip(f"no display: {e}")
+    try:
+        job = app.start_run("hi", [sys.executable, "-c", "print('hi')"])
+        tab_id = str(job.panel.frame)
+        assert app.run_jobs[tab_id] is job
+        assert app.output_notebook.select() == tab_id
+
+        deadline = time.monotonic() + 10
+        while job.running and time.monotonic() < deadline:
+            app.update()
+            time.sleep(0.01)
+        app.update()
+        assert job.returncode == 0
+        assert "hi" in job.panel.get("1.0", tk.END)
+
+        app.close_run(tab_id)
+        assert tab_id not in app.run_jobs
+        assert tab_id not in app.output_notebook.tabs()
+    finally:
+        app.destroy()
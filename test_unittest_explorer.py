@@ -0,0 +1,125 @@
+"""Tests for test discovery, the import graph and batch planning"""
+
+import json
+import os
+import subprocess
+import sys
+
+from unittest_explorer import (RESULT_PREFIX, RUNNER_SCRIPT, affected_files, full_test_id, module_name,
+                               parse_source, plan_batches, scan_project)
+
+SOURCE = b'''
+import os
+import pkg.util
+from . import helpers
+from ..core import engine
+import unittest
+
+class Base(unittest.TestCase):
+    def test_shared(self):
+        pass
+
+class TestThing(Base):
+    def test_one(self):
+        pass
+
+    async def test_two(self):
+        pass
+
+    def helper(self):
+        pass
+
+class NotATest:
+    def test_ignored(self):
+        pass
+'''
+
+
+def test_module_name():
+    assert module_name("pkg/sub/mod.py") == "pkg.sub.mod"
+    assert module_name("pkg/__init__.py") == "pkg"
+
+
+def test_parse_source_imports_and_tests():
+    imports, tests = parse_source(SOURCE, "pkg.tests", True)
+    assert {"os", "pkg.util", "pkg.tests", "pkg.tests.helpers", "pkg.core", "pkg.core.engine"} <= imports
+    assert tests == [("Base", "test_shared", 9), ("TestThing", "test_shared", 9),
+                     ("TestThing", "test_one", 13), ("TestThing", "test_two", 16)]
+    assert parse_source(SOURCE, "pkg.tests", False)[1] == []
+
+
+def test_module_level_test_functions_are_found():
+    source = b'''
+def test_imports():
+    """Test if all required modules can be imported"""
+
+def helper():
+    pass
+
+async def test_async():
+    pass
+
+def test_icons():
+    pass
+'''
+    assert parse_source(source, "", True)[1] == [(None, "test_imports", 2), (None, "test_icons", 11)]
+    assert full_test_id("pkg.test_mod", None, "test_icons") == "pkg.test_mod.test_icons"
+    assert full_test_id("pkg.test_mod", "T", "test_x") == "pkg.test_mod.T.test_x"
+
+    tests = scan_project(os.path.dirname(os.path.abspath(__file__)), {})["test_run.py"]["tests"]
+    assert (None, "test_imports", 11) in tests
+
+
+def test_runner_runs_test_functions(tmp_path):
+    (tmp_path / "test_funcs.py").write_text(
+        "import unittest\n"
+        "def test_ok():\n    assert 1\n"
+        "def test_bad():\n    assert 0, 'nope'\n"
+        "def test_fixture(tmp_path):\n    pass\n"
+        "class T(unittest.TestCase):\n    def test_method(self):\n        pass\n")
+    names = ["test_funcs.test_ok", "test_funcs.test_bad", "test_funcs.test_fixture", "test_funcs.T.test_method"]
+    output = subprocess.run([sys.executable, "-c", RUNNER_SCRIPT], cwd=tmp_path, input="\n".join(names),
+                            capture_output=True, text=True, timeout=60).stdout
+    results = {r["id"]: r for r in (json.loads(line[len(RESULT_PREFIX):]) for line in output.splitlines()
+                                    if line.startswith(RESULT_PREFIX))}
+    assert {name: r["status"] for name, r in results.items()} == {
+        "test_funcs.test_ok": "passed", "test_funcs.test_bad": "failed",
+        "test_funcs.test_fixture": "skipped", "test_funcs.T.test_method": "passed"}
+    assert "nope" in results["test_funcs.test_bad"]["message"]
+    assert "tmp_path" in results["test_funcs.test_fixture"]["message"]
+
+
+def test_affected_files_follows_imports_transitively(tmp_path):
+    (tmp_path / "core.py").write_text("")
+    (tmp_path / "service.py").write_text("import core\n")
+    (tmp_path / "test_service.py").write_text("from service import run\n")
+    (tmp_path / "test_other.py").write_text("import json\n")
+    files = scan_project(str(tmp_path), {})
+    assert affected_files(files, {"core.py"}) == {"core.py", "service.py", "test_service.py"}
+    assert affected_files(files, {"test_other.py"}) == {"test_other.py"}
+
+
+def test_scan_project_reuses_unchanged_files(tmp_path):
+    (tmp_path / "test_a.py").write_text("import unittest\nclass T(unittest.TestCase):\n    def test_x(self): pass\n")
+    cache = {}
+    first = scan_project(str(tmp_path), cache)
+    assert first["test_a.py"]["tests"] == [("T", "test_x", 3)]
+    again = scan_project(str(tmp_path), cache)
+    assert again["test_a.py"] is first["test_a.py"]
+
+
+def test_plan_batches_keeps_modules_together_and_balances_time():
+    test_ids = [f"slow.T.test_{i}" for i in range(4)] + [f"fast{m}.T.test_0" for m in range(4)]
+    durations = {test_id: 1.0 for test_id in test_ids if test_id.startswith("slow")}
+    durations.update({f"fast{m}.T.test_0": 1.0 for m in range(4)})
+    batches = plan_batches(test_ids, durations, 2)
+    assert len(batches) == 2
+    assert sorted(sum(batches, [])) == sorted(test_ids)
+    slow = [batch for batch in batches if "slow.T.test_0" in batch][0]
+    assert [test_id for test_id in slow if test_id.startswith("slow")] == test_ids[:4]
+    assert sorted(len(batch) for batch in batches) == [4, 4]
+
+    assert len(plan_batches(["a.T.test_x", "a.T.test_y"], {}, 8)) == 1
+    modules = {"a.test_x": "a", "a.T.test_y": "a"}
+    assert len(plan_batches(list(modules), {}, 8, modules)) == 1
+    assert plan_batches([], {}, 8) == []
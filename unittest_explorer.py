@@ -0,0 +1,620 @@
+import os
+import ast
+import json
+import fnmatch
+import threading
+from collections import deque
+import tkinter as tk
+from tkinter import ttk
+from process_runner import ProcessRunner, STDOUT, STDERR, EXIT
+from project_explorer import IgnoreRules
+
+# unittest's default discovery pattern
+TEST_FILE_PATTERN = "test*.py"
+
+# Child side of a test worker: python -c RUNNER_SCRIPT, with test ids on stdin
+# One result line per test is written to stdout, marked with RESULT_PREFIX;
+# test output is buffered by unittest and included in failure messages.
+RESULT_PREFIX = "\x00test "
+RUNNER_SCRIPT = r"""
+import sys, json, time, inspect, importlib, traceback, unittest
+
+PREFIX = "\x00test "
+out = sys.stdout
+names = [line.strip() for line in sys.stdin if line.strip()]
+reported = set()
+aliases = {}         # id of a test that failed to load -> requested name
+fixture_errors = []  # setUpClass/setUpModule failures
+
+def emit(name, status, seconds=0.0, message=""):
+    reported.add(name)
+    out.write(PREFIX + json.dumps({"id": name, "status": status, "time": seconds, "message": message}) + "\n")
+    out.flush()
+
+class Result(unittest.TestResult):
+    started = None
+
+    def startTest(self, test):
+        super().startTest(test)
+        self.started = time.perf_counter()
+
+    def report(self, test, status, message=""):
+        if not isinstance(test, unittest.TestCase):
+            fixture_errors.append(message)  # A class or module fixture failed
+            return
+        seconds = time.perf_counter() - self.started if self.started else 0.0
+        emit(aliases.get(test.id(), test.id()), status, seconds, message)
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.report(test, "passed")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.report(test, "failed", self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.report(test, "error", self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self.report(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self.report(test, "passed", "expected failure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self.report(test, "failed", "unexpected success")
+
+class FunctionTest(unittest.FunctionTestCase):
+    # A module-level test function, run under the id it was requested by
+    def __init__(self, name, func):
+        super().__init__(func)
+        self.name = name
+
+    def id(self):
+        return self.name
+
+def needs_fixtures(name):
+    raise unittest.SkipTest("needs pytest fixtures: " + name)
+
+def load_function(name):
+    # Return a suite for a module-level test_* function, or None
+    module_name, _, attr = name.rpartition(".")
+    if not module_name or not attr.startswith("test"):
+        return None
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        return None  # Not a module (or broken); the loader reports it
+    func = getattr(module, attr, None)
+    if not inspect.isfunction(func):
+        return None
+    required = [p.name for p in inspect.signature(func).parameters.values()
+                if p.default is p.empty and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    if required:
+        func = lambda: needs_fixtures(", ".join(required))
+    return unittest.TestSuite([FunctionTest(name, func)])
+
+def flatten(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from flatten(test)
+        else:
+            yield test
+
+loader = unittest.TestLoader()
+suite = unittest.TestSuite()
+for name in names:
+    try:
+        # The loader would call a plain test function to get a test from it
+        loaded = load_function(name) or loader.loadTestsFromName(name)
+    except Exception:
+        emit(name, "error", message=traceback.format_exc())
+        continue
+    for test in flatten(loaded):
+        if test.id() != name:
+            aliases[test.id()] = name
+    suite.addTest(loaded)
+
+result = Result()
+result.buffer = True
+suite.run(result)
+
+for name in names:
+    if name not in reported:
+        emit(name, "error", message="".join(fixture_errors) or "The test did not run")
+"""
+
+MAX_WORKERS = 8
+# Assumed duration of a test that has not been timed yet
+DEFAULT_DURATION = 0.1
+STATUS_ORDER = ("error", "failed", "passed", "skipped")
+
+
+def module_name(rel_path):
+    """Dotted module name of a project-relative .py path"""
+    parts = rel_path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def parse_source(source, package, is_test_file):
+    """Return (imported module names, [(class, method, line), ...]) of a module
+
+    package is the package relative imports are resolved against. Module
+    level test functions (the pytest style) are listed with class None.
+    """
+    tree = ast.parse(source)
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.split(".") if package else []
+                parent = parent[:len(parent) - (node.level - 1)] if node.level > 1 else parent
+                base = ".".join(parent + ([base] if base else []))
+            if base:
+                imports.add(base)
+            # "from package import module" imports a module too
+            imports.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+
+    tests = []
+    if is_test_file:
+        test_classes = {}  # Local TestCase subclasses -> their test methods
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+                tests.append((None, node.name, node.lineno))
+            if not isinstance(node, ast.ClassDef):
+                continue
+            inherited = []
+            is_test_class = False
+            for base in node.bases:
+                name = base.id if isinstance(base, ast.Name) else getattr(base, "attr", "")
+                if name.endswith("TestCase"):
+                    is_test_class = True
+                if name in test_classes:
+                    is_test_class = True
+                    inherited.extend(test_classes[name])
+            if not is_test_class:
+                continue
+            own = [(item.name, item.lineno) for item in node.body
+                   if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test")]
+            names = {name for name, _ in own}
+            methods = [m for m in inherited if m[0] not in names] + own
+            test_classes[node.name] = methods
+            tests.extend((node.name, name, line) for name, line in methods)
+    return imports, tests
+
+
+def scan_project(root, cache):
+    """Parse the project's Python files, reusing cache entries for unchanged files
+
+    Returns {relative path: {"stamp", "module", "imports", "tests", "error"}}.
+    cache is a dict of earlier results and is updated in place.
+    """
+    rules = IgnoreRules.from_directory(root)
+    files = {}
+    stack = [("", root)]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            rel = prefix + entry.name
+            try:
+                is_dir = entry.is_dir()
+                if rules.is_ignored(rel, is_dir):
+                    continue
+                if is_dir:
+                    stack.append((rel + "/", entry.path))
+                    continue
+                if not entry.name.endswith(".py"):
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            stamp = [stat.st_size, stat.st_mtime_ns]
+            info = cache.get(rel)
+            if info is None or info["stamp"] != stamp:
+                module = module_name(rel)
+                if entry.name == "__init__.py":
+                    package = module
+                else:
+                    package = module.rsplit(".", 1)[0] if "." in module else ""
+                info = {"stamp": stamp, "module": module, "imports": set(), "tests": [], "error": None}
+                try:
+                    with open(entry.path, "rb") as f:
+                        info["imports"], info["tests"] = parse_source(
+                            f.read(), package, fnmatch.fnmatch(entry.name, TEST_FILE_PATTERN))
+                except (OSError, SyntaxError, ValueError) as e:
+                    info["error"] = str(e)
+                cache[rel] = info
+            files[rel] = info
+    for rel in list(cache):
+        if rel not in files:
+            del cache[rel]
+    return files
+
+
+def affected_files(files, changed):
+    """Return changed plus every file that imports one of them, directly or not"""
+    by_module = {info["module"]: rel for rel, info in files.items()}
+    dependents = {}
+    for rel, info in files.items():
+        for name in info["imports"]:
+            target = by_module.get(name)
+            if target is not None and target != rel:
+                dependents.setdefault(target, set()).add(rel)
+
+    affected = set(changed)
+    stack = list(changed)
+    while stack:
+        for rel in dependents.get(stack.pop(), ()):
+            if rel not in affected:
+                affected.add(rel)
+                stack.append(rel)
+    return affected
+
+
+def full_test_id(module, class_name, method):
+    """Dotted name a test is loaded by; test functions have no class"""
+    return f"{module}.{class_name}.{method}" if class_name else f"{module}.{method}"
+
+
+def plan_batches(test_ids, durations, workers, modules=None):
+    """Split tests into at most workers batches of roughly equal run time
+
+    Tests of one module stay in one batch, so module and class fixtures
+    run once; modules are handed out longest first to the least loaded
+    batch, using the durations measured on earlier runs. modules maps
+    test ids to their module; by default it is the id without its class
+    and method.
+    """
+    by_module = {}
+    for test_id in test_ids:
+        module = modules[test_id] if modules is not None else test_id.rsplit(".", 2)[0]
+        by_module.setdefault(module, []).append(test_id)
+    modules = by_module
+    cost = lambda ids: sum(durations.get(i, DEFAULT_DURATION) for i in ids)
+
+    batches = [[] for _ in range(min(workers, len(modules)))]
+    loads = [0.0] * len(batches)
+    for ids in sorted(modules.values(), key=cost, reverse=True):
+        index = loads.index(min(loads))
+        batches[index].extend(ids)
+        loads[index] += cost(ids)
+    return batches
+
+
+class TestExplorerView(ttk.Frame):
+    """Discovers the project's unittest tests and runs them in parallel
+
+    Tests are TestCase methods and module-level test_* functions; the
+    functions run wrapped in unittest.FunctionTestCase, and those that
+    take pytest fixtures are reported as skipped.
+
+    Discovery parses test*.py files with ast instead of importing them, on
+    a background thread, and only re-parses files whose size or mtime
+    changed. A run is split over up to MAX_WORKERS child interpreters
+    (see plan_batches); each streams one result per test, so the tree
+    fills in while the run is going.
+
+    Run Failed reruns the tests that failed or errored last time. Run
+    Affected reruns the tests in files that changed since the last run,
+    or that import such a file, directly or through other project modules.
+
+    command_callback() returns the command line that starts a worker
+    (or None if none can be started); open_callback(filepath, line)
+    shows a test's source.
+    """
+
+    POLL_MS = 50
+    STDERR_LINES = 200  # Kept per worker for the error message if it dies
+
+    def __init__(self, parent, root, command_callback, open_callback):
+        super().__init__(parent)
+        self.root_dir = root
+        self.command_callback = command_callback
+        self.open_callback = open_callback
+        self.cache = {}
+        self.files = {}
+        self.tests = {}          # test id -> {"file", "line", "status", "time", "message"}
+        self.durations = {}      # test id -> seconds, from the last run of each test
+        self.run_stamps = None   # file stamps when the last run started
+        self.runners = []        # (ProcessRunner, test ids, last stderr lines) of the workers still running
+        self.running_ids = set()
+        self.run_counts = {}
+        self.run_total = 0
+        self.stopped = False
+        self.scanning = False
+        self.pending_run = None  # What to run once the current scan is done
+
+        self.create_widgets()
+        self.bind("<Destroy>", lambda e: self.stop() if e.widget is self else None)
+        self.refresh()
+
+    def create_widgets(self):
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill=tk.X)
+        self.buttons = [
+            ttk.Button(toolbar, text="Refresh", command=self.refresh),
+            ttk.Button(toolbar, text="Run All", command=lambda: self.request_run("all")),
+            ttk.Button(toolbar, text="Run Failed", command=lambda: self.request_run("failed")),
+            ttk.Button(toolbar, text="Run Affected", command=lambda: self.request_run("affected")),
+        ]
+        for button in self.buttons:
+            button.pack(side=tk.LEFT, padx=2, pady=2)
+        self.stop_button = ttk.Button(toolbar, text="Stop", command=self.stop, state=tk.DISABLED)
+        self.stop_button.pack(side=tk.LEFT, padx=2, pady=2)
+        self.status = ttk.Label(toolbar, text="", anchor=tk.W)
+        self.status.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        paned = ttk.PanedWindow(self, orient=tk.VERTICAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        frame = ttk.Frame(paned)
+        self.tree = ttk.Treeview(frame, columns=("status", "time"), selectmode="browse")
+        self.tree.heading("#0", text="test")
+        self.tree.column("#0", width=400, stretch=True)
+        self.tree.heading("status", text="status")
+        self.tree.column("status", width=80, stretch=False)
+        self.tree.heading("time", text="time")
+        self.tree.column("time", width=80, anchor=tk.E, stretch=False)
+        scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        paned.add(frame, weight=3)
+
+        self.details = tk.Text(paned, height=8, wrap=tk.NONE, font=("Consolas", 9))
+        paned.add(self.details, weight=1)
+
+        self.tree.tag_configure("passed", foreground="#008000")
+        self.tree.tag_configure("failed", foreground="#C00000")
+        self.tree.tag_configure("error", foreground="#C00000")
+        self.tree.tag_configure("skipped", foreground="#808080")
+        self.tree.tag_configure("running", foreground="#0000C0")
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Double-1>", self.on_double_click)
+
+    def set_root(self, root):
+        self.stop()
+        self.root_dir = root
+        self.cache = {}
+        self.tests = {}
+        self.durations = {}
+        self.run_stamps = None
+        self.refresh()
+
+    # Discovery
+
+    def refresh(self, then=None):
+        """Rescan the project in the background, then optionally start a run"""
+        self.pending_run = then or self.pending_run
+        if self.scanning:
+            return
+        self.scanning = True
+        self.status.config(text="Discovering tests...")
+        threading.Thread(target=self._scan, args=(self.root_dir, self.cache), daemon=True).start()
+
+    def _scan(self, root, cache):
+        files = scan_project(root, cache)
+        try:
+            self.after(0, lambda: self.on_scanned(root, files))
+        except (RuntimeError, tk.TclError):
+            pass  # The view was closed while scanning
+
+    def on_scanned(self, root, files):
+        self.scanning = False
+        if root != self.root_dir:
+            self.refresh()  # The project changed while scanning
+            return
+        self.files = files
+
+        tests = {}
+        for rel, info in files.items():
+            for class_name, method, line in info["tests"]:
+                test_id = full_test_id(info["module"], class_name, method)
+                previous = self.tests.get(test_id, {})
+                tests[test_id] = {"file": rel, "line": line, "module": info["module"], "class": class_name,
+                                  "name": method, "status": previous.get("status", ""),
+                                  "time": previous.get("time"), "message": previous.get("message", "")}
+        self.tests = tests
+        self.populate()
+
+        errors = sum(1 for rel, info in files.items()
+                     if info["error"] and fnmatch.fnmatch(os.path.basename(rel), TEST_FILE_PATTERN))
+        self.status.config(text=f"{len(tests)} tests in {len({t['file'] for t in tests.values()})} files"
+                                + (f", {errors} test files could not be parsed" if errors else ""))
+
+        what, self.pending_run = self.pending_run, None
+        if what is not None:
+            self.start_run(what)
+
+    def populate(self):
+        """Rebuild the tree: module > class > test, with test functions right under their module"""
+        self.tree.delete(*self.tree.get_children())
+        for test_id in sorted(self.tests):
+            test = self.tests[test_id]
+            module, class_name = test["module"], test["class"]
+            module_item = f"m:{module}"
+            parent = module_item
+            if not self.tree.exists(module_item):
+                self.tree.insert("", tk.END, iid=module_item, text=module, open=True)
+            if class_name:
+                parent = f"c:{module}.{class_name}"
+                if not self.tree.exists(parent):
+                    self.tree.insert(module_item, tk.END, iid=parent, text=class_name, open=False)
+            self.tree.insert(parent, tk.END, iid=test_id, text=test["name"])
+            self.show_result(test_id)
+        self.update_parents()
+
+    # Running
+
+    def request_run(self, what):
+        """Rescan first so the run sees tests added or changed since the last scan"""
+        if not self.runners:
+            self.refresh(then=what)
+
+    def select_tests(self, what):
+        if what == "failed":
+            return [i for i, t in self.tests.items() if t["status"] in ("failed", "error")]
+        if what == "affected":
+            if self.run_stamps is None:
+                return list(self.tests)  # Nothing has run yet, so everything is affected
+            changed = {rel for rel, info in self.files.items() if self.run_stamps.get(rel) != info["stamp"]}
+            affected = affected_files(self.files, changed)
+            return [i for i, t in self.tests.items() if t["file"] in affected]
+        return list(self.tests)
+
+    def start_run(self, what):
+        test_ids = self.select_tests(what)
+        if not test_ids:
+            self.status.config(text={"failed": "No failed tests to run",
+                                     "affected": "No tests are affected by changes since the last run"
+                                     }.get(what, "No tests found"))
+            return
+        command = self.command_callback()
+        if command is None:
+            return
+
+        self.stopped = False
+        self.run_stamps = {rel: info["stamp"] for rel, info in self.files.items()}
+        self.run_counts = {status: 0 for status in STATUS_ORDER}
+        self.run_total = len(test_ids)
+        self.running_ids = set(test_ids)
+        for test_id in test_ids:
+            self.tests[test_id].update(status="running", time=None, message="")
+            self.show_result(test_id)
+        self.update_parents()
+
+        workers = min(MAX_WORKERS, os.cpu_count() or 1)
+        self.runners = []
+        modules = {test_id: self.tests[test_id]["module"] for test_id in test_ids}
+        for batch in plan_batches(test_ids, self.durations, workers, modules):
+            runner = ProcessRunner(command, cwd=self.root_dir, stdin_pipe=True)
+            try:
+                runner.start()
+            except OSError as e:
+                self.finish_batch(batch, "error", f"Could not start the test runner: {e}")
+                continue
+            runner.send_input("\n".join(batch) + "\n")
+            self.runners.append((runner, batch, deque(maxlen=self.STDERR_LINES)))
+
+        for button in self.buttons:
+            button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+        self.update_status()
+        self.after(self.POLL_MS, self.poll)
+
+    def poll(self):
+        for entry in list(self.runners):
+            runner, batch, errors = entry
+            for stream, text in runner.get_output(1000):
+                if stream == EXIT:
+                    self.runners.remove(entry)
+                    if self.stopped:
+                        self.finish_batch(batch, "skipped", "The run was stopped")
+                    else:
+                        # Tests' own output is buffered by the runner, so its
+                        # stderr is what explains a crash
+                        message = f"The test runner exited with code {text}"
+                        if errors:
+                            message += "\n\n" + "".join(errors)
+                        self.finish_batch(batch, "error", message)
+                elif stream == STDERR:
+                    errors.append(text)
+                elif stream == STDOUT and text.startswith(RESULT_PREFIX):
+                    try:
+                        self.record(json.loads(text[len(RESULT_PREFIX):]))
+                    except ValueError:
+                        pass
+        self.update_status()
+        if self.runners:
+            self.after(self.POLL_MS, self.poll)
+        else:
+            self.run_finished()
+
+    def record(self, result):
+        test_id = result["id"]
+        if test_id not in self.running_ids:
+            return
+        self.running_ids.discard(test_id)
+        self.tests[test_id].update(status=result["status"], time=result["time"], message=result["message"])
+        self.durations[test_id] = result["time"]
+        self.run_counts[result["status"]] = self.run_counts.get(result["status"], 0) + 1
+        self.show_result(test_id)
+
+    def finish_batch(self, batch, status, message):
+        """Give the batch's unreported tests a result (the runner died or was stopped)"""
+        for test_id in batch:
+            if test_id in self.running_ids:
+                self.record({"id": test_id, "status": status, "time": 0.0, "message": message})
+
+    def stop(self):
+        self.stopped = True
+        for runner, _, _ in self.runners:
+            runner.stop(force=True)
+
+    def run_finished(self):
+        self.update_parents()
+        for button in self.buttons:
+            button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.update_status(finished=True)
+
+    def update_status(self, finished=False):
+        counts = ", ".join(f"{count} {status}" for status, count in self.run_counts.items() if count)
+        done = self.run_total - len(self.running_ids)
+        prefix = "Finished" if finished else f"Running {done}/{self.run_total}"
+        self.status.config(text=f"{prefix}: {counts}" if counts else prefix)
+
+    # Display
+
+    def show_result(self, test_id):
+        test = self.tests[test_id]
+        elapsed = f"{test['time'] * 1000:.0f} ms" if test["time"] is not None else ""
+        self.tree.item(test_id, values=(test["status"], elapsed), tags=(test["status"],) if test["status"] else ())
+
+    def update_parents(self):
+        """Give each module and class the worst status of its tests"""
+        for module_item in self.tree.get_children():
+            module_statuses = []
+            for item in self.tree.get_children(module_item):
+                if item in self.tests:  # A test function
+                    module_statuses.append(self.tests[item]["status"])
+                    continue
+                statuses = [self.tests[i]["status"] for i in self.tree.get_children(item)]
+                status = self.summary_status(statuses)
+                self.tree.item(item, values=(status, ""), tags=(status,) if status else ())
+                module_statuses.append(status)
+            status = self.summary_status(module_statuses)
+            self.tree.item(module_item, values=(status, ""), tags=(status,) if status else ())
+
+    @staticmethod
+    def summary_status(statuses):
+        for status in ("running",) + STATUS_ORDER:
+            if status in statuses:
+                return status
+        return ""
+
+    def on_select(self, event=None):
+        selection = self.tree.selection()
+        self.details.delete("1.0", tk.END)
+        if selection and selection[0] in self.tests:
+            test = self.tests[selection[0]]
+            self.details.insert("1.0", test["message"] or test["status"])
+
+    def on_double_click(self, event):
+        test = self.tests.get(self.tree.identify_row(event.y))
+        if test is not None:
+            self.open_callback(os.path.join(self.root_dir, test["file"]), test["line"])
@@ -0,0 +1,111 @@
+import time
+from process_runner import ProcessRunner
+
+# Bootstrap run by each warm worker. It imports the modules snippets
+# usually need, then blocks reading one program from stdin. The program
+# runs as a fresh __main__ module and the worker exits when it is done.
+WORKER_SCRIPT = r"""
+import sys, os, types, traceback
+import json, re, math, time
+try:
+    import tkinter, tkinter.ttk, tkinter.messagebox, tkinter.filedialog
+except ImportError:
+    # An interpreter without tkinter can still run programs that do not use it
+    pass
+
+source = sys.stdin.read()
+sys.stdin.close()
+sys.stdin = open(os.devnull)
+
+main = types.ModuleType("__main__")
+main.__builtins__ = __builtins__
+main.__file__ = "<stdin>"
+sys.modules["__main__"] = main
+sys.argv = ["-"]
+del types
+
+try:
+    exec(compile(source, "<stdin>", "exec"), main.__dict__)
+except SystemExit:
+    raise
+except BaseException as e:
+    # Leave this bootstrap out of the traceback
+    traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    sys.exit(1)
+"""
+
+
+def worker_command(interpreter):
+    return [interpreter, "-c", WORKER_SCRIPT]
+
+
+class WarmWorkerPool:
+    """Pre-started Python interpreters for running unsaved buffers
+
+    Each worker is a child process that has already paid for interpreter
+    startup and for importing json, re, tkinter (if the interpreter has
+    it) and a few other modules, and is waiting for a program on stdin. Taking a worker hands over its
+    ProcessRunner; the pool immediately starts a replacement.
+
+    Isolation: a worker runs exactly one program and then exits, so no
+    variables, patched modules, open windows or threads carry over from
+    one run to the next. The program runs in a new __main__ module with
+    sys.argv == ["-"]. What it does share with a cold "python -" run is
+    everything fixed when the worker started: the interpreter, the
+    environment variables and the working directory. The pool is flushed
+    when any of those change. The only visible difference from a cold
+    start is that the modules above are already in sys.modules.
+    """
+
+    def __init__(self, size=1):
+        self.size = size
+        self.interpreter = None
+        self.cwd = None
+        self.workers = []
+
+    def configure(self, interpreter, cwd=None, size=None):
+        """Match the pool to the current interpreter and directory"""
+        if size is not None and size != self.size:
+            self.size = size
+            self.shutdown()
+        if interpreter != self.interpreter or cwd != self.cwd:
+            self.shutdown()
+            self.interpreter = interpreter
+            self.cwd = cwd
+        self.refill()
+
+    def refill(self):
+        """Start workers until the pool is full"""
+        self.workers = [w for w in self.workers if w.running]
+        while self.interpreter and len(self.workers) < self.size:
+            worker = ProcessRunner(worker_command(self.interpreter), cwd=self.cwd, stdin_pipe=True)
+            try:
+                worker.start()
+            except OSError as e:
+                print(f"Could not start warm worker: {e}")
+                return
+            self.workers.append(worker)
+
+    def take(self, interpreter, cwd=None):
+        """Return a started worker for interpreter and cwd, or None
+
+        The caller sends the program with send_input(). A replacement
+        worker is started before returning.
+        """
+        if interpreter != self.interpreter or cwd != self.cwd:
+            return None
+        worker = None
+        while self.workers and worker is None:
+            candidate = self.workers.pop(0)
+            if candidate.running:
+                worker = candidate
+        self.refill()
+        if worker is not None:
+            # Time the run from now, not from when the worker was started
+            worker.started = time.monotonic()
+        return worker
+
+    def shutdown(self):
+        for worker in self.workers:
+            worker.stop(force=True)
+        self.workers = []
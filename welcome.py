@@ -2,16 +2,23 @@ import tkinter as tk
 from tkinter import ttk, font
 import os
 import sys
+import queue
+import threading
 
 class WelcomeScreen(tk.Toplevel):
     """Modern welcome screen for TkinterStudio"""
 
-    def __init__(self, parent, callback):
+    def __init__(self, parent, callback, recent_items=None):
         super().__init__(parent)
         self.title("Welcome to TkinterStudio")
         self.parent = parent
         self.callback = callback
 
+        # List of ("file" | "project", path), newest first
+        self.recent_items = recent_items or []
+        self.recent_rows = {}
+        self._probe_results = queue.Queue()
+
         # Window configuration
         self.minsize(800, 500)
         self.configure(background="#FFFFFF")
@@ -153,28 +160,47 @@ class WelcomeScreen(tk.Toplevel):
         recent_frame = ttk.LabelFrame(content_frame, text="Recent", padding=15)
         recent_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
 
-        # Sample projects (these would be populated from actual recent projects)
-        sample_projects = [
-            ("Windows Forms Example", "examples/winforms_style.py"),
-            ("Toolbox Demo", "examples/toolbox_demo.py"),
-            ("Hello World", "examples/hello_world.py")
-        ]
-
-        # Create recent project links
-        for i, (name, path) in enumerate(sample_projects):
+        # Recent files and projects; fall back to the bundled examples
+        if self.recent_items:
+            entries = [(os.path.basename(path.rstrip(os.sep)) or path, path, kind)
+                       for kind, path in self.recent_items]
+        else:
+            entries = [
+                ("Windows Forms Example", "examples/winforms_style.py", "file"),
+                ("Toolbox Demo", "examples/toolbox_demo.py", "file"),
+                ("Hello World", "examples/hello_world.py", "file")
+            ]
+
+        # Create recent project links straight from the cached list; whether
+        # each path still exists is checked in the background
+        for name, path, kind in entries:
             project_frame = ttk.Frame(recent_frame, style="RightPanel.TFrame")
             project_frame.pack(fill=tk.X, pady=3)
 
             project_link = ttk.Label(
-                project_frame, text=name, style="Link.TLabel",
-                cursor="hand2"
+                project_frame, text=name + ("/" if kind == "project" else ""),
+                style="Link.TLabel", cursor="hand2"
             )
             project_link.pack(side=tk.LEFT)
             project_link.bind("<Button-1>", lambda e, p=path: self.callback("recent", p))
 
-            ttk.Label(
+            path_label = ttk.Label(
                 project_frame, text=path, style="Content.TLabel"
-            ).pack(side=tk.LEFT, padx=10)
+            )
+            path_label.pack(side=tk.LEFT, padx=10)
+
+            preview_label = ttk.Label(
+                project_frame, text="", style="Content.TLabel", foreground="#888888"
+            )
+            preview_label.pack(side=tk.LEFT, padx=10)
+
+            self.recent_rows[path] = (project_link, path_label, preview_label)
+            thread = threading.Thread(target=self._probe_path, args=(path,))
+            thread.daemon = True  # A hung network path must not block exit
+            thread.start()
+
+        self._pending_probes = len(entries)
+        self.after(100, self._poll_probe_results)
 
         # Get started frame
         help_frame = ttk.LabelFrame(content_frame, text="Help & Resources", padding=15)
@@ -215,6 +241,50 @@ class WelcomeScreen(tk.Toplevel):
         )
         show_welcome_check.pack(side=tk.LEFT)
 
+    def _probe_path(self, path):
+        """Check a recent entry and load a one-line preview (worker thread)"""
+        preview = ""
+        exists = os.path.exists(path)
+        if exists and os.path.isdir(path):
+            try:
+                with os.scandir(path) as it:
+                    count = sum(1 for _ in it)
+                preview = f"{count} item(s)"
+            except OSError:
+                pass
+        elif exists:
+            try:
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f.read(2048).splitlines():
+                        line = line.strip()
+                        if line and not line.startswith("#!"):
+                            preview = line[:60]
+                            break
+            except OSError:
+                pass
+        self._probe_results.put((path, exists, preview))
+
+    def _poll_probe_results(self):
+        """Apply finished background checks to the recent list"""
+        try:
+            while True:
+                path, exists, preview = self._probe_results.get_nowait()
+                self._pending_probes -= 1
+                link, path_label, preview_label = self.recent_rows[path]
+                if exists:
+                    preview_label.config(text=preview)
+                else:
+                    link.config(foreground="#999999", cursor="")
+                    link.unbind("<Button-1>")
+                    path_label.config(text=f"{path} (not found)", foreground="#999999")
+        except queue.Empty:
+            pass
+        except tk.TclError:
+            return  # Window closed
+
+        if self._pending_probes > 0:
+            self.after(100, self._poll_probe_results)
+
     def on_close(self):
         """Handle window close"""
         # Save startup preferences